@@ -1,8 +1,18 @@
 from pathlib import Path
-from pymodaq.utils.logger import set_logger  # to be imported by other modules.
-
-from .utils import Config
-config = Config()
 
 with open(str(Path(__file__).parent.joinpath('resources/VERSION')), 'r') as fvers:
     __version__ = fvers.read().strip()
+
+
+def __getattr__(name):
+    # pymodaq (and Qt) are imported at the first use of config or set_logger, so that the drivers of the hardware
+    # subpackage can be used from scripts without them
+    global config
+    if name == 'config':
+        from .utils import Config
+        config = Config()
+        return config
+    elif name == 'set_logger':
+        from pymodaq.utils.logger import set_logger  # to be imported by other modules.
+        return set_logger
+    raise AttributeError(f'module {__name__} has no attribute {name}')
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Warm start of the controllers from their state persisted in the plugin configuration.
+
+The state of a controller (static metadata such as velocity limits, last known positions, Agilis step counters) is
+stored in the [cache] table of the plugin configuration, under a key made of the controller kind and of its
+identity: the reply of a cheap fingerprint query (ID, firmware version...). At startup, the plugins query the
+fingerprint only and reuse the cached values instead of querying them again::
+
+    cache = ControllerCache('ESP100', controller.get_controller_infos())
+    velocity_max = cache.get_or_query(axis_key('velocity_max', axis), lambda: controller.get_velocity_max(axis))
+    ...
+    cache.update(**{axis_key('position', axis): position})
+    cache.save()
+
+Values that may change while the plugin is not running (positions, counters) are only to be reused after a
+validation against the controller (see the Agilis plugin).
+"""
+from pymodaq_plugins_newport import config
+
+CACHE_TABLE = 'cache'
+
+
+def axis_key(name: str, *indexes) -> str:
+    """ Name of a per axis (or channel/axis) value: axis_key('position', 2, 1) -> 'position_2_1'"""
+    return '_'.join([name] + [str(index) for index in indexes])
+
+
+class ControllerCache:
+    """ Persisted state of one controller
+
+    Parameters
+    ----------
+    kind: str
+        controller type, for instance 'ESP100'
+    identity: str
+        reply of the fingerprint query of the controller
+
+    Attributes
+    ----------
+    found: bool
+        True if an entry of this controller was loaded from the configuration
+    """
+
+    def __init__(self, kind: str, identity: str):
+        self.key = f'{kind} {identity}'.strip()
+        try:
+            entry = config[CACHE_TABLE, self.key]
+        except KeyError:
+            entry = None
+        self.found = bool(entry)
+        self._entry = dict(entry) if entry else {}
+        self._modified = set()
+        self._cleared = False
+
+    def __repr__(self):
+        return f'ControllerCache({self.key}, {len(self._entry)} values)'
+
+    def __contains__(self, name):
+        return name in self._entry
+
+    def get(self, name: str, default=None):
+        return self._entry.get(name, default)
+
+    def get_or_query(self, name: str, query):
+        """ Cached value, or the result of query() which is then cached"""
+        if name not in self._entry:
+            self.update(**{name: query()})
+        return self._entry[name]
+
+    def update(self, **values):
+        """ Update values, persisted at the next save"""
+        self._entry.update(values)
+        self._modified.update(values.keys())
+
+    def clear(self):
+        """ Forget all the values of the controller, for instance after a reset"""
+        self._entry = {}
+        self._modified = set()
+        self._cleared = True
+
+    def save(self):
+        """ Write the modified values in the user configuration file
+
+        The values modified by other instances of the same controller (Master and Slave plugins) since this one was
+        loaded are kept.
+        """
+        try:
+            entry = {} if self._cleared else dict(config[CACHE_TABLE, self.key])
+        except KeyError:
+            entry = {}
+        entry.update({name: self._entry[name] for name in self._modified})
+        config[CACHE_TABLE, self.key] = entry
+        config.save()
+        self._entry = dict(entry)
+        self._modified = set()
+        self._cleared = False
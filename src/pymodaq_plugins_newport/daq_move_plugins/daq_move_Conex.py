@@ -3,27 +3,28 @@ from pymodaq.control_modules.move_utility_classes import comon_parameters_fun, m
 
 from pymodaq.utils.daq_utils import ThreadCommand, getLineInfo
 from easydict import EasyDict as edict
-import sys
-import clr
-from serial.tools import list_ports
 
+from pymodaq_plugins_newport.hardware.conex_agap import ConexAGAP, AXIS_NAMES
+from pymodaq_plugins_newport.hardware.transports import transport_params
+import pyvisa
 
-conex_path = 'C:\\Program Files\\Newport\\Piezo Motion Control\\Newport CONEX-AGAP Applet\\Samples'
-sys.path.append(conex_path)
-clr.AddReference("ConexAGAPCmdLib")
-import Newport.ConexAGAPCmdLib as Conexcmd
-
-COMPORTS = [str(port)[0:4] for port in list(list_ports.comports())]
+VISA_rm = pyvisa.ResourceManager()
+infos = VISA_rm.list_resources_info()
+COMPORTS = [infos[key].alias if infos[key].alias is not None else key for key in infos.keys()]
+VISA_rm.close()
 
 
 class DAQ_Move_Conex(DAQ_Move_base):
     """
         Wrapper object to access the conex fonctionnalities, similar wrapper for all controllers.
 
+        The ASCII protocol of the CONEX-AGAP controllers is implemented in python (hardware.conex_agap), no vendor
+        library is needed. The positions of the U and V axes are read in a single transaction, so that the Master and
+        Slave plugins of a controller can share their reads (see the Position max age parameter).
+
         =============== ==================
         **Attributes**   **Type**
         *ports*          list
-        *conex_path*     string
         *params*         dictionnary list
         =============== ==================
 
@@ -37,19 +38,21 @@ class DAQ_Move_Conex(DAQ_Move_base):
     # find available COM ports
 
     is_multiaxes = True
-    axes_names = ['U', 'V']
+    axes_names = AXIS_NAMES
     _epsilon = 0.0001
 
-    params = [{'title': 'controller library:', 'name': 'conex_lib', 'type': 'browsepath', 'value': conex_path},
-              {'title': 'Controller Name:', 'name': 'controller_name', 'type': 'str', 'value': '', 'readonly': True},
+    params = [{'title': 'Controller Name:', 'name': 'controller_name', 'type': 'str', 'value': '', 'readonly': True},
               {'title': 'Motor ID:', 'name': 'motor_id', 'type': 'str', 'value': '', 'readonly': True},
               {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': COMPORTS},
+              ] + transport_params() + [
               {'title': 'Controller address:', 'name': 'controller_address', 'type': 'int', 'value': 1, 'default': 1,
                'min': 1},
+              {'title': 'Position max age (ms):', 'name': 'max_age', 'type': 'int', 'value': 20, 'min': 0,
+               'tip': 'U and V are read together, a position read for the other axis more recently is reused'},
               ] + comon_parameters_fun(is_multiaxes, axes_names, epsilon=_epsilon)
 
     def ini_attributes(self):
-        self.controller: Conexcmd.ConexAGAPCmds = None
+        self.controller: ConexAGAP = None
         self.settings.child('bounds', 'is_bounds').setValue(True)
         self.settings.child('bounds', 'min_bound').setValue(-0.02)
         self.settings.child('bounds', 'max_bound').setValue(0.02)
@@ -68,26 +71,24 @@ class DAQ_Move_Conex(DAQ_Move_base):
         """
 
         """
-        self.controller = self.ini_stage_init(controller, Conexcmd.ConexAGAPCmds())
+        self.controller = self.ini_stage_init(controller, ConexAGAP(self.settings['transport']))
 
         if self.settings['multiaxes', 'multi_status'] == "Master":
-            out = self.controller.OpenInstrument(self.settings['com_port'][0:4])
-        else:
-            out = 0
+            self.controller.init_communication(self.settings['address'] or self.settings['com_port'])
 
-        controller_name = self.controller.VE(self.settings['controller_address'], "", "")[1]
-        motor_id = self.controller.ID_Get(self.settings['controller_address'], "", "")[1]
+        controller_name = self.controller.get_controller_infos(self.settings['controller_address'])
+        motor_id = self.controller.get_motor_id(self.settings['controller_address'])
         self.settings.child('controller_name').setValue(controller_name)
         self.settings.child('motor_id').setValue(motor_id)
         info = controller_name + " / " + motor_id
-        initialized = out == 0
+        initialized = True
         return info, initialized
 
     def close(self):
         """
             close the current instance of instrument.
         """
-        self.controller.CloseInstrument()
+        self.controller.close_communication()
 
     def stop_motion(self):
         """
@@ -95,7 +96,7 @@ class DAQ_Move_Conex(DAQ_Move_base):
             --------
             daq_move_base.move_done
         """
-        self.controller.ST(self.settings.child(('controller_address')).value(),"")
+        self.controller.stop_motion(self.settings['controller_address'])
         self.move_done()
 
     def get_actuator_value(self):
@@ -106,8 +107,8 @@ class DAQ_Move_Conex(DAQ_Move_base):
             --------
             daq_move_base.get_position_with_scaling, daq_utils.ThreadCommand
         """
-        pos = self.controller.TP(self.settings['controller_address'],
-                                 self.settings['multiaxes', 'axis'], 0.0000, "")[1]
+        pos = self.controller.get_position(self.settings['multiaxes', 'axis'], self.settings['controller_address'],
+                                           self.settings['max_age'] / 1000)
         pos = self.get_position_with_scaling(pos)
         self.current_position = pos
         return pos
@@ -131,8 +132,8 @@ class DAQ_Move_Conex(DAQ_Move_base):
         self.target_position = position
 
         position = self.set_position_with_scaling(position)
-        out = self.controller.PA_Set(self.settings['controller_address'],
-                                     self.settings['multiaxes', 'axis'], position, "")
+        self.controller.move_axis('ABS', self.settings['controller_address'], position,
+                                  self.settings['multiaxes', 'axis'])
 
     def move_rel(self, position):
         """
@@ -155,9 +156,8 @@ class DAQ_Move_Conex(DAQ_Move_base):
         self.target_position = position + self.current_position
 
         position = self.set_position_relative_with_scaling(position)
-
-        out = self.controller.PR_Set(self.settings['controller_address'],
-                                     self.settings['multiaxes', 'axis'], position, "")
+        self.controller.move_axis('REL', self.settings['controller_address'], position,
+                                  self.settings['multiaxes', 'axis'])
 
     def move_home(self):
         """
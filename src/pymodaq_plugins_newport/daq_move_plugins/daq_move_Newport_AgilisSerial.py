@@ -1,9 +1,13 @@
+import time
+
 from pymodaq.control_modules.move_utility_classes import DAQ_Move_base, comon_parameters, main
 from pymodaq.utils.daq_utils import ThreadCommand, getLineInfo
 from pymodaq.utils.logger import set_logger, get_module_name
 from easydict import EasyDict as edict
 
-from pymodaq_plugins_newport.hardware.agilis_serial import AgilisSerial, COMPORTS
+from pymodaq_plugins_newport.hardware.agilis_serial import AgilisSerial, AgilisChannelError, COMPORTS
+from pymodaq_plugins_newport.hardware.transports import transport_params
+from pymodaq_plugins_newport.controller_cache import ControllerCache, axis_key
 logger = set_logger(get_module_name(__file__))
 
 
@@ -19,10 +23,40 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
 
     params = [
                  {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': COMPORTS, 'value': port},
+             ] + transport_params() + [
                  {'title': 'Firmware:', 'name': 'firmware', 'type': 'str', 'value': ''},
                  {'title': 'Channel:', 'name': 'channel', 'type': 'list', 'limits': channel_names},
                  {'title': 'Axis:', 'name': 'axis', 'type': 'list', 'limits': axis_names},
                  {'title': 'Sleep time (s):', 'name': 'sleep_time', 'type': 'float', 'value': 0.25},
+                 {'title': 'Warm start:', 'name': 'warm_start', 'type': 'bool', 'value': True,
+                  'tip': 'Do not reset a controller whose step counters match the cached ones, and restore the last'
+                         ' position'},
+                 {'title': 'Absolute referencing:', 'name': 'absolute', 'type': 'group', 'expanded': False,
+                  'children': [
+                     {'title': 'Enable:', 'name': 'enabled', 'type': 'bool', 'value': False,
+                      'tip': 'The position is the last MA measurement plus the steps counted since, for stages with'
+                             ' limit switches (AG-LS25)'},
+                     {'title': 'Steps per MA unit:', 'name': 'steps_per_unit', 'type': 'float', 'value': 1.,
+                      'tip': 'MA measures the position within the travel from 0 to 1000'},
+                     {'title': 'Measure:', 'name': 'measure', 'type': 'bool_push', 'value': False,
+                      'label': 'Measure'},
+                     {'title': 'Last measurement:', 'name': 'last_measurement', 'type': 'str', 'value': '',
+                      'readonly': True},
+                 ]},
+                 {'title': 'Coarse/fine moves:', 'name': 'coarse_fine', 'type': 'group', 'expanded': False,
+                  'children': [
+                     {'title': 'Enable:', 'name': 'enabled', 'type': 'bool', 'value': False,
+                      'tip': 'Bulk of the moves at the coarse step amplitude, final approach at the fine one. The'
+                             ' positions are in fine steps'},
+                     {'title': 'Coarse amplitude:', 'name': 'coarse_amplitude', 'type': 'int', 'value': 50, 'min': 1,
+                      'max': 50},
+                     {'title': 'Fine amplitude:', 'name': 'fine_amplitude', 'type': 'int', 'value': 10, 'min': 1,
+                      'max': 50},
+                     {'title': 'Coarse/fine step ratio:', 'name': 'step_ratio', 'type': 'float', 'value': 1.,
+                      'min': 1., 'tip': 'Displacement of a coarse step in fine steps, calibrated for this axis with'
+                                        ' AgilisSerial.calibrate_step_size'},
+                     {'title': 'Fine approach (steps):', 'name': 'fine_steps', 'type': 'int', 'value': 100, 'min': 0},
+                 ]},
                  {'title': 'MultiAxes:', 'name': 'multiaxes', 'type': 'group', 'visible': is_multiaxes, 'children': [
                      {'title': 'is Multiaxes:', 'name': 'ismultiaxes','type': 'bool', 'value': is_multiaxes},
                      {'title': 'Status:', 'name': 'multi_status', 'type': 'list', 'limits': ['Master', 'Slave']},
@@ -36,6 +70,8 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
 
         super().__init__(parent, params_state)
         self.controller = None
+        self.cache: ControllerCache = None
+        self.measurement = None
 
         self.current_position = 0
         self.target_position = 0
@@ -67,13 +103,17 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
                 else:
                     self.controller = controller
             else:  # Master stage
-                self.controller = AgilisSerial()
-                info = self.controller.init_com_remote(self.settings.child('com_port').value())
-                if self.controller.get_channel() != self.settings.child('channel').value():
-                    self.controller.select_channel(self.settings.child('channel').value())
+                self.controller = AgilisSerial(self.settings['transport'])
+                info = self.ini_controller()
                 self.settings.child('firmware').setValue(info)
                 self.status.info = info
 
+            if self.cache is None:  # Slave stage
+                self.cache = ControllerCache('Agilis', f'{self.com_port} {self.controller.get_infos()}')
+            self.restore_position()
+            step_ratio = self.cache.get(axis_key('step_ratio', self.settings['channel'], self.settings['axis']))
+            if step_ratio is not None:
+                self.settings.child('coarse_fine', 'step_ratio').setValue(step_ratio)
             self.status.controller = self.controller
             self.status.initialized = True
 
@@ -86,6 +126,60 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
             self.status.initialized = False
             return self.status
 
+    def ini_controller(self):
+        """ Open the controller, the reset is skipped if the step counters of the channel match the cached ones
+        (the controller is still powered and the axes did not move since the last session)
+
+        Returns
+        -------
+        str: the firmware info
+        """
+        com_port = self.com_port
+        channel = self.settings['channel']
+        if self.settings['warm_start']:
+            self.controller.open(com_port)
+            self.cache = ControllerCache('Agilis', f'{com_port} {self.controller.get_infos()}')
+            if self.cache.found and self.controller.get_channel() == channel:
+                counters = self.controller.get_step_counters()
+                if all(self.cache.get(axis_key('steps', channel, axis)) == steps
+                       for axis, steps in zip(self.controller.axis_indexes, counters)):
+                    self.controller.set_local_remote('remote')
+                    logger.info(f'Warm start of the Agilis controller on {com_port}')
+                    return self.controller.get_infos()
+            self.controller.close()
+        info = self.controller.init_com_remote(com_port)
+        self.cache = ControllerCache('Agilis', f'{com_port} {info}')
+        self.cache.clear()  # the reset cleared the step counters
+        self.cache.save()
+        if self.controller.get_channel() != channel:
+            self.controller.select_channel(channel)
+        return info
+
+    @property
+    def com_port(self):
+        """ Address of the controller with the selected transport"""
+        return self.settings['address'] or self.settings['com_port']
+
+    def restore_position(self):
+        """ Restore the last position of the axis if its step counter did not change since it was cached"""
+        channel = self.settings['channel']
+        axis = self.settings['axis']
+        cached_position = self.cache.get(axis_key('position', channel, axis))
+        if cached_position is not None and \
+                self.cache.get(axis_key('steps', channel, axis)) == self.controller.get_step_counter(
+                    axis, channel=channel):
+            self.current_position = cached_position
+            self.target_position = cached_position
+
+    def save_cache(self):
+        """ Persist the step counter and the position of the axis"""
+        channel = self.settings['channel']
+        axis = self.settings['axis']
+        steps = self.controller.get_step_counter(axis, channel=channel)
+        self.cache.update(**{axis_key('steps', channel, axis): steps,
+                             axis_key('position', channel, axis): self.current_position})
+        self.cache.save()
+
     def get_actuator_value(self):
         """
         Get the current position from the hardware with scaling conversion.
@@ -96,8 +190,42 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
         """
 
         #return self.controller.get_step_counter(self.settings.child('axis').value(), read_controller=False)
+        if self.settings['absolute', 'enabled']:
+            self.check_measurement()
+            position = self.controller.get_fused_position(self.settings['axis'],
+                                                          self.settings['absolute', 'steps_per_unit'],
+                                                          self.settings['channel'])
+            if position is not None:
+                return position
         return self.target_position
 
+    def start_measurement(self):
+        """ Start the MA measurement of the axis in the background, see check_measurement"""
+        if self.measurement is not None and not self.measurement.done():
+            return
+        self.measurement = self.controller.start_absolute_measurement(self.settings['axis'],
+                                                                      self.settings['channel'])
+        self.settings.child('absolute', 'last_measurement').setValue('measuring...')
+        self.emit_status(ThreadCommand('Update_Status', ['Absolute position measurement started']))
+
+    def check_measurement(self):
+        """ Handle the end of the background measurement, the position is then referenced on it"""
+        if self.measurement is None or not self.measurement.done():
+            return
+        measurement_future = self.measurement
+        self.measurement = None
+        try:
+            measurement = measurement_future.result()
+        except Exception as e:
+            self.settings.child('absolute', 'last_measurement').setValue('failed')
+            self.emit_status(ThreadCommand('Update_Status', [f'Absolute position measurement failed: {e}', 'log']))
+            return
+        self.settings.child('absolute', 'last_measurement').setValue(
+            f'{measurement.value} at {time.strftime("%H:%M:%S", time.localtime(measurement.timestamp))}')
+        self.target_position = self.controller.get_fused_position(self.settings['axis'],
+                                                                  self.settings['absolute', 'steps_per_unit'],
+                                                                  self.settings['channel'])
+
     def move_abs(self, position):
         """
         Move the actuator to the absolute target defined by position.
@@ -124,13 +252,24 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
         relative_move = self.set_position_relative_with_scaling(relative_move)
         self.target_position = relative_move + self.current_position
 
-        self.controller.move_rel(self.settings.child('axis').value(), int(relative_move))
+        if self.settings['coarse_fine', 'enabled']:
+            self.controller.move_coarse_fine(self.settings['axis'], int(relative_move),
+                                             self.settings['coarse_fine', 'coarse_amplitude'],
+                                             self.settings['coarse_fine', 'fine_amplitude'],
+                                             self.settings['coarse_fine', 'step_ratio'],
+                                             self.settings['coarse_fine', 'fine_steps'], self.settings['channel'])
+        else:
+            self.controller.move_rel(self.settings.child('axis').value(), int(relative_move),
+                                     self.settings['channel'])
 
     def move_home(self):
         """
-
+        Set the step counter to zero, or measure the absolute position again in absolute referencing mode
         """
-        self.controller.counter_to_zero(self.settings.child('axis').value())
+        if self.settings['absolute', 'enabled']:
+            self.start_measurement()
+            return
+        self.controller.counter_to_zero(self.settings.child('axis').value(), self.settings['channel'])
         self.current_position = 0.
         self.target_position = 0.
 
@@ -140,20 +279,32 @@ class DAQ_Move_Newport_AgilisSerial(DAQ_Move_base):
         Not implemented.
         """
 
-        self.controller.stop(self.settings.child('axis').value())
+        self.controller.stop(self.settings.child('axis').value(), self.settings['channel'])
 
     def commit_settings(self, param):
         """
         Called after a param_tree_changed signal from DAQ_Move_main.
         """
-        if param.name() == 'channel':
-            self.controller.select_channel(param.value())
-            param.setValue(int(self.controller.get_channel()))
+        if param.name() == 'measure':
+            if param.value():
+                self.start_measurement()
+                param.setValue(False)
+        elif param.name() == 'step_ratio':
+            self.cache.update(**{axis_key('step_ratio', self.settings['channel'], self.settings['axis']):
+                                 param.value()})
+        elif param.name() == 'channel':
+            # the channel is selected by the controller when this axis is addressed, after the end of the moves of
+            # the other channel (Master and Slave axes sharing the controller)
+            if param.value() not in self.controller.channel_indexes:
+                raise AgilisChannelError(f'The specified channel ({param.value()}) is not available in '
+                                         f'{self.controller.channel_indexes}')
 
     def close(self):
         """
         Terminate the communication protocol.
         """
+        if self.cache is not None:
+            self.save_cache()
         self.controller.close()
 
 
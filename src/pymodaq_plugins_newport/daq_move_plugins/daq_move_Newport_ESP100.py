@@ -2,6 +2,10 @@
 from pymodaq.control_modules.move_utility_classes import DAQ_Move_base, main, comon_parameters_fun
 from pymodaq.utils.daq_utils import ThreadCommand, getLineInfo
 from pymodaq_plugins_newport.hardware.esp100 import ESP100
+from pymodaq_plugins_newport.hardware.transports import transport_params
+from pymodaq_plugins_newport.hardware.driver_worker import DriverWorker
+from pymodaq_plugins_newport.hardware.controller_proxy import ControllerProxyClient, parse_address
+from pymodaq_plugins_newport.controller_cache import ControllerCache, axis_key
 from easydict import EasyDict as edict
 import pyvisa
 
@@ -33,26 +37,48 @@ class DAQ_Move_Newport_ESP100(DAQ_Move_base):
               {'title': 'Controller Info:', 'name': 'controller_id', 'type': 'text', 'value': '', 'readonly': True},
               {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': ports, 'value': port},
               {'title': 'Velocity:', 'name': 'velocity', 'type': 'float', 'value': 1.0},
+              {'title': 'Worker process:', 'name': 'worker', 'type': 'bool', 'value': False,
+               'tip': 'Run the driver in a separate process, the positions being polled there and read from shared'
+                      ' memory'},
+              {'title': 'Worker polling (ms):', 'name': 'worker_period', 'type': 'int', 'value': 50, 'min': 1},
+              {'title': 'Proxy:', 'name': 'proxy', 'type': 'str', 'value': '',
+               'tip': 'host:port or Unix socket of a controller proxy owning the controller (named by its address)'},
 
-              ] + comon_parameters_fun(is_multiaxes, axes_names, epsilon=_epsilon)
+              ] + transport_params() + comon_parameters_fun(is_multiaxes, axes_names, epsilon=_epsilon)
 
 
     def ini_attributes(self):
         self.settings.child('epsilon').setValue(0.01)
         self.controller: ESP100 = None
+        self.cache: ControllerCache = None
 
     def ini_stage(self, controller=None):
             
-        self.ini_stage_init(old_controller=controller,
-                            new_controller=ESP100())
-        
-        if self.settings.child('multiaxes','multi_status').value() == "Master":
-            self.controller.init_communication(self.settings.child('com_port').value(), self._axis)
+        address = self.settings['address'] or self.settings['com_port']
+        if self.settings['proxy'] != '':
+            new_controller = ControllerProxyClient(address, parse_address(self.settings['proxy']))
+        elif self.settings['worker'] and self.settings['multiaxes', 'multi_status'] == "Master":
+            # the communication is opened in the worker, which polls the position
+            new_controller = DriverWorker(ESP100, (self.settings['transport'],),
+                                          setup=[('init_communication', (address, self._axis))],
+                                          poll=('get_positions', ((self._axis,),)), n_values=1,
+                                          period=self.settings['worker_period'] / 1000)
+        else:
+            new_controller = ESP100(self.settings['transport'])
+        self.ini_stage_init(old_controller=controller, new_controller=new_controller)
+
+        if self.settings.child('multiaxes','multi_status').value() == "Master" and not self.settings['worker'] \
+                and self.settings['proxy'] == '':
+            self.controller.init_communication(address, self._axis)
             
         controller_id = self.controller.get_controller_infos()
         self.settings.child('controller_id').setValue(controller_id)
+        # the controller ID is the fingerprint of the cached static metadata
+        self.cache = ControllerCache('ESP100', controller_id)
+        velocity_max = self.cache.get_or_query(axis_key('velocity_max', self._axis),
+                                               lambda: self.controller.get_velocity_max(self._axis))
         self.settings.child('velocity').setValue(self.controller.get_velocity(self._axis))
-        self.settings.child('velocity').setOpts(max=self.controller.get_velocity_max(self._axis))
+        self.settings.child('velocity').setOpts(max=velocity_max)
 
         info = f'Initialized with controller ID: {controller_id}'
         initialized = True
@@ -69,7 +95,16 @@ class DAQ_Move_Newport_ESP100(DAQ_Move_base):
         """
             close the current instance of Piezo instrument.
         """
+        if self.cache is not None:
+            self.cache.update(**{axis_key('position', self._axis): self.current_position})
+            self.cache.save()
+        if isinstance(self.controller, ControllerProxyClient):
+            self.controller.close()  # the link is owned by the proxy
+            self.controller = None
+            return
         self.controller.close_communication(self._axis)
+        if isinstance(self.controller, DriverWorker):
+            self.controller.close()
         self.controller = None
 
 
@@ -86,7 +121,10 @@ class DAQ_Move_Newport_ESP100(DAQ_Move_base):
             --------
             DAQ_Move_base.get_position_with_scaling, daq_utils.ThreadCommand
         """
-        position = self.controller.get_position(self._axis)
+        if isinstance(self.controller, DriverWorker):
+            position = self.controller.fresh_values()[0]
+        else:
+            position = self.controller.get_position(self._axis)
         pos = self.get_position_with_scaling(position)
         self.current_position = pos
         self.emit_status(ThreadCommand('check_position', [pos]))
@@ -9,6 +9,9 @@ from pymodaq.control_modules.move_utility_classes import comon_parameters_fun  #
 
 
 from pymodaq_plugins_newport.hardware.smc100 import SMC100
+from pymodaq_plugins_newport.hardware.transports import transport_params
+from pymodaq_plugins_newport.hardware.driver_worker import DriverWorker
+from pymodaq_plugins_newport.hardware.controller_proxy import ControllerProxyClient, parse_address
 import pyvisa
 
 VISA_rm = pyvisa.ResourceManager()
@@ -35,7 +38,13 @@ class DAQ_Move_Newport_SMC100(DAQ_Move_base):
     axes_names = ['1']  # The axis list represents the number of smc controllers, indexed: first=1, second=2 etc.
     _epsilon = 0.0001
     params = [{'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': com_ports, 'value': 'COM17'},
-                ] + comon_parameters_fun(is_multiaxes, axes_names, epsilon=_epsilon)
+              {'title': 'Worker process:', 'name': 'worker', 'type': 'bool', 'value': False,
+               'tip': 'Run the driver in a separate process, the positions being polled there and read from shared'
+                      ' memory'},
+              {'title': 'Worker polling (ms):', 'name': 'worker_period', 'type': 'int', 'value': 50, 'min': 1},
+              {'title': 'Proxy:', 'name': 'proxy', 'type': 'str', 'value': '',
+               'tip': 'host:port or Unix socket of a controller proxy owning the controller (named by its address)'},
+                ] + transport_params() + comon_parameters_fun(is_multiaxes, axes_names, epsilon=_epsilon)
 
     def ini_attributes(self):
         self.controller: SMC100 = None
@@ -49,15 +58,22 @@ class DAQ_Move_Newport_SMC100(DAQ_Move_base):
         """
 
         axis = int(self.settings.child('multiaxes', 'axis').value())
-        pos = self.controller.get_position(axis)  # when writing your own plugin replace this line
-        print(f'pos is {pos}')
+        if isinstance(self.controller, DriverWorker):
+            pos = self.controller.fresh_values()[self.axes_names.index(str(axis))]
+        else:
+            pos = self.controller.get_position(axis)  # when writing your own plugin replace this line
         pos = self.get_position_with_scaling(pos)
         return pos
 
     def close(self):
         """Terminate the communication protocol"""
         axis = int(self.settings.child('multiaxes', 'axis').value())
+        if isinstance(self.controller, ControllerProxyClient):
+            self.controller.close()  # the link is owned by the proxy
+            return
         self.controller.close_communication(axis)  # when writing your own plugin replace this line
+        if isinstance(self.controller, DriverWorker):
+            self.controller.close()
 
     def commit_settings(self, param):
         """Apply the consequences of a change of value in the detector settings
@@ -84,11 +100,22 @@ class DAQ_Move_Newport_SMC100(DAQ_Move_base):
             False if initialization failed otherwise True
         """
 
-        self.ini_stage_init(old_controller=controller,
-                            new_controller=SMC100())
-        if self.settings['multiaxes', 'multi_status'] == "Master":
-            self.controller.init_communication(
-                self.settings['com_port'])
+        address = self.settings['address'] or self.settings['com_port']
+        if self.settings['proxy'] != '':
+            new_controller = ControllerProxyClient(address, parse_address(self.settings['proxy']))
+        elif self.settings['worker'] and self.settings['multiaxes', 'multi_status'] == "Master":
+            # the communication is opened in the worker, which polls the positions of all the axes
+            new_controller = DriverWorker(SMC100, (self.settings['transport'],),
+                                          setup=[('init_communication', (address,))],
+                                          poll=('get_positions', ([int(axis) for axis in self.axes_names],)),
+                                          n_values=len(self.axes_names),
+                                          period=self.settings['worker_period'] / 1000)
+        else:
+            new_controller = SMC100(self.settings['transport'])
+        self.ini_stage_init(old_controller=controller, new_controller=new_controller)
+        if self.settings['multiaxes', 'multi_status'] == "Master" and not self.settings['worker'] \
+                and self.settings['proxy'] == '':
+            self.controller.init_communication(address)
         axis = int(self.settings.child('multiaxes', 'axis').value())
         info = self.controller.get_controller_infos(axis)
         initialized = True
@@ -1,151 +1,98 @@
 from pymodaq.control_modules.move_utility_classes import DAQ_Move_base, comon_parameters_fun, main, DataActuatorType,\
-    DataActuator  # common set of parameters for all actuators
-from pymodaq.utils.daq_utils import ThreadCommand # object used to send info back to the main thread
+    DataActuator
+from pymodaq.utils.daq_utils import ThreadCommand
 from pymodaq.utils.parameter import Parameter
-from qtpy.QtCore import QThread
-from pymodaq_plugins_newport.hardware import XPS_Q8_drivers 
-import sys
-
-from time import perf_counter_ns
-
-class XPSPythonWrapper():
-    
-    def __init__(self):
-        self.myxps = XPS_Q8_drivers.XPS()
-        self.group = 'Group2' 
-        self.positioner = self.group + '.Pos'
-        self.socketId = None
-        self._initCommands()
-            
-    def _initCommands(self):
-        self.socketId = self.myxps.TCP_ConnectToServer('192.168.0.254', 5001, 20)
-        # Check connection passed
-        if (self.socketId == -1):
-            print('Connection to XPS failed, check IP & Port')
-            #sys.exit()
-        #Group kill to be sure
-        [errorCode, returnString] = self.myxps.GroupKill(self.socketId, self.group)
-        if (errorCode != 0):
-            self.displayErrorAndClose(errorCode, 'GroupKill')
-            #sys.exit ()
-        #Initialize
-        [errorCode, returnString] = self.myxps.GroupInitialize(self.socketId, self.group) 
-        if (errorCode != 0):
-            self.displayErrorAndClose(errorCode, 'GroupInitialize')
-            #sys.exit()
-        #Définition du trigger sur MotionDone
-        # [errorCode, returnString] = self.myxps.EventExtendedConfigurationTriggerSet(self.socketId, 'MotionDone',0,0,0,0)
-        # if (errorCode != 0):
-        #     self.displayErrorAndClose(errorCode, 'EventExtendedConfigurationTriggerSet')
-        #     sys.exit()
-        # [errorCode, returnString] = self.myxps.EventExtendedConfigurationActionSet(self.socketId, , 0, 0, 0, 0)
-        # if (errorCode != 0):
-        #     self.displayErrorAndClose(errorCode, 'EventExtendedConfigurationActionSet')
-        #     sys.exit()
-        # Home search
-        self.moveHome()
-            
-    def checkConnected(self):
-        return (self.socketId != -1) and (self.socketId is not None)
-    
-    def displayErrorAndClose(self, errorCode, APIName):
-        if (errorCode != -2) and (errorCode != -108):
-            [errorCode2, errorString] = self.myxps.ErrorStringGet(self.socketId, errorCode)
-            if (errorCode2 != 0):
-                print(APIName + ': ERROR ' + str(errorCode))
-            else:
-                print(APIName + ': ' + errorString)
-        else:
-            if (errorCode == -2):
-                print(APIName + ': TCP timeout')
-            if (errorCode == -108):
-                print(APIName + ': The TCP/IP connection was closed by an administrator')
-        self.closeTCPIP()
-
-    def closeTCPIP(self):
-        self.myxps.TCP_CloseSocket(self.socketId)
-        
-    def getPosition(self):
-        [errorCode, currentPosition] = self.myxps.GroupPositionCurrentGet(self.socketId, self.positioner, 1)
-        if (errorCode != 0):
-            self.displayErrorAndClose(errorCode, 'GroupPositionCurrentGet')
-            sys.exit()  
-        else:
-            return(float(currentPosition))
-            #print('Positioner ' + self.positioner + ' is in position ' + str(currentPosition))
-    
-    def moveAbsolute(self, value):
-        [errorCode, returnString] = self.myxps.GroupMoveAbsolute(self.socketId, self.positioner, [value])
-        if (errorCode != 0):
-            self.displayErrorAndClose(errorCode, 'GroupMoveAbsolute')
-            sys.exit()
-        #test : attente de finir le mouvement
-        # [errorCode, returnString] = self.myxps.GroupMotionStatusGet(self.socketId, self.positioner, 1)
-        # print(returnString)
-        # if (errorCode != 0):
-        #     self.displayErrorAndClose(errorCode, 'GroupMotionStatusGet')
-        #     sys.exit()
-        # t1 = perf_counter_ns()
-        # while returnString == '1':
-        #     [errorCode, returnString] = self.myxps.GroupMotionStatusGet(self.socketId, self.positioner, 1)
-        #     print('looping')
-        #     if (errorCode != 0):
-        #         self.displayErrorAndClose(errorCode, 'GroupMotionStatusGet')
-        #         sys.exit()
-        # t2 = perf_counter_ns()
+from pymodaq_plugins_newport.hardware.xps_wrapper import XPSPythonWrapper, READY_STATUS
+from pymodaq_plugins_newport.hardware.xps_sgamma_tuning import PARAMETER_NAMES
+from pymodaq_plugins_newport.controller_cache import ControllerCache, axis_key
+from pymodaq_plugins_newport import config
+
 
-        
-    def moveHome(self):
-        [errorCode, returnString] = self.myxps.GroupHomeSearch(self.socketId, self.group)
-        if (errorCode != 0):
-            self.displayErrorAndClose(errorCode, 'GroupHomeSearch')
-            sys.exit() 
-            
-# TODO:
-# (1) change the name of the following class to DAQ_Move_TheNameOfYourChoice
-# (2) change the name of this file to daq_move_TheNameOfYourChoice ("TheNameOfYourChoice" should be the SAME
-#     for the class name and the file name.)
-# (3) this file should then be put into the right folder, namely IN THE FOLDER OF THE PLUGIN YOU ARE DEVELOPING:
-#     pymodaq_plugins_my_plugin/daq_move_plugins
 class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
-    """ Instrument plugin class for an actuator.
-    
-    This object inherits all functionalities to communicate with PyMoDAQ’s DAQ_Move module through inheritance via
-    DAQ_Move_base. It makes a bridge between the DAQ_Move module and the Python wrapper of a particular instrument.
-
-    TODO Complete the docstring of your plugin with:
-        * The set of controllers and actuators that should be compatible with this instrument plugin.
-        * With which instrument and controller it has been tested.
-        * The version of PyMoDAQ during the test.
-        * The version of the operating system.
-        * Installation instructions: what manufacturer’s drivers should be installed to make it run?
+    """ Positioner of a group of a Newport XPS-Q8 motion controller, driven over TCP/IP
+
+    In Position control mode the actuator value is the position of the positioner, in Velocity mode its jog
+    velocity. The positioner can also follow an analog input of the controller (analog tracking), run step scans
+    executed by a TCL script on the controller and tune its SGamma profile parameters.
 
     Attributes:
     -----------
-    controller: object
-        The particular object that allow the communication with the hardware, in general a python wrapper around the
-         hardware library.
-         
-    # TODO add your particular attributes here if any
-
+    controller: XPSPythonWrapper
+        the group and positioner of the controller
+    cache: ControllerCache
+        last known position of the positioner, for the warm starts
+    scan_data: np.ndarray
+        data gathered by the last controller scan
+    tracking_data: np.ndarray
+        positions and analog input values gathered by the last read in analog tracking mode
     """
-    _controller_units = 'mm'  # TODO for your plugin: put the correct unit here
-    is_multiaxes = False  # TODO for your plugin set to True if this plugin is controlled for a multiaxis controller
-    _axis_names = ['Axis1']  # TODO for your plugin: complete the list
-    _epsilon = 600e-6  # TODO replace this by a value that is correct depending on your controller
-    data_actuator_type = DataActuatorType['DataActuator']  # wether you use the new data style for actuator otherwise set this
-    # as  DataActuatorType['float']  (or entirely remove the line)
-
-    params = [   # TODO for your custom plugin: elements to be added here as dicts in order to control your custom stage
-                ] + comon_parameters_fun(is_multiaxes, axis_names=_axis_names, epsilon=_epsilon)
-    # _epsilon is the initial default value for the epsilon parameter allowing pymodaq to know if the controller reached
-    # the target value. It is the developer responsibility to put here a meaningful value
+    _controller_units = 'mm'
+    is_multiaxes = False
+    _axis_names = ['Axis1']
+    _epsilon = 600e-6
+    data_actuator_type = DataActuatorType['DataActuator']
+
+    params = [{'title': 'IP address:', 'name': 'ip_address', 'type': 'str', 'value': '192.168.0.254'},
+              {'title': 'Port:', 'name': 'port', 'type': 'int', 'value': 5001},
+              {'title': 'Group:', 'name': 'group', 'type': 'str', 'value': 'Group2'},
+              {'title': 'Positioner:', 'name': 'positioner', 'type': 'str', 'value': 'Pos'},
+              {'title': 'Warm start:', 'name': 'warm_start', 'type': 'bool', 'value': True,
+               'tip': 'Skip the group kill, initialization and home search if the group is already in a ready state'},
+              {'title': 'Control mode:', 'name': 'control_mode', 'type': 'list', 'limits': ['Position', 'Velocity'],
+               'value': 'Position', 'tip': 'In Velocity mode, the actuator value is the jog velocity in units/s'},
+              {'title': 'Jog acceleration:', 'name': 'jog_acceleration', 'type': 'float', 'value': 10., 'min': 0.},
+              {'title': 'Analog tracking:', 'name': 'analog_tracking', 'type': 'group', 'expanded': False,
+               'children': [
+                  {'title': 'Enable:', 'name': 'tracking_enabled', 'type': 'bool', 'value': False},
+                  {'title': 'Type:', 'name': 'tracking_type', 'type': 'list', 'limits': ['Position', 'Velocity'],
+                   'value': 'Position'},
+                  {'title': 'Analog input:', 'name': 'gpio_name', 'type': 'str', 'value': 'GPIO2.ADC1'},
+                  {'title': 'Offset (V):', 'name': 'offset', 'type': 'float', 'value': 0.},
+                  {'title': 'Scale (units/V):', 'name': 'scale', 'type': 'float', 'value': 1.},
+                  {'title': 'Velocity:', 'name': 'velocity', 'type': 'float', 'value': 1.},
+                  {'title': 'Acceleration:', 'name': 'acceleration', 'type': 'float', 'value': 10.},
+                  {'title': 'Dead band (V):', 'name': 'dead_band', 'type': 'float', 'value': 0.,
+                   'tip': 'Velocity tracking only'},
+                  {'title': 'Order:', 'name': 'order', 'type': 'int', 'value': 1, 'min': 1, 'max': 5,
+                   'tip': 'Velocity tracking only'},
+                  {'title': 'Gathering points:', 'name': 'gathering_points', 'type': 'int', 'value': 100000,
+                   'min': 1},
+                  {'title': 'Gathering divisor:', 'name': 'gathering_divisor', 'type': 'int', 'value': 1, 'min': 1},
+              ]},
+              {'title': 'SGamma tuning:', 'name': 'sgamma', 'type': 'group', 'expanded': False, 'children': [
+                  {'title': 'Apply saved parameters:', 'name': 'apply_saved', 'type': 'bool', 'value': True,
+                   'tip': 'Apply at initialization the parameters tuned for this positioner, if any'},
+                  {'title': 'Step size:', 'name': 'step', 'type': 'float', 'value': 0.1},
+                  {'title': 'Moves per candidate:', 'name': 'n_moves', 'type': 'int', 'value': 10, 'min': 2},
+                  {'title': 'Following error tolerance:', 'name': 'following_error_tolerance', 'type': 'float',
+                   'value': 0.001},
+                  {'title': 'Max evaluations:', 'name': 'max_evaluations', 'type': 'int', 'value': 40, 'min': 1},
+                  {'title': 'Run tuning:', 'name': 'run_tuning', 'type': 'bool_push', 'value': False,
+                   'label': 'Tune'},
+                  {'title': 'Settling time (s):', 'name': 'settling_time', 'type': 'float', 'value': 0.,
+                   'readonly': True},
+              ]},
+              {'title': 'Controller scan (TCL):', 'name': 'tcl_scan', 'type': 'group', 'expanded': False, 'children': [
+                  {'title': 'Upload script:', 'name': 'upload_script', 'type': 'bool_push', 'value': False,
+                   'label': 'Upload'},
+                  {'title': 'Start:', 'name': 'start', 'type': 'float', 'value': 0.},
+                  {'title': 'Step:', 'name': 'step', 'type': 'float', 'value': 0.1},
+                  {'title': 'Number of points:', 'name': 'n_points', 'type': 'int', 'value': 10, 'min': 1},
+                  {'title': 'Settling time (ms):', 'name': 'settle_ms', 'type': 'int', 'value': 10, 'min': 0},
+                  {'title': 'Trigger GPIO:', 'name': 'gpio_name', 'type': 'str', 'value': 'GPIO3.DO'},
+                  {'title': 'Trigger mask (0: none):', 'name': 'gpio_mask', 'type': 'int', 'value': 0, 'min': 0},
+                  {'title': 'Gathered types:', 'name': 'gathering_types', 'type': 'str', 'value': '',
+                   'tip': 'comma separated list, defaults to the positioner CurrentPosition'},
+                  {'title': 'Timeout (s):', 'name': 'timeout', 'type': 'float', 'value': 600.},
+                  {'title': 'Run scan:', 'name': 'run_scan', 'type': 'bool_push', 'value': False, 'label': 'Run'},
+              ]},
+              ] + comon_parameters_fun(is_multiaxes, axis_names=_axis_names, epsilon=_epsilon)
 
     def ini_attributes(self):
         self.controller: XPSPythonWrapper = None
-
-        #TODO declare here attributes you want/need to init with a default value
-        pass
+        self.cache: ControllerCache = None
+        self.scan_data = None
+        self.tracking_data = None
 
     def get_actuator_value(self):
         """Get the current value from the hardware with scaling conversion.
@@ -154,12 +101,32 @@ class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
         -------
         float: The position obtained after scaling conversion.
         """
-        pos = DataActuator(data=self.controller.getPosition())  # when writing your own plugin replace this line
+        if self.is_tracking:
+            self.tracking_data = self.controller.readAnalogTracking()
+            if len(self.tracking_data) == 0:
+                pos = DataActuator(data=self.controller.getPosition())
+            else:
+                pos = DataActuator(data=float(self.tracking_data[-1, 0]))
+        elif self.is_velocity_mode:
+            pos = DataActuator(data=self.controller.getJogVelocity())
+        else:
+            pos = DataActuator(data=self.controller.getPosition())
         pos = self.get_position_with_scaling(pos)
         return pos
 
+    @property
+    def is_tracking(self) -> bool:
+        return self.settings['analog_tracking', 'tracking_enabled']
+
+    @property
+    def is_velocity_mode(self) -> bool:
+        return self.settings['control_mode'] == 'Velocity'
+
     def close(self):
         """Terminate the communication protocol"""
+        if self.cache is not None:
+            self.cache.update(**{axis_key('position', self.controller.positioner): self.controller.getPosition()})
+            self.cache.save()
         self.controller.closeTCPIP()
         
 
@@ -171,12 +138,101 @@ class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
         param: Parameter
             A given parameter (within detector_settings) whose value has been changed by the user
         """
-        ## TODO for your custom plugin
-        if param.name() == "a_parameter_you've_added_in_self.params":
-           self.controller.your_method_to_apply_this_param_change()
+        if param.name() == 'control_mode':
+            self.apply_control_mode()
+            self.emit_status(ThreadCommand('Update_Status', [f'{param.value()} control mode']))
+        elif param.name() == 'tracking_enabled':
+            self.apply_analog_tracking()
+        elif param.name() == 'run_tuning':
+            if param.value():
+                self.tune_sgamma()
+                param.setValue(False)
+        elif param.name() == 'upload_script':
+            if param.value():
+                self.controller.getStepScan().upload()
+                self.emit_status(ThreadCommand('Update_Status', ['TCL step scan script uploaded']))
+                param.setValue(False)
+        elif param.name() == 'run_scan':
+            if param.value():
+                self.run_controller_scan()
+                param.setValue(False)
         else:
             pass
 
+    def apply_control_mode(self):
+        """ Enable or disable the jog mode of the controller according to the control_mode setting"""
+        if self.is_velocity_mode and self.is_tracking:
+            self.emit_status(ThreadCommand('Update_Status', ['The velocity control is not available while the '
+                                                             'positioner follows the analog input', 'log']))
+            self.settings.child('control_mode').setValue('Position')
+        if self.is_velocity_mode:
+            if self.controller.jogSocketId is None:
+                self.controller.enableJog()
+        else:
+            self.controller.disableJog()
+
+    def apply_analog_tracking(self):
+        """ Configure and enable, or disable, the analog tracking according to the analog_tracking settings"""
+        tracking_settings = self.settings.child('analog_tracking')
+        if self.is_tracking and self.is_velocity_mode:
+            self.emit_status(ThreadCommand('Update_Status', ['The analog tracking is not available in the Velocity '
+                                                             'control mode', 'log']))
+            tracking_settings.child('tracking_enabled').setValue(False)
+        if self.is_tracking:
+            if self.controller.trackingStream is None:
+                self.controller.configureAnalogTracking(
+                    tracking_settings['tracking_type'], tracking_settings['gpio_name'], tracking_settings['offset'],
+                    tracking_settings['scale'], tracking_settings['velocity'], tracking_settings['acceleration'],
+                    tracking_settings['dead_band'], tracking_settings['order'])
+                self.controller.enableAnalogTracking(tracking_settings['tracking_type'],
+                                                     tracking_settings['gpio_name'],
+                                                     tracking_settings['gathering_points'],
+                                                     tracking_settings['gathering_divisor'])
+                self.emit_status(ThreadCommand('Update_Status', ['Analog tracking enabled']))
+        elif self.controller.trackingStream is not None:
+            self.controller.disableAnalogTracking()
+            self.emit_status(ThreadCommand('Update_Status', ['Analog tracking disabled']))
+
+    def tune_sgamma(self):
+        """ Search the fastest settling SGamma parameters for the step size set in the sgamma settings, apply
+        them and save them in the plugin configuration file for this positioner"""
+        tuning_settings = self.settings.child('sgamma')
+        tuner = self.controller.getSGammaTuner(tuning_settings['following_error_tolerance'])
+        result = tuner.tune(tuning_settings['step'], tuning_settings['n_moves'], tuning_settings['max_evaluations'])
+        config['xps', 'sgamma', self.controller.positioner] = result['parameters']
+        config.save()
+        tuning_settings.child('settling_time').setValue(result['settling_time'])
+        self.emit_status(ThreadCommand('Update_Status',
+                                       [f'SGamma tuned in {result["evaluations"]} evaluations, settling time: '
+                                        f'{result["initial"]["settling_time"]:.4f} s -> '
+                                        f'{result["settling_time"]:.4f} s']))
+        return result
+
+    def apply_saved_sgamma(self):
+        """Apply the SGamma parameters previously tuned for this positioner, if any"""
+        try:
+            saved = config['xps', 'sgamma', self.controller.positioner]
+        except KeyError:
+            saved = None
+        if saved is not None:
+            self.controller.getSGammaTuner(0.).set_parameters({name: saved[name] for name in PARAMETER_NAMES})
+            self.emit_status(ThreadCommand('Update_Status', [f'Saved SGamma parameters applied: {saved}']))
+
+    def run_controller_scan(self):
+        """ Execute the step scan defined in the tcl_scan settings on the controller and collect the gathered
+        data in bulk into self.scan_data"""
+        scan_settings = self.settings.child('tcl_scan')
+        gathering_types = [gathering_type.strip() for gathering_type in scan_settings['gathering_types'].split(',')
+                           if gathering_type.strip() != '']
+        self.scan_data = self.controller.getStepScan().run(
+            scan_settings['start'], scan_settings['step'], scan_settings['n_points'],
+            settle_ms=scan_settings['settle_ms'], gpio_name=scan_settings['gpio_name'],
+            gpio_mask=scan_settings['gpio_mask'], gathering_types=gathering_types,
+            timeout=scan_settings['timeout'])
+        self.emit_status(ThreadCommand('Update_Status',
+                                       [f'Controller scan done, gathered data shape: {self.scan_data.shape}']))
+        return self.scan_data
+
     def ini_stage(self, controller=None):
         """Actuator communication initialization
 
@@ -193,10 +249,25 @@ class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
         """
 
         self.controller = self.ini_stage_init(old_controller=controller,
-                                              new_controller=XPSPythonWrapper())
+                                              new_controller=XPSPythonWrapper(self.settings['ip_address'],
+                                                                              self.settings['port'],
+                                                                              self.settings['group'],
+                                                                              self.settings['positioner'],
+                                                                              self.settings['warm_start']))
 
         info = "Platine init"
         initialized = self.controller.checkConnected()
+        if initialized:
+            self.cache = ControllerCache('XPS', f'{self.settings["ip_address"]} '
+                                                f'{self.controller.getFirmwareVersion()}')
+            if self.controller.warmStarted:
+                info = f'Warm start, last known position: ' \
+                       f'{self.cache.get(axis_key("position", self.controller.positioner))}'
+        if initialized and self.settings['sgamma', 'apply_saved']:
+            self.apply_saved_sgamma()
+        if initialized:
+            self.apply_control_mode()
+            self.apply_analog_tracking()
         return info, initialized
 
     def move_abs(self, value: DataActuator):
@@ -206,13 +277,18 @@ class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
         ----------
         value: (float) value of the absolute target positioning
         """
-        value = self.check_bound(value)  #if user checked bounds, the defined bounds are applied here
+        value = self.check_bound(value)
         self.target_value = value
-        value = self.set_position_with_scaling(value)  # apply scaling if the user specified one
-        ## TODO for your custom plugin
-        self.controller.moveAbsolute(value.value())  # when writing your own plugin replace this line
-        #self.controller.moveAbsolute(value.value())  # do it twice to be sure
-        self.emit_status(ThreadCommand('Update_Status', ['moveAbsolute command sent']))
+        value = self.set_position_with_scaling(value)
+        if self.is_tracking:
+            self.emit_status(ThreadCommand('Update_Status', ['The positioner is following the analog input, '
+                                                             'disable the analog tracking to move it', 'log']))
+            self.move_done()
+        elif self.is_velocity_mode:
+            self.controller.setJogVelocity(value.value(), self.settings['jog_acceleration'])
+        else:
+            self.controller.moveAbsolute(value.value())
+            self.emit_status(ThreadCommand('Update_Status', ['moveAbsolute command sent']))
 
         
     def move_rel(self, value: DataActuator):
@@ -226,23 +302,29 @@ class DAQ_Move_Newport_XPS_Q8(DAQ_Move_base):
         self.target_value = value + self.current_position
         value = self.set_position_relative_with_scaling(value)
 
-        ## TODO for your custom plugin
-        raise NotImplemented  # when writing your own plugin remove this line
-        self.controller.your_method_to_set_a_relative_value(value.value())  # when writing your own plugin replace this line
-        self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
+        if self.is_tracking:
+            self.emit_status(ThreadCommand('Update_Status', ['The positioner is following the analog input, '
+                                                             'disable the analog tracking to move it', 'log']))
+            self.move_done()
+        elif self.is_velocity_mode:
+            self.controller.setJogVelocity(self.controller.getJogVelocity() + value.value(),
+                                           self.settings['jog_acceleration'])
+        else:
+            self.controller.moveAbsolute(self.controller.getPosition() + value.value())
+            self.emit_status(ThreadCommand('Update_Status', ['moveAbsolute command sent']))
 
     def move_home(self):
-        """Call the reference method of the controller"""
-        self.controller.moveHome()  # when writing your own plugin replace this line
-        self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
+        """Search the home position of the group"""
+        self.controller.moveHome()
+        self.emit_status(ThreadCommand('Update_Status', ['Home search done']))
 
     def stop_motion(self):
-      """Stop the actuator and emits move_done signal"""
-
-      ## TODO for your custom plugin
-      raise NotImplemented  # when writing your own plugin remove this line
-      self.controller.your_method_to_stop_positioning()  # when writing your own plugin replace this line
-      self.emit_status(ThreadCommand('Update_Status', ['Some info you want to log']))
+        """Stop the actuator and emits move_done signal"""
+        if self.is_velocity_mode:
+            self.controller.setJogVelocity(0., self.settings['jog_acceleration'])
+        else:
+            self.controller.abortMove()
+        self.move_done()
 
 
 if __name__ == '__main__':
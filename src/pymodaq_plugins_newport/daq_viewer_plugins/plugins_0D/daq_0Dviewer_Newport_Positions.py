@@ -0,0 +1,163 @@
+import numpy as np
+import pyvisa
+
+from pymodaq.utils.data import DataFromPlugins, DataToExport
+from pymodaq.control_modules.viewer_utility_classes import DAQ_Viewer_base, comon_parameters, main
+from pymodaq.utils.parameter import Parameter
+
+from pymodaq_plugins_newport.hardware.position_readers import (SMC100Reader, ESP100Reader, XPSGroupReader,
+                                                               AgilisReader)
+from pymodaq_plugins_newport.hardware.controller_proxy import ControllerProxyClient, parse_address
+
+VISA_rm = pyvisa.ResourceManager()
+infos = VISA_rm.list_resources_info()
+com_ports = [infos[key].alias for key in infos.keys() if infos[key].alias is not None]
+VISA_rm.close()
+com_port = com_ports[0] if len(com_ports) > 0 else ''
+
+
+def parse_axes(axes: str):
+    return [int(axis) for axis in axes.split(',') if axis.strip() != '']
+
+
+class DAQ_0DViewer_Newport_Positions(DAQ_Viewer_base):
+    """ Encoder as detector: positions of Newport axes logged as a 0D detector
+
+    All the axes of each enabled controller (SMC100 chain, ESP100, XPS group, Agilis channel step counters) are read
+    in one batched call per grab, and emitted as one DataWithAxes per controller, timestamped at the reading. Stage
+    positions are then logged at the rate of this detector instead of polling the actuators on the scan critical
+    path.
+
+    A serial port can only be opened once: to read the axes of a serial controller driven by an actuator plugin, both
+    plugins must use the same controller proxy (see hardware.controller_proxy), the readers then read through it.
+
+    Attributes:
+    -----------
+    controller: list of PositionReader
+    """
+    params = comon_parameters + [
+        {'title': 'Proxy:', 'name': 'proxy', 'type': 'str', 'value': '',
+         'tip': 'host:port or Unix socket of a controller proxy owning the serial controllers (named by their port)'},
+        {'title': 'SMC100:', 'name': 'smc100', 'type': 'group', 'children': [
+            {'title': 'Enabled:', 'name': 'enabled', 'type': 'bool', 'value': False},
+            {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': com_ports, 'value': com_port},
+            {'title': 'Addresses:', 'name': 'axes', 'type': 'str', 'value': '1', 'tip': 'comma separated'},
+        ]},
+        {'title': 'ESP100:', 'name': 'esp100', 'type': 'group', 'children': [
+            {'title': 'Enabled:', 'name': 'enabled', 'type': 'bool', 'value': False},
+            {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': com_ports, 'value': com_port},
+            {'title': 'Axes:', 'name': 'axes', 'type': 'str', 'value': '1', 'tip': 'comma separated'},
+        ]},
+        {'title': 'XPS:', 'name': 'xps', 'type': 'group', 'children': [
+            {'title': 'Enabled:', 'name': 'enabled', 'type': 'bool', 'value': False},
+            {'title': 'IP address:', 'name': 'ip_address', 'type': 'str', 'value': '192.168.0.254'},
+            {'title': 'Port:', 'name': 'port', 'type': 'int', 'value': 5001},
+            {'title': 'Group:', 'name': 'group', 'type': 'str', 'value': 'Group2'},
+            {'title': 'Number of positioners:', 'name': 'n_positioners', 'type': 'int', 'value': 1, 'min': 1,
+             'max': 8},
+        ]},
+        {'title': 'Agilis:', 'name': 'agilis', 'type': 'group', 'children': [
+            {'title': 'Enabled:', 'name': 'enabled', 'type': 'bool', 'value': False},
+            {'title': 'COM Port:', 'name': 'com_port', 'type': 'list', 'limits': com_ports, 'value': com_port},
+            {'title': 'Channel:', 'name': 'channel', 'type': 'int', 'value': 1, 'min': 1, 'max': 4},
+            {'title': 'Axes:', 'name': 'axes', 'type': 'str', 'value': '1,2', 'tip': 'comma separated'},
+        ]},
+    ]
+
+    def ini_attributes(self):
+        self.controller: list = None
+
+    def commit_settings(self, param: Parameter):
+        """Apply the consequences of a change of value in the detector settings
+
+        Parameters
+        ----------
+        param: Parameter
+            A given parameter (within detector_settings) whose value has been changed by the user
+        """
+        pass
+
+    def get_shared_controller(self, com_port: str):
+        """ Client of the controller proxy owning the serial controller, None without proxy"""
+        if self.settings['proxy'] == '':
+            return None
+        return ControllerProxyClient(com_port, parse_address(self.settings['proxy']))
+
+    def get_readers(self):
+        readers = []
+        if self.settings['smc100', 'enabled']:
+            com_port = self.settings['smc100', 'com_port']
+            readers.append(SMC100Reader(com_port, parse_axes(self.settings['smc100', 'axes']),
+                                        self.get_shared_controller(com_port)))
+        if self.settings['esp100', 'enabled']:
+            com_port = self.settings['esp100', 'com_port']
+            readers.append(ESP100Reader(com_port, parse_axes(self.settings['esp100', 'axes']),
+                                        self.get_shared_controller(com_port)))
+        if self.settings['xps', 'enabled']:
+            readers.append(XPSGroupReader(self.settings['xps', 'ip_address'], self.settings['xps', 'group'],
+                                          self.settings['xps', 'n_positioners'], self.settings['xps', 'port']))
+        if self.settings['agilis', 'enabled']:
+            com_port = self.settings['agilis', 'com_port']
+            readers.append(AgilisReader(com_port, self.settings['agilis', 'channel'],
+                                        parse_axes(self.settings['agilis', 'axes']),
+                                        self.get_shared_controller(com_port)))
+        return readers
+
+    def ini_detector(self, controller=None):
+        """Detector communication initialization
+
+        Parameters
+        ----------
+        controller: (object)
+            custom object of a PyMoDAQ plugin (Slave case). None if only one actuator/detector by controller
+            (Master case)
+
+        Returns
+        -------
+        info: str
+        initialized: bool
+            False if initialization failed otherwise True
+        """
+        readers = self.get_readers()
+        if self.settings['controller_status'] == 'Master':
+            for reader in readers:
+                reader.open()
+        self.ini_detector_init(old_controller=controller, new_controller=readers)
+        info = f'Reading the positions of: {", ".join([reader.name for reader in self.controller])}'
+        initialized = len(self.controller) > 0
+        return info, initialized
+
+    def close(self):
+        """Terminate the communication protocol"""
+        for reader in self.controller:
+            reader.close()
+            if isinstance(reader.controller, ControllerProxyClient):
+                reader.controller.close()  # the link is owned by the proxy
+
+    def grab_data(self, Naverage=1, **kwargs):
+        """Start a grab from the detector
+
+        Parameters
+        ----------
+        Naverage: int
+            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
+            True in class preamble and you should code this implementation)
+        kwargs: dict
+            others optionals arguments
+        """
+        data = []
+        for reader in self.controller:
+            timestamp, positions = reader.read()
+            dwa = DataFromPlugins(name=reader.name, data=[np.array([position]) for position in positions],
+                                  dim='Data0D', labels=reader.labels, units=reader.units)
+            dwa.timestamp = timestamp
+            data.append(dwa)
+        self.dte_signal.emit(DataToExport(name='Newport positions', data=data))
+
+    def stop(self):
+        """Stop the current grab hardware wise if necessary"""
+        return ''
+
+
+if __name__ == '__main__':
+    main(__file__)
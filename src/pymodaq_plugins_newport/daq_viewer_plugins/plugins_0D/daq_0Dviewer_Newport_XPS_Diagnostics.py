@@ -0,0 +1,105 @@
+import numpy as np
+
+from pymodaq.utils.daq_utils import ThreadCommand
+from pymodaq.utils.data import DataFromPlugins, DataToExport
+from pymodaq.control_modules.viewer_utility_classes import DAQ_Viewer_base, comon_parameters, main
+from pymodaq.utils.parameter import Parameter
+
+from pymodaq_plugins_newport.hardware.xps_diagnostics import XPSDiagnostics, DIAGNOSTIC_APIS
+
+
+class DAQ_0DViewer_Newport_XPS_Diagnostics(DAQ_Viewer_base):
+    """ Following errors and setpoints of the positioners of a XPS group
+
+    The group is sampled at a fixed period in a thread, on a dedicated socket. Each grab emits the last sample of
+    each quantity, and the peak absolute following error over all the samples acquired since the previous grab,
+    so that a stage not settled when the detectors are triggered is visible in the scan data.
+
+    Attributes:
+    -----------
+    controller: XPSDiagnostics
+    """
+    params = comon_parameters + [
+        {'title': 'IP address:', 'name': 'ip_address', 'type': 'str', 'value': '192.168.0.254'},
+        {'title': 'Port:', 'name': 'port', 'type': 'int', 'value': 5001},
+        {'title': 'Group:', 'name': 'group', 'type': 'str', 'value': 'Group1'},
+        {'title': 'Number of positioners:', 'name': 'n_positioners', 'type': 'int', 'value': 1, 'min': 1,
+         'max': 8},
+        {'title': 'Sampling period (ms):', 'name': 'sampling_period', 'type': 'int', 'value': 20, 'min': 1},
+    ]
+
+    def ini_attributes(self):
+        self.controller: XPSDiagnostics = None
+
+    def commit_settings(self, param: Parameter):
+        """Apply the consequences of a change of value in the detector settings
+
+        Parameters
+        ----------
+        param: Parameter
+            A given parameter (within detector_settings) whose value has been changed by the user
+        """
+        if param.name() == 'sampling_period':
+            self.controller.start(param.value() / 1000)
+
+    def ini_detector(self, controller=None):
+        """Detector communication initialization
+
+        Parameters
+        ----------
+        controller: (object)
+            custom object of a PyMoDAQ plugin (Slave case). None if only one actuator/detector by controller
+            (Master case)
+
+        Returns
+        -------
+        info: str
+        initialized: bool
+            False if initialization failed otherwise True
+        """
+        self.ini_detector_init(old_controller=controller,
+                               new_controller=XPSDiagnostics(self.settings['ip_address'], self.settings['group'],
+                                                             self.settings['n_positioners'], self.settings['port']))
+        self.controller.start(self.settings['sampling_period'] / 1000)
+        info = f'Sampling the diagnostics of {self.settings["group"]}'
+        initialized = True
+        return info, initialized
+
+    def close(self):
+        """Terminate the communication protocol"""
+        self.controller.close()
+
+    def grab_data(self, Naverage=1, **kwargs):
+        """Start a grab from the detector
+
+        Parameters
+        ----------
+        Naverage: int
+            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
+            True in class preamble and you should code this implementation)
+        kwargs: dict
+            others optionals arguments
+        """
+        samples = self.controller.read_new()
+        if len(samples) == 0:  # grabbing faster than the sampling
+            samples = np.array([self.controller.sample()], dtype=self.controller.dtype).view(np.recarray)
+        labels = [f'{self.settings["group"]} positioner {ind + 1}' for ind in range(self.settings['n_positioners'])]
+        last = samples[-1]
+        data = [DataFromPlugins(name=name, data=[np.array([value]) for value in last[name]], dim='Data0D',
+                                labels=labels)
+                for name in DIAGNOSTIC_APIS]
+        data.append(DataFromPlugins(name='peak_following_error',
+                                    data=[np.array([value]) for value in
+                                          np.max(np.abs(samples['following_error']), axis=0)],
+                                    dim='Data0D', labels=labels))
+        for dwa in data:
+            dwa.timestamp = last['timestamp']
+        self.dte_signal.emit(DataToExport(name='XPS diagnostics', data=data))
+
+    def stop(self):
+        """Stop the current grab hardware wise if necessary"""
+        return ''
+
+
+if __name__ == '__main__':
+    main(__file__)
@@ -0,0 +1,102 @@
+import numpy as np
+
+from pymodaq.utils.daq_utils import ThreadCommand
+from pymodaq.utils.data import DataFromPlugins, DataToExport
+from pymodaq.control_modules.viewer_utility_classes import DAQ_Viewer_base, comon_parameters, main
+from pymodaq.utils.parameter import Parameter
+
+from pymodaq_plugins_newport.hardware.xps_health import XPSHealthMonitor, HEALTH_APIS
+
+
+class DAQ_0DViewer_Newport_XPS_Health(DAQ_Viewer_base):
+    """ Health and load monitor of a XPS-Q8 controller
+
+    Samples, on a dedicated socket, the motion kernel time load and min/max periods, the CPU temperature and fan
+    speed and the supply voltages, so that they can be logged alongside the scans. A degraded scan timing can then be
+    correlated with an overloaded motion kernel.
+
+    Attributes:
+    -----------
+    controller: XPSHealthMonitor
+    """
+    params = comon_parameters + [
+        {'title': 'IP address:', 'name': 'ip_address', 'type': 'str', 'value': '192.168.0.254'},
+        {'title': 'Port:', 'name': 'port', 'type': 'int', 'value': 5001},
+        {'title': 'Monitored quantities:', 'name': 'groups', 'type': 'group', 'children': [
+            {'title': 'Kernel load:', 'name': 'kernel_load', 'type': 'bool', 'value': True},
+            {'title': 'Kernel periods:', 'name': 'kernel_periods', 'type': 'bool', 'value': True},
+            {'title': 'CPU temperature/fan:', 'name': 'cpu', 'type': 'bool', 'value': True},
+            {'title': 'Voltages:', 'name': 'voltages', 'type': 'bool', 'value': False},
+        ]},
+        {'title': 'Reset kernel periods min/max:', 'name': 'reset_periods', 'type': 'bool_push', 'value': False,
+         'label': 'Reset'},
+    ]
+
+    def ini_attributes(self):
+        self.controller: XPSHealthMonitor = None
+
+    def commit_settings(self, param: Parameter):
+        """Apply the consequences of a change of value in the detector settings
+
+        Parameters
+        ----------
+        param: Parameter
+            A given parameter (within detector_settings) whose value has been changed by the user
+        """
+        if param.name() == 'reset_periods':
+            if param.value():
+                self.controller.reset_kernel_period_min_max()
+                param.setValue(False)
+
+    def ini_detector(self, controller=None):
+        """Detector communication initialization
+
+        Parameters
+        ----------
+        controller: (object)
+            custom object of a PyMoDAQ plugin (Slave case). None if only one actuator/detector by controller
+            (Master case)
+
+        Returns
+        -------
+        info: str
+        initialized: bool
+            False if initialization failed otherwise True
+        """
+        self.ini_detector_init(old_controller=controller,
+                               new_controller=XPSHealthMonitor(self.settings['ip_address'], self.settings['port']))
+        info = f'Monitoring the XPS controller at {self.settings["ip_address"]}'
+        initialized = True
+        return info, initialized
+
+    def close(self):
+        """Terminate the communication protocol"""
+        self.controller.close()
+
+    def selected_groups(self):
+        return [group for group in HEALTH_APIS if self.settings['groups', group]]
+
+    def grab_data(self, Naverage=1, **kwargs):
+        """Start a grab from the detector
+
+        Parameters
+        ----------
+        Naverage: int
+            Number of hardware averaging (if hardware averaging is possible, self.hardware_averaging should be set to
+            True in class preamble and you should code this implementation)
+        kwargs: dict
+            others optionals arguments
+        """
+        health = self.controller.read(self.selected_groups())
+        self.dte_signal.emit(DataToExport(name='XPS health', data=[
+            DataFromPlugins(name=group, data=[np.array([value]) for value in values.values()], dim='Data0D',
+                            labels=list(values.keys()))
+            for group, values in health.items()]))
+
+    def stop(self):
+        """Stop the current grab hardware wise if necessary"""
+        return ''
+
+
+if __name__ == '__main__':
+    main(__file__)
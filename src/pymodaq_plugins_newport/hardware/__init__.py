@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Drivers of the Newport controllers, usable from scripts without PyMoDAQ nor Qt::
+
+    from pymodaq_plugins_newport.hardware import SMC100, XPSPythonWrapper
+
+    smc = SMC100()
+    smc.init_communication('COM5')
+    print(smc.get_positions((1, 2)))
+
+The modules are imported at the first use of one of their names, importing the package itself only costs the
+listing below. The drivers import numpy at the first call returning an array, so that a script only driving a stage
+starts quickly.
+"""
+import importlib
+
+# public name: module of the hardware package defining it
+_EXPORTS = {
+    'SerialBase': 'serial_base',
+    'SMC100': 'smc100',
+    'ESP100': 'esp100',
+    'ConexAGAP': 'conex_agap',
+    'ConexError': 'conex_agap',
+    'AgilisSerial': 'agilis_serial',
+    'AgilisChannelError': 'agilis_serial',
+    'AgilisAxisError': 'agilis_serial',
+    'XPS': 'XPS_Q8_drivers',
+    'XPSPythonWrapper': 'xps_wrapper',
+    'XPSError': 'xps_utils',
+    'AsyncXPS': 'xps_async',
+    'XPSAsyncAdapter': 'xps_async',
+    'XPSHealthMonitor': 'xps_health',
+    'XPSDiagnostics': 'xps_diagnostics',
+    'SGammaTuner': 'xps_sgamma_tuning',
+    'XPSTCLStepScan': 'xps_tcl_scan',
+    'TCLScanError': 'xps_tcl_scan',
+    'open_transport': 'transports',
+    'list_ports': 'transports',
+    'TransportError': 'transports',
+    'TransportTimeout': 'transports',
+    'telemetry': 'telemetry',
+    'DriverWorker': 'driver_worker',
+    'ControllerProxyServer': 'controller_proxy',
+    'ControllerProxyClient': 'controller_proxy',
+    'SynchronizedMove': 'synchronized_move',
+    'SerialMember': 'synchronized_move',
+    'XPSGroupMember': 'synchronized_move',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__} has no attribute {name}')
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,19 +1,30 @@
+import logging
+import sys
+import threading
 import time
-import pyvisa
-from threading import Lock
-from pyvisa.errors import VisaIOError
-import pymodaq.utils.daq_utils as utils
-from pymodaq.utils.logger import set_logger, get_module_name
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
 
-logger = set_logger(get_module_name(__file__), add_to_console=False)
-visa_rm = pyvisa.ResourceManager()
+from pymodaq_plugins_newport.hardware.command_scheduler import CommandScheduler, Priority
+from pymodaq_plugins_newport.hardware.ready_wait import ReadyWaiter
+from pymodaq_plugins_newport.hardware.transports import open_transport, list_ports, TransportError, TransportTimeout
+from pymodaq_plugins_newport.hardware.telemetry import telemetry, serial_command_key
+from pymodaq_plugins_newport.hardware.session_recorder import record_traffic
 
-_infos = visa_rm.list_resources_info()
-COMPORTS = []
-for k in _infos.keys():
-    COMPORTS.append(_infos[k].alias)
+if 'pymodaq' in sys.modules:
+    # driven by the plugin: log into the PyMoDAQ log, as before
+    from pymodaq.utils.logger import set_logger, get_module_name
+    logger = set_logger(get_module_name(__file__), add_to_console=False)
+else:
+    # scripts: importing pymodaq would load Qt, the standard logging is used
+    logger = logging.getLogger(__name__)
 
-lock = Lock()
+
+def __getattr__(name):
+    # the ports are listed at the first use of COMPORTS, not at import
+    if name == 'COMPORTS':
+        return list_ports('pyvisa')
+    raise AttributeError(f'module {__name__} has no attribute {name}')
 
 
 class AgilisChannelError(Exception):
@@ -24,33 +35,75 @@ class AgilisAxisError(Exception):
     pass
 
 
+class AbsoluteMeasurement:
+    """
+    Result of a MA measurement: the position of the axis within its travel (0 to 1000), the step displacement (see
+    AgilisSerial.get_step_displacement) at the end of the measurement and the time of the measurement
+    """
+    def __init__(self, value: int, steps: int, timestamp: float):
+        self.value = value
+        self.steps = steps
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f'AbsoluteMeasurement(value={self.value}, steps={self.steps}, timestamp={self.timestamp})'
+
+
 class AgilisSerial:
     channel_indexes = [1, 2, 3, 4]  # for 'AG-UC8' else [1, 2]
     axis_indexes = [1, 2]
-    _steps = {axis: 0 for axis in axis_indexes}
 
-    def __init__(self):
+    def __init__(self, backend='pyvisa'):
+        self.backend = backend
         self._controller = None
         self._info = None
+        # the AG-UC8 addresses one channel at a time: the current channel is tracked so that CC is only sent when
+        # the channel changes, and the step counters are kept per (channel, axis)
+        self._channel = None
+        self._steps = {}
+        self._coarse_offsets = {}
+        self._moving = set()
+        self._absolute = {}
+        self._amplitudes = {}
+        self._move_starts = {}
+        self._ready_waiter = ReadyWaiter()
+        self._measurement_executor = None
+        # the controller does not reply during a MA measurement: the commands of the other threads, but the stops,
+        # wait for its end
+        self._measurement_thread = None
+        self._measurement_done = threading.Event()
+        self._measurement_done.set()
         self._timeout_wait_isready_ms = 10000
+        self._timeout_measure_ms = 180000
+        self._scheduler = CommandScheduler(self.__class__.__name__)
+        self._traffic_name = self.__class__.__name__
 
-    def init_com_remote(self, com_port):
+    def init_com_remote(self, com_port, reset=True):
+        """
+        Open the port and set the controller in remote mode. The reset (RS) clears the step counters, skip it for a warm
+        start of a controller still powered
+        """
         self.open(com_port)
-        self.reset()
-        time.sleep(1)
+        if reset:
+            self.reset()
+            time.sleep(1)
         info = self.get_infos()
         self.set_local_remote('remote')
         return info
 
     def open(self, com_port):
-        if com_port in COMPORTS:
-            self._controller = visa_rm.open_resource(com_port, baud_rate=921600)
+        if self.backend != 'pyvisa' or com_port in list_ports('pyvisa'):
+            self._controller = open_transport(com_port, self.backend, baud_rate=921600)
+            self._scheduler.name = f'{self.__class__.__name__} on {com_port}'
+            self._traffic_name = f'{self.__class__.__name__}:{com_port}'
             time.sleep(1)
-
-            self._controller.read_termination = self._controller.CR + self._controller.LF
-            self._controller.write_termination = self._controller.CR + self._controller.LF
             self._controller.timeout = 10
 
+    def open_replay(self, session, com_port):
+        """ Use a recorded session (see session_recorder.ReplaySession) instead of the serial port"""
+        self._controller = session.resource(f'{self.__class__.__name__}:{com_port}')
+        self._traffic_name = self._controller.transport
+
     def get_infos(self):
         if self._controller is not None:
             if self._info is None:
@@ -69,20 +122,78 @@ class AgilisSerial:
 
     def reset(self):
         self.write('RS')
-
-    def stop(self, axis: int):
+        self._steps = {}
+        self._coarse_offsets = {}
+        self._moving = set()
+        self._absolute = {}
+        self._amplitudes = {}
+        self._move_starts = {}
+
+    def stop(self, axis: int, channel: int = None):
+        """ Stop the axis, only the axes of the current channel can be moving (see ensure_channel)"""
+        if channel is not None and self._channel is not None and channel != self._channel:
+            return
         command = f'{axis:.0f}ST'
-        self.write(command)
+        with self._scheduler.stop_slot():
+            self.write(command, priority=Priority.STOP)
+        self._moving.discard((self._channel, axis))
+
+    @contextmanager
+    def _slot(self, priority=Priority.COMMAND):
+        """ Scheduler slot, taken after the end of a MA measurement started by another thread, but for the stops"""
+        if priority != Priority.STOP and self._measurement_thread not in (None, threading.get_ident()):
+            self._measurement_done.wait(self._timeout_measure_ms / 1000)
+        with self._scheduler.slot(priority):
+            yield
+
+    def get_stop_latency_stats(self) -> dict:
+        return self._scheduler.stop_latency_stats()
 
     def select_channel(self, channel_index: int):
         if channel_index not in self.channel_indexes:
             raise AgilisChannelError(f'The specified channel ({channel_index}) is not available in {self.channel_indexes}')
+        if channel_index == self._channel:
+            return
         order = "CC" + str(channel_index)
         self.write(order)
+        self._channel = channel_index
 
     def get_channel(self):
-        channel = self.query('CC?')
-        return int(channel[2:])
+        channel = int(self.query('CC?')[2:])
+        self._channel = channel
+        return channel
+
+    @property
+    def current_channel(self) -> int:
+        """ Current channel, only queried if not yet known"""
+        if self._channel is None:
+            return self.get_channel()
+        return self._channel
+
+    def ensure_channel(self, channel: int = None):
+        """
+        Select the channel if needed, after the end of the moves started on the current channel (a channel change
+        would not let them complete). Nothing is sent if the channel is None or already selected.
+        """
+        if channel is None or channel == self.current_channel:
+            return
+        while True:
+            self.wait_moves_done()  # outside of the slot so that a stop can go through
+            with self._slot(Priority.COMMAND):
+                if not any(moving_channel == self._channel for moving_channel, _ in self._moving):
+                    self.select_channel(channel)
+                    return
+            # else moves started meanwhile by another thread
+
+    def wait_moves_done(self):
+        """ Wait for the end of the moves started on the current channel"""
+        for moving_channel, axis in sorted(self._moving):
+            if moving_channel == self._channel:
+                self.wait_axis_ready(axis)
+        self._moving = set()
+
+    def _step_key(self, axis):
+        return self._channel, axis
 
     def check_axis_index(self, axis_index: int):
         if axis_index not in self.axis_indexes:
@@ -92,40 +203,227 @@ class AgilisSerial:
     def get_axis_isready(self, axis):
         self.check_axis_index(axis)
         command = f'{axis:.0f}TS'
-        status = self.query(command)
+        status = self.query(command, Priority.POLL)
         return status == f'{command}0'
 
     def wait_axis_ready(self, axis):
-        time_start = time.perf_counter()
-        while not self.get_axis_isready(axis):
-            time.sleep(0.05)
-            if time.perf_counter() - time_start > self._timeout_wait_isready_ms / 1000:
+        """
+        Wait for the end of the move of the axis: the status is only polled from shortly before the end predicted from
+        the number of steps of the move (see ready_wait.ReadyWaiter), then with an increasing period
+        """
+        key = self._step_key(axis)
+        time_start, steps = self._move_starts.pop(key, (time.perf_counter(), None))
+        model_key = key + (self._amplitudes.get(key + ('+' if steps is None or steps >= 0 else '-',)),)
+        with telemetry.timed(self.__class__.__name__, 'wait_axis_ready'):
+            try:
+                self._ready_waiter.wait(model_key, steps, time_start, lambda: self.get_axis_isready(axis),
+                                        self._timeout_wait_isready_ms / 1000)
+            except TimeoutError:
                 self.stop(axis)
                 raise TimeoutError(f"axis {axis} could'nt be ready after an elapsed time of"
                                    f" {self._timeout_wait_isready_ms} ms")
 
     def wait_query_is_not_none(self, axis):
-        time_start = time.perf_counter()
-        while not self.get_axis_isready(axis):
-            time.sleep(0.05)
-            if time.perf_counter() - time_start > self._timeout_wait_isready_ms / 1000:
-                self.stop(axis)
-                raise TimeoutError(f"axis {axis} could'nt be ready after an elapsed time of"
-                                   f" {self._timeout_wait_isready_ms} ms")
+        self.wait_axis_ready(axis)
 
-    def move_rel(self, axis: int, steps: int):
+    def get_wait_stats(self) -> dict:
+        """ Fitted move duration models, per (channel, axis, step amplitude)"""
+        return self._ready_waiter.stats()
+
+    def move_rel(self, axis: int, steps: int, channel: int = None):
         self.check_axis_index(axis)
-        order = f'{axis:.0f}PR{steps:.0f}'
-        self.write(order)
-        self._steps[axis] += steps
+        self._start_moves([(axis, steps)], channel)
+
+    def _start_moves(self, moves, channel: int = None):
+        """
+        Start relative moves on the channel: the channel is selected beforehand (see ensure_channel), only the orders
+        are written within the slot, so that no move is awaited while holding it
+        """
+        while True:
+            self.ensure_channel(channel)
+            with self._slot(Priority.COMMAND):
+                if channel is None or channel == self._channel:
+                    for axis, steps in moves:
+                        self.write(f'{axis:.0f}PR{steps:.0f}')
+                        key = self._step_key(axis)
+                        self._move_starts[key] = (time.perf_counter(), steps)
+                        self._steps[key] = self._steps.get(key, 0) + steps
+                        self._moving.add(key)
+                    return
+            # else the channel was changed meanwhile by another thread
+
+    def move_many(self, moves) -> int:
+        """
+        Execute relative moves on several channels with the fewest channel changes: the moves are grouped by channel,
+        starting with the current one. The moves of a channel are started together and completed before the next
+        channel is selected.
+
+        Parameters
+        ----------
+        moves: iterable of tuple
+            (channel, axis, steps)
+
+        Returns
+        -------
+        int: the number of channel changes
+        """
+        moves_per_channel = {}
+        for channel, axis, steps in moves:
+            channel_moves = moves_per_channel.setdefault(channel, {})
+            channel_moves[axis] = channel_moves.get(axis, 0) + steps
+        current_channel = self.current_channel
+        channels = sorted([channel for channel, channel_moves in moves_per_channel.items()
+                           if any(steps != 0 for steps in channel_moves.values())],
+                          key=lambda channel: (channel != current_channel, channel))
+        n_changes = 0
+        for channel in channels:
+            if channel != self._channel:
+                n_changes += 1
+            for axis, steps in moves_per_channel[channel].items():
+                if steps != 0:
+                    self.move_rel(axis, steps, channel)
+        return n_changes
+
+    def run_step_sequence(self, steps, axes=None, channel: int = None, callback=None) -> int:
+        """
+        Execute a sequence of relative moves, for instance a raster of mirror tilts, without reading the step counters
+        between the points: the moves of the axes of a point are started together, their end is awaited from their
+        predicted duration (see wait_axis_ready), then callback is called, for instance to grab a detector.
+
+        Parameters
+        ----------
+        steps: sequence of sequence of int
+            relative steps of each point, one value per axis
+        axes: list of int
+            the axes of the channel, all by default
+        channel: int
+        callback: callable
+            callback(index, step_counters) called after each point with the local step counters of the axes, the
+            sequence is interrupted if it returns False
 
-    def counter_to_zero(self, axis):
+        Returns
+        -------
+        int: the number of points executed
+        """
+        if axes is None:
+            axes = self.axis_indexes
+        for axis in axes:
+            self.check_axis_index(axis)
+        n_points = 0
+        for point in steps:
+            moves = [(axis, int(axis_steps)) for axis, axis_steps in zip(axes, point) if axis_steps != 0]
+            self._start_moves(moves, channel)
+            # the longest move first, the others are then likely done at their first poll
+            for axis, _ in sorted(moves, key=lambda move: -abs(move[1])):
+                self.wait_axis_ready(axis)
+                self._moving.discard(self._step_key(axis))
+            n_points += 1
+            if callback is not None and \
+                    callback(n_points - 1, [self._steps.get(self._step_key(axis), 0) for axis in axes]) is False:
+                break
+        return n_points
+
+    def get_step_amplitude(self, axis: int, positive=True, channel: int = None) -> int:
+        """ Step amplitude (1 to 50) of the axis in the positive or negative direction"""
         self.check_axis_index(axis)
-        command = f'{axis:.0f}ZP'
-        self.write(command)
+        sign = '+' if positive else '-'
+        command = f'{axis:.0f}SU{sign}?'
+        self.ensure_channel(channel)
+        with self._slot(Priority.COMMAND):
+            self.ensure_channel(channel)
+            reply = self.query(command)
+            if reply is None:
+                raise TimeoutError(f'No reply to the query of the step amplitude of axis {axis}')
+            amplitude = abs(int(reply.split('SU')[1]))
+            self._amplitudes[self._step_key(axis) + (sign,)] = amplitude
+        return amplitude
+
+    def set_step_amplitude(self, axis: int, amplitude: int, channel: int = None):
+        """ Set the step amplitude (1 to 50) of the axis in both directions, SU is only sent if it changes"""
+        self.check_axis_index(axis)
+        if not 1 <= amplitude <= 50:
+            raise ValueError(f'The step amplitude should be between 1 and 50, not {amplitude}')
+        self.ensure_channel(channel)
+        key = self._step_key(axis)
+        if key in self._moving:  # the amplitude cannot change during a move
+            self.wait_axis_ready(axis)
+            self._moving.discard(key)
+        with self._slot(Priority.COMMAND):
+            self.ensure_channel(channel)
+            for sign in '+-':
+                if self._amplitudes.get(key + (sign,)) != amplitude:
+                    self.write(f'{axis:.0f}SU{sign}{amplitude:.0f}')
+                    self._amplitudes[key + (sign,)] = amplitude
+
+    def move_coarse_fine(self, axis: int, steps: int, coarse_amplitude: int, fine_amplitude: int, step_ratio: float,
+                         fine_steps=100, channel: int = None):
+        """
+        Relative move in two phases: the bulk of the move at a large step amplitude, then the final approach at a small
+        one. The fine phase is started once the coarse one is done, and is not waited for.
+
+        The step counter of the controller counts the coarse steps as any other step, the displacement of the coarse
+        steps beyond their count (n_coarse * (step_ratio - 1) fine steps) is kept apart and added by
+        get_step_displacement.
+
+        Parameters
+        ----------
+        axis: int
+        steps: int
+            displacement in steps at the fine amplitude
+        coarse_amplitude: int
+        fine_amplitude: int
+        step_ratio: float
+            displacement of a coarse step divided by the displacement of a fine step (see calibrate_step_size)
+        fine_steps: int
+            minimum number of fine steps of the final approach
+        channel: int
 
-    @utils.timer
-    def get_step_counter(self, axis, read_controller=True):
+        Returns
+        -------
+        int: number of coarse steps
+        int: number of fine steps
+        """
+        sign = 1 if steps >= 0 else -1
+        n_coarse = 0
+        if abs(steps) > fine_steps and step_ratio > 1:
+            n_coarse = sign * int((abs(steps) - fine_steps) / step_ratio)
+        if n_coarse != 0:
+            self.set_step_amplitude(axis, coarse_amplitude, channel)
+            self.move_rel(axis, n_coarse, channel)
+            key = self._step_key(axis)
+            self._coarse_offsets[key] = self._coarse_offsets.get(key, 0) + n_coarse * (step_ratio - 1)
+        n_fine = int(round(steps - n_coarse * step_ratio))
+        self.set_step_amplitude(axis, fine_amplitude, channel)
+        if n_fine != 0:
+            self.move_rel(axis, n_fine, channel)
+        return n_coarse, n_fine
+
+    def calibrate_step_size(self, axis: int, amplitude: int, n_steps: int, channel: int = None) -> float:
+        """
+        Displacement per step at the given amplitude, in MA units (1/1000 of the travel), from two absolute
+        measurements around a move of n_steps (stages with limit switches). The move must stay within the travel, the
+        larger it is the better the precision.
+        """
+        start = self.measure_absolute_position(axis, channel)
+        self.set_step_amplitude(axis, amplitude, channel)
+        self.move_rel(axis, n_steps, channel)
+        end = self.measure_absolute_position(axis, channel)
+        return (end.value - start.value) / n_steps
+
+    def counter_to_zero(self, axis, channel: int = None):
+        self.check_axis_index(axis)
+        command = f'{axis:.0f}ZP'
+        self.ensure_channel(channel)
+        with self._slot(Priority.COMMAND):
+            self.ensure_channel(channel)
+            self.write(command)
+            key = self._step_key(axis)
+            if key in self._absolute:  # keep the absolute measurement consistent with the new counter origin
+                self._absolute[key].steps -= self._steps.get(key, 0) + self._coarse_offsets.get(key, 0)
+            self._steps[key] = 0
+            self._coarse_offsets[key] = 0
+
+    def get_step_counter(self, axis, read_controller=True, channel: int = None):
         """
         Returns the number of accumulated steps in forward direction minus the number of steps in backward direction
         since powering the controller or since the last ZP (zero position) command
@@ -133,16 +431,48 @@ class AgilisSerial:
 
         self.check_axis_index(axis)
         if read_controller:
+            self.ensure_channel(channel)
             self.wait_axis_ready(axis)
-            command = f'{axis:.0f}TP'
-            steps_string = self.query(command)
-            if steps_string is None or command not in steps_string:
-                steps = self._steps[axis]
-            else:
-                steps = int(steps_string.split(command)[1])
-                self._steps[axis] = steps
+            with self._slot(Priority.POLL):
+                self.ensure_channel(channel)
+                key = self._step_key(axis)
+                self._moving.discard(key)
+                command = f'{axis:.0f}TP'
+                steps_string = self.query(command, Priority.POLL)
+                if steps_string is None or command not in steps_string:
+                    steps = self._steps.get(key, 0)
+                else:
+                    steps = int(steps_string.split(command)[1])
+                    self._steps[key] = steps
         else:
-            steps = self._steps[axis]
+            steps = self._steps.get((self._channel if channel is None else channel, axis), 0)
+        return steps
+
+    def get_step_displacement(self, axis, read_controller=True, channel: int = None) -> float:
+        """
+        Displacement of the axis in fine steps: the step counter plus the extra displacement of the coarse steps of
+        move_coarse_fine
+        """
+        steps = self.get_step_counter(axis, read_controller, channel)
+        return steps + self._coarse_offsets.get((self._channel if channel is None else channel, axis), 0)
+
+    def get_step_counters(self, axes=None):
+        """
+        Returns the step counters of the given axes (all by default) of the current channel read from the controller
+        without waiting for the end of the moves, the local counters are returned when the controller does not reply
+        """
+        if axes is None:
+            axes = self.axis_indexes
+        steps = []
+        with self._slot(Priority.POLL):
+            for axis in axes:
+                self.check_axis_index(axis)
+                key = self._step_key(axis)
+                command = f'{axis:.0f}TP'
+                steps_string = self.query(command, Priority.POLL)
+                if steps_string is not None and command in steps_string:
+                    self._steps[key] = int(steps_string.split(command)[1])
+                steps.append(self._steps.get(key, 0))
         return steps
 
     def is_at_limits(self):
@@ -164,56 +494,125 @@ class AgilisSerial:
         elif ret == 'PH3':
             return True, True
 
+    def measure_absolute_position(self, axis: int, channel: int = None) -> AbsoluteMeasurement:
+        """
+        Measure the position of the axis within its travel with MA (stages with limit switches such as the AG-LS25).
+        The stage moves to a limit and back, it takes up to a few minutes during which the controller is not available.
+        The result is cached and used by get_fused_position.
+
+        The reply is polled with POLL slots, so that a stop can be sent during the measurement, the commands of the
+        other threads wait for its end.
+        """
+        self.check_axis_index(axis)
+        command = f'{axis:.0f}MA'
+        self.ensure_channel(channel)
+        self.wait_axis_ready(axis)
+        with telemetry.timed(self.__class__.__name__, 'MA'):
+            with self._slot(Priority.COMMAND):
+                self.ensure_channel(channel)
+                key = self._step_key(axis)
+                self._measurement_thread = threading.get_ident()
+                self._measurement_done.clear()
+                record_traffic(self._traffic_name, 'tx', command)
+                self._controller.write(command)
+            time_start = time.perf_counter()
+            reply = None
+            try:
+                while reply is None or command not in reply:
+                    with self._slot(Priority.POLL):
+                        reply = self.flush_read()
+                    if time.perf_counter() - time_start > self._timeout_measure_ms / 1000:
+                        raise TimeoutError(f'No reply to the absolute position measurement of axis {axis}')
+            finally:
+                self._measurement_thread = None
+                self._measurement_done.set()
+            value = int(reply.split(command)[1])
+            if value < 0:
+                raise AgilisAxisError(f'The absolute position measurement of axis {axis} failed: {reply}')
+        steps = self.get_step_displacement(axis, channel=key[0])
+        measurement = AbsoluteMeasurement(value, steps, time.time())
+        self._absolute[key] = measurement
+        return measurement
+
+    def start_absolute_measurement(self, axis: int, channel: int = None) -> Future:
+        """ Execute measure_absolute_position in a background thread, the result is available from the future"""
+        if self._measurement_executor is None:
+            self._measurement_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='agilis_ma')
+        return self._measurement_executor.submit(self.measure_absolute_position, axis,
+                                                 self.current_channel if channel is None else channel)
+
+    def get_absolute_measurement(self, axis: int, channel: int = None) -> AbsoluteMeasurement:
+        """ Last absolute measurement of the axis, None if not measured yet"""
+        return self._absolute.get((self.current_channel if channel is None else channel, axis))
+
+    def get_fused_position(self, axis: int, steps_per_unit: float, channel: int = None, read_controller=False):
+        """
+        Absolute position in steps: the last MA measurement (converted with steps_per_unit, the number of steps per
+        MA unit of the axis) plus the step displacement since the measurement. None if the axis was not measured.
+        """
+        measurement = self.get_absolute_measurement(axis, channel)
+        if measurement is None:
+            return None
+        steps = self.get_step_displacement(axis, read_controller, channel)
+        return measurement.value * steps_per_unit + steps - measurement.steps
+
     def close(self):
+        if self._measurement_executor is not None:
+            self._measurement_executor.shutdown(wait=False)
         self._controller.close()
 
-    def query(self, command: str):
+    def query(self, command: str, priority=Priority.COMMAND):
         value = None
+        time_start = time.perf_counter()
+        command_key = serial_command_key(command)
         try:
-            lock.acquire()
-            time_start = time.perf_counter()
-            while value is None:
-                self.write(command, isquery=True)
-                value = self.flush_read()
-                ret = self.check_errors(command)
-                logger.debug(f'Error code {ret} returned from the query of the write of {command}')
-                if value is None:
-                    time.sleep(0.05)
-                    if time.perf_counter() - time_start > self._timeout_wait_isready_ms / 1000:
-                        raise TimeoutError(f"Timeout append during query of command {command}")
-        except VisaIOError as e:
+            with telemetry.timed(self.__class__.__name__, command_key):
+                while value is None:
+                    # the channel is released between retries so that a pending stop can go through
+                    with self._slot(priority):
+                        record_traffic(self._traffic_name, 'tx', command)
+                        self._controller.write(command)
+                        value = self.flush_read()
+                        ret = self.check_errors(command)
+                    logger.debug(f'Error code {ret} returned from the query of the write of {command}')
+                    if value is None:
+                        telemetry.record_retry(self.__class__.__name__, command_key)
+                        time.sleep(0.05)
+                        if time.perf_counter() - time_start > self._timeout_wait_isready_ms / 1000:
+                            raise TimeoutError(f"Timeout append during query of command {command}")
+        except TransportError as e:
             logger.debug(str(e))
-        finally:
-            lock.release()
         return value
 
     def check_errors(self, command=''):
+        record_traffic(self._traffic_name, 'tx', 'TE')
         ret = self._controller.query('TE')
+        record_traffic(self._traffic_name, 'rx', ret)
         if ret != 'TE0':
             logger.warning(f'Error code {ret} returned from the query of the command {command}')
         return ret
 
-    def write(self, command: str, isquery=True):
+    def write(self, command: str, isquery=True, priority=Priority.COMMAND):
         try:
-            if not isquery:
-                lock.acquire()
-            self._controller.write(command)
-            if not isquery:
-                ret = self.check_errors(command)
-                logger.debug(f'Error code {ret} returned from the query of the write of {command}')
-        except VisaIOError as e:
+            with self._slot(priority), telemetry.timed(self.__class__.__name__,
+                                                                 serial_command_key(command)):
+                record_traffic(self._traffic_name, 'tx', command)
+                self._controller.write(command)
+                if not isquery:
+                    ret = self.check_errors(command)
+                    logger.debug(f'Error code {ret} returned from the query of the write of {command}')
+        except TransportError as e:
             logger.debug(str(e))
-        finally:
-            if not isquery:
-                lock.release()
 
     def flush_read(self):
         ret = None
         while True:
             try:
                 ret = self._controller.read()
+                record_traffic(self._traffic_name, 'rx', ret)
                 logger.debug(f'Read buffer was {ret}')
-            except pyvisa.errors.VisaIOError:
+            except TransportTimeout:
+                record_traffic(self._traffic_name, 'timeout')
                 #  expected timeout
                 break
         return ret
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Per-controller command scheduler. All transactions on a given communication channel go through a
+CommandScheduler slot: only one transaction owns the channel at a time and pending transactions are
+served by priority (then by arrival order), so that a stop request is always the next command sent
+on the wire, whatever the number of position polls queued behind the current one.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import IntEnum
+
+from pymodaq_plugins_newport.hardware.telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Transaction priorities, the lowest value is served first"""
+    STOP = 0
+    COMMAND = 10
+    POLL = 20
+
+
+class CommandScheduler:
+    """ Priority and reentrant access to a communication channel
+
+    Parameters
+    ----------
+    name: str
+        name of the channel (used for logging)
+    stop_history: int
+        number of stop latencies kept in memory
+    """
+
+    def __init__(self, name='', stop_history=100):
+        self.name = name
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._counter = itertools.count()
+        self._owner = None
+        self._depth = 0
+        self.stop_latencies = deque(maxlen=stop_history)
+
+    @contextmanager
+    def slot(self, priority=Priority.COMMAND):
+        """ Context manager reserving the channel for one transaction
+
+        Nested slots from the thread already owning the channel are granted immediately.
+        """
+        thread = threading.get_ident()
+        with self._condition:
+            if self._owner == thread:
+                self._depth += 1
+            else:
+                ticket = (int(priority), next(self._counter))
+                heapq.heappush(self._waiting, ticket)
+                try:
+                    while self._owner is not None or self._waiting[0] != ticket:
+                        self._condition.wait()
+                except BaseException:
+                    # interrupted wait (KeyboardInterrupt...): the ticket would block the following transactions
+                    self._waiting.remove(ticket)
+                    heapq.heapify(self._waiting)
+                    self._condition.notify_all()
+                    raise
+                heapq.heappop(self._waiting)
+                self._owner = thread
+                self._depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+                    self._condition.notify_all()
+
+    @contextmanager
+    def stop_slot(self):
+        """ Slot with the STOP priority recording the latency between the request and the end of the
+        transaction"""
+        time_start = time.perf_counter()
+        with self.slot(Priority.STOP):
+            yield
+        latency = time.perf_counter() - time_start
+        self.stop_latencies.append(latency)
+        telemetry.record('stop latency', self.name, latency)
+        logger.debug(f'Stop latency on {self.name}: {latency * 1000:.2f} ms')
+
+    @property
+    def pending(self) -> int:
+        """Number of transactions waiting for the channel"""
+        with self._condition:
+            return len(self._waiting)
+
+    def stop_latency_stats(self) -> dict:
+        """ Statistics of the recorded stop latencies in seconds
+
+        Returns
+        -------
+        dict: with keys count, last, mean and max
+        """
+        latencies = list(self.stop_latencies)
+        if len(latencies) == 0:
+            return dict(count=0, last=None, mean=None, max=None)
+        return dict(count=len(latencies), last=latencies[-1], mean=sum(latencies) / len(latencies),
+                    max=max(latencies))
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(key) -> CommandScheduler:
+    """ Get the scheduler associated with a given channel (COM port, IP address...), creating it if needed
+
+    Used when the controller object cannot hold the scheduler itself and Master/Slave plugins have to
+    share it.
+    """
+    with _schedulers_lock:
+        if key not in _schedulers:
+            _schedulers[key] = CommandScheduler(str(key))
+        return _schedulers[key]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Wrapper around the ASCII serial protocol of the CONEX-AGAP controllers (two axes U and V), replacing the
+ConexAGAPCmdLib .NET library: the commands are sent with the SerialBase infrastructure (Windows and Linux).
+
+Commands are prefixed by the controller address and suffixed by the axis name for the per axis ones: '1PAU0.01',
+'1TPV' -> '1TPV-0.00212'.
+"""
+import time
+
+from pymodaq_plugins_newport.hardware.serial_base import SerialBase
+from pymodaq_plugins_newport.hardware.command_scheduler import Priority
+
+AXIS_NAMES = ['U', 'V']
+
+# controller states of the TS reply (4 hexadecimal characters of positioner errors then the state)
+READY_STATES = ['32', '33', '34', '35', '36']
+MOVING_STATES = ['28', '29']
+
+
+class ConexError(Exception):
+    pass
+
+
+class ConexAGAP(SerialBase):
+
+    def __init__(self, backend='pyvisa'):
+        super().__init__(backend)
+        self._positions = {}  # address: (time of the read, positions of the U and V axes)
+
+    def init_communication(self, com_port, axis=1):
+        if self.is_valid_port(com_port):
+            super().init_communication(com_port, axis)
+            self._controller.baud_rate = 921600
+        else:
+            raise IOError('{:s} is not a valid port'.format(com_port))
+
+    def _reply_value(self, command: str, reply: str) -> str:
+        """ Value of the reply of a query, the reply starts with the command without its question mark"""
+        prefix = command.rstrip('?')
+        if not reply.startswith(prefix):
+            raise ConexError(f'Unexpected reply {reply} to the command {command}')
+        return reply[len(prefix):].strip()
+
+    def _query_value(self, command: str, priority=Priority.COMMAND) -> str:
+        return self._reply_value(command, self._query(command, priority))
+
+    def get_controller_infos(self, axis=1):
+        return self._query_value(f'{axis}VE', Priority.COMMAND)
+
+    def get_motor_id(self, axis=1):
+        return self._query_value(f'{axis}ID?', Priority.COMMAND)
+
+    def get_state(self, axis=1):
+        """
+        Returns
+        -------
+        int: the positioner errors
+        str: the controller state, see READY_STATES and MOVING_STATES
+        """
+        status = self._query_value(f'{axis}TS', Priority.POLL)
+        return int(status[:4], 16), status[4:6]
+
+    def is_moving(self, axis=1) -> bool:
+        return self.get_state(axis)[1] in MOVING_STATES
+
+    def get_error(self, axis=1) -> str:
+        """ Last command error, '@' if none"""
+        return self._query_value(f'{axis}TE', Priority.COMMAND)
+
+    def get_position(self, axis_name='U', axis=1, max_age=0.):
+        """ Position of the U or V axis
+
+        Parameters
+        ----------
+        axis_name: str
+        axis: int
+            address of the controller
+        max_age: float
+            the position read with the other axis less than max_age s ago is returned (see get_positions)
+        """
+        last_read = self._positions.get(axis)
+        if last_read is not None and time.perf_counter() - last_read[0] <= max_age:
+            return last_read[1][AXIS_NAMES.index(axis_name)]
+        if max_age > 0:
+            return self.get_positions(axis)[AXIS_NAMES.index(axis_name)]
+        command = f'{axis}TP{axis_name}'
+        return float(self._query_value(command, Priority.POLL))
+
+    def get_positions(self, axis=1) -> 'np.ndarray':
+        """ Positions of the U and V axes read in a single transaction"""
+        import numpy as np
+        commands = [f'{axis}TP{axis_name}' for axis_name in AXIS_NAMES]
+        replies = self._query_many(commands)
+        positions = np.array([float(self._reply_value(command, reply)) for command, reply in zip(commands, replies)])
+        self._positions[axis] = (time.perf_counter(), positions)
+        return positions
+
+    def move_axis(self, move_type='ABS', axis=1, pos=0., axis_name='U'):
+        self._positions.pop(axis, None)
+        if move_type == 'ABS':
+            self._write_command(f'{axis}PA{axis_name}{pos}')
+        elif move_type == 'REL':
+            self._write_command(f'{axis}PR{axis_name}{pos}')
+        else:
+            raise Exception('{:s} is not a valid displacement type'.format(move_type))
+
+    def get_position_limits(self, axis_name='U', axis=1):
+        """ Negative and positive software limits of the axis"""
+        return (float(self._query_value(f'{axis}SL{axis_name}?')),
+                float(self._query_value(f'{axis}SR{axis_name}?')))
+
+    def move_home(self, axis=1, axis_name='U'):
+        self.move_axis('ABS', axis, 0., axis_name)
+
+
+if __name__ == '__main__':
+    controller = ConexAGAP()
+    controller.init_communication('COM3')
+    try:
+        print(controller.get_controller_infos())
+        print(f'Positions are : {controller.get_positions()}')
+    finally:
+        controller.close_communication()
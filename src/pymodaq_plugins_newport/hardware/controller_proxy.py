@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Local proxy sharing the controllers between processes: a serial port can be opened by a single process, so the
+proxy owns the links and the dashboard plugins and analysis scripts talk to it.
+
+The server executes the method calls of its clients on the driver objects (SMC100, ESP100...), one call at a time
+per controller. The reads declared cacheable (positions) are answered from memory when the last reply is recent
+enough, and identical reads requested at the same time by several clients are executed once. The clients have the
+API of the driver::
+
+    python -m pymodaq_plugins_newport.hardware.controller_proxy --controller smc100:COM5 --controller esp100:COM6
+
+    smc = ControllerProxyClient('COM5')  # name of the controller on the server, its address by default
+    smc.get_positions((1, 2))
+    smc.move_axis('ABS', 1, 10.)
+
+The connections use multiprocessing.connection (localhost TCP, or a Unix socket when the address is a path),
+authenticated with an authkey shared by the server and its clients. The messages are pickled: a peer knowing the
+authkey can execute code in the proxy, so the authkey is a secret of the user (see get_authkey).
+"""
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import Listener, Client
+from pathlib import Path
+
+PROXY_ADDRESS = ('127.0.0.1', 6550)
+PROXY_AUTHKEY_ENV = 'NEWPORT_PROXY_AUTHKEY'
+PROXY_AUTHKEY_FILE = Path.home().joinpath('.pymodaq', 'newport_proxy_authkey')
+# fixed authkey, only used when explicitly requested (trusted single user machines)
+PUBLIC_AUTHKEY = b'pymodaq_plugins_newport'
+
+# reads answered from the cache by default
+CACHEABLE_METHODS = ['get_position', 'get_positions', 'get_step_counters']
+# commands executed without waiting for the call in progress, the driver scheduler sends them first
+STOP_METHODS = ['stop_motion', 'stop']
+
+# controller kind: (module, class, method opening the link)
+CONTROLLER_KINDS = {
+    'smc100': ('smc100', 'SMC100', 'init_communication'),
+    'esp100': ('esp100', 'ESP100', 'init_communication'),
+    'conex': ('conex_agap', 'ConexAGAP', 'init_communication'),
+    'agilis': ('agilis_serial', 'AgilisSerial', 'init_com_remote'),
+}
+
+
+class ProxyError(Exception):
+    pass
+
+
+def get_authkey() -> bytes:
+    """ Secret shared by the proxy and its clients: the NEWPORT_PROXY_AUTHKEY environment variable if set, else a
+    random key generated at the first use into PROXY_AUTHKEY_FILE, readable by the user only"""
+    authkey = os.environ.get(PROXY_AUTHKEY_ENV)
+    if authkey:
+        return authkey.encode()
+    try:
+        return PROXY_AUTHKEY_FILE.read_bytes().strip()
+    except FileNotFoundError:
+        pass
+    PROXY_AUTHKEY_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    try:
+        descriptor = os.open(PROXY_AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:  # created meanwhile by another process
+        return PROXY_AUTHKEY_FILE.read_bytes().strip()
+    authkey = secrets.token_hex(32).encode()
+    with os.fdopen(descriptor, 'wb') as authkey_file:
+        authkey_file.write(authkey)
+    return authkey
+
+
+class _ProxiedController:
+
+    def __init__(self, driver, cacheable_methods, stop_methods=STOP_METHODS):
+        self.driver = driver
+        self.cacheable_methods = set(cacheable_methods)
+        self.stop_methods = set(stop_methods)
+        self.lock = threading.Lock()  # one call at a time on the driver
+        self._state_lock = threading.Lock()  # cache and pending calls
+        self._generation = 0  # incremented by each command, the reads started before are not cached
+        self.cache = {}  # (method, args, kwargs): (time of the reply, result)
+        self.pending = {}  # (method, args, kwargs): Future of the call in progress
+        self.n_calls = 0
+        self.n_cached = 0
+        self.n_coalesced = 0
+
+    def call(self, method: str, args, kwargs, max_age: float):
+        if method.startswith('_'):
+            raise ProxyError(f'The private method {method} cannot be called through the proxy')
+        if method in self.stop_methods:
+            # not behind the call in progress (a MA measurement, a long move...), the scheduler of the driver orders
+            # the stop before the other transactions
+            with self._state_lock:
+                self.cache = {}
+                self._generation += 1
+                self.n_calls += 1
+            return getattr(self.driver, method)(*args, **kwargs)
+        if method not in self.cacheable_methods:
+            with self.lock:
+                self.n_calls += 1
+                with self._state_lock:
+                    self.cache = {}  # a command may change the state
+                    self._generation += 1
+                return getattr(self.driver, method)(*args, **kwargs)
+
+        key = (method, args, tuple(sorted(kwargs.items())))
+        with self._state_lock:
+            cached = self.cache.get(key)
+            if cached is not None and time.perf_counter() - cached[0] <= max_age:
+                self.n_cached += 1
+                return cached[1]
+            future = self.pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self.pending[key] = future
+                generation = self._generation
+            else:
+                self.n_coalesced += 1
+        if not owner:
+            return future.result()
+        try:
+            with self.lock:
+                self.n_calls += 1
+                result = getattr(self.driver, method)(*args, **kwargs)
+            with self._state_lock:
+                if generation == self._generation:
+                    self.cache[key] = (time.perf_counter(), result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._state_lock:
+                self.pending.pop(key, None)
+
+
+class ControllerProxyServer:
+    """ Server owning the controllers links
+
+    Parameters
+    ----------
+    address: tuple or str
+        (host, port), or the path of a Unix socket
+    authkey: bytes
+        None for the secret of the user (see get_authkey)
+    max_age: float
+        default age in s below which a cached read is returned
+    """
+
+    def __init__(self, address=PROXY_ADDRESS, authkey: bytes = None, max_age=0.05):
+        self.address = address
+        self.authkey = get_authkey() if authkey is None else authkey
+        self.max_age = max_age
+        self.controllers = {}
+        self._listener: Listener = None
+        self._thread: threading.Thread = None
+
+    def add_controller(self, name: str, driver, cacheable_methods=CACHEABLE_METHODS):
+        """ Serve an opened driver object under the given name"""
+        self.controllers[name] = _ProxiedController(driver, cacheable_methods)
+
+    def open_controller(self, kind: str, address: str, name: str = None, backend='pyvisa'):
+        """ Create and open a driver of CONTROLLER_KINDS, served under its address by default"""
+        import importlib
+        module_name, class_name, open_method = CONTROLLER_KINDS[kind]
+        module = importlib.import_module(f'pymodaq_plugins_newport.hardware.{module_name}')
+        driver = getattr(module, class_name)(backend)
+        getattr(driver, open_method)(address)
+        self.add_controller(address if name is None else name, driver)
+        return driver
+
+    def start(self):
+        """ Accept the clients in a background thread"""
+        self._listener = Listener(self.address, authkey=self.authkey)
+        self._thread = threading.Thread(target=self._accept_loop, name='controller_proxy', daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while self._thread.is_alive():
+                self._thread.join(1.)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                connection = self._listener.accept()
+            except OSError:  # listener closed
+                break
+            except Exception:  # failed authentication
+                continue
+            threading.Thread(target=self._serve_client, args=(connection,), daemon=True).start()
+
+    def _serve_client(self, connection):
+        with connection:
+            while True:
+                try:
+                    name, method, args, kwargs, max_age = connection.recv()
+                except (EOFError, OSError):
+                    break
+                try:
+                    controller = self.controllers.get(name)
+                    if controller is None:
+                        raise ProxyError(f'No controller {name} on the proxy, available: {list(self.controllers)}')
+                    result = controller.call(method, args, kwargs, self.max_age if max_age is None else max_age)
+                    connection.send((True, result))
+                except Exception as e:
+                    try:
+                        connection.send((False, e))
+                    except Exception:  # exception not picklable
+                        connection.send((False, ProxyError(f'{type(e).__name__}: {e}')))
+
+    def stats(self) -> dict:
+        """ name: number of calls executed on the controller, answered from the cache, and coalesced"""
+        return {name: dict(calls=controller.n_calls, cached=controller.n_cached, coalesced=controller.n_coalesced)
+                for name, controller in self.controllers.items()}
+
+    def close(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+
+class ControllerProxyClient:
+    """ Driver API of a controller served by a ControllerProxyServer
+
+    Parameters
+    ----------
+    name: str
+        name of the controller on the server
+    address: tuple or str
+    authkey: bytes
+        None for the secret of the user (see get_authkey)
+    max_age: float
+        age in s below which a cached read is accepted, None for the default of the server
+    """
+
+    def __init__(self, name: str, address=PROXY_ADDRESS, authkey: bytes = None, max_age=None):
+        self._name = name
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._connection = Client(address, authkey=get_authkey() if authkey is None else authkey)
+
+    def call(self, method: str, *args, **kwargs):
+        with self._lock:
+            self._connection.send((self._name, method, args, kwargs, self._max_age))
+            ok, result = self._connection.recv()
+        if not ok:
+            raise result
+        return result
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+        method.__name__ = name
+        return method
+
+    def close(self):
+        self._connection.close()
+
+
+def parse_address(address: str):
+    """ 'host:port' -> (host, port), a path (Unix socket) is returned as is"""
+    host, separator, port = address.rpartition(':')
+    if separator and port.isdigit():
+        return host, int(port)
+    return address
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Share Newport controllers between processes')
+    parser.add_argument('--controller', action='append', default=[],
+                        help=f'kind[@backend]:address, kind being one of {list(CONTROLLER_KINDS)}, for instance'
+                             f' smc100:COM5 or esp100@tcp:192.168.0.50:4001')
+    parser.add_argument('--address', default=f'{PROXY_ADDRESS[0]}:{PROXY_ADDRESS[1]}',
+                        help='host:port or Unix socket path of the proxy')
+    parser.add_argument('--max-age', type=float, default=50., help='maximum age of the cached reads in ms')
+    parser.add_argument('--public-authkey', action='store_true',
+                        help='use the fixed public authkey instead of the secret of the user, any local process can then'
+                             ' execute code in the proxy')
+    options = parser.parse_args()
+    server = ControllerProxyServer(parse_address(options.address),
+                                   authkey=PUBLIC_AUTHKEY if options.public_authkey else None,
+                                   max_age=options.max_age / 1000)
+    for controller in options.controller:
+        kind, controller_address = controller.split(':', 1)
+        kind, _, backend = kind.partition('@')
+        server.open_controller(kind, controller_address, backend=backend or 'pyvisa')
+    server.serve_forever()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Controller drivers running in a worker process, so that their parsing and waiting do not compete for the GIL with
+the Qt event loop of the dashboard.
+
+The driver object is created in the worker from its class and arguments. Its methods are called through a pipe by
+the DriverWorker proxy, with the same names and arguments. The worker also polls the positions at a fixed period
+and publishes them in a shared memory array that is read without any IPC::
+
+    worker = DriverWorker(SMC100, setup=[('init_communication', ('COM5',))],
+                          poll=('get_positions', ((1, 2),)), n_values=2, period=0.05)
+    worker.move_axis('ABS', 1, 10.)  # executed in the worker
+    timestamp, positions = worker.latest()  # shared memory
+    worker.close()
+"""
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+# layout of the shared array: sequence number (odd while writing), timestamp (time.time()) of the last successful
+# poll, number of failed polls, then the values
+_HEADER = 3
+
+
+class WorkerError(Exception):
+    pass
+
+
+class _SharedValues:
+    """ Seqlock protected array of float64, one writer and many readers"""
+
+    def __init__(self, raw_array):
+        self.raw_array = raw_array
+        self.array = np.frombuffer(raw_array, dtype=np.float64)
+
+    def write(self, timestamp: float, values=None, failed=False):
+        array = self.array
+        array[0] += 1
+        if failed:
+            array[2] += 1
+        else:
+            array[1] = timestamp
+            array[_HEADER:] = values
+        array[0] += 1
+
+    def read(self):
+        while True:
+            sequence = self.array[0]
+            if sequence % 2 == 0:
+                timestamp, n_failed, values = self.array[1], self.array[2], self.array[_HEADER:].copy()
+                if self.array[0] == sequence:
+                    return float(timestamp), int(n_failed), values
+            time.sleep(0)
+
+
+def _worker_main(driver_class, args, kwargs, setup, poll, period, connection, raw_array):
+    """ Entry point of the worker process"""
+    shared = _SharedValues(raw_array)
+    try:
+        driver = driver_class(*args, **kwargs)
+        for method, method_args in setup:
+            getattr(driver, method)(*method_args)
+    except Exception as e:
+        connection.send((0, False, _picklable(e)))
+        return
+    connection.send((0, True, None))
+
+    stop = threading.Event()
+    if poll is not None:
+        def poll_loop():
+            method, method_args = poll
+            while not stop.is_set():
+                time_start = time.perf_counter()
+                try:
+                    values = getattr(driver, method)(*method_args)
+                    shared.write(time.time(), values)
+                except Exception:
+                    shared.write(time.time(), failed=True)
+                stop.wait(max(0., period - (time.perf_counter() - time_start)))
+        threading.Thread(target=poll_loop, daemon=True).start()
+
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        sequence, method, method_args, method_kwargs = request
+        try:
+            connection.send((sequence, True, getattr(driver, method)(*method_args, **method_kwargs)))
+        except Exception as e:
+            connection.send((sequence, False, _picklable(e)))
+    stop.set()
+
+
+def _picklable(exception: Exception) -> Exception:
+    import pickle
+    try:
+        pickle.dumps(exception)
+        return exception
+    except Exception:
+        return WorkerError(f'{type(exception).__name__}: {exception}')
+
+
+class DriverWorker:
+    """ Proxy of a driver object running in a worker process
+
+    Parameters
+    ----------
+    driver_class: type
+        class of the driver, importable from the worker process
+    args: tuple
+        arguments of the driver constructor
+    kwargs: dict
+    setup: list of tuple
+        (method name, arguments) called after the construction, for instance to open the communication
+    poll: tuple
+        (method name, arguments) of the method returning the values to publish, None for no polling
+    n_values: int
+        number of values returned by the poll method
+    period: float
+        polling period in s
+    timeout: float
+        timeout of the calls in s
+    """
+
+    def __init__(self, driver_class, args=(), kwargs=None, setup=(), poll=None, n_values=0, period=0.05,
+                 timeout=30.):
+        context = multiprocessing.get_context('spawn')  # no fork of the Qt application
+        self.timeout = timeout
+        self.period = period
+        self._lock = threading.Lock()
+        self._sequence = 0  # number of the last request, the replies carry it
+        raw_array = context.RawArray('d', _HEADER + n_values)
+        self._shared = _SharedValues(raw_array)
+        self._shared.array[_HEADER:] = np.nan
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(target=_worker_main, name=f'{driver_class.__name__} worker',
+                                        args=(driver_class, args, kwargs or {}, list(setup), poll, period,
+                                              child_connection, raw_array),
+                                        daemon=True)
+        self._process.start()
+        child_connection.close()
+        self._receive(0, timeout)  # construction and setup
+
+    def _receive(self, sequence: int, timeout):
+        """ Reply to the request `sequence`, the late replies of the requests that timed out are dropped"""
+        deadline = time.perf_counter() + timeout
+        while True:
+            if not self._connection.poll(max(0., deadline - time.perf_counter())):
+                raise TimeoutError(f'No reply from the worker {self._process.name} within {timeout} s')
+            reply_sequence, ok, result = self._connection.recv()
+            if reply_sequence == sequence:
+                break
+        if not ok:
+            raise result
+        return result
+
+    def call(self, method: str, *args, **kwargs):
+        """ Call a method of the driver in the worker and return its result"""
+        with self._lock:
+            if not self._process.is_alive():
+                raise WorkerError(f'The worker {self._process.name} is not running')
+            self._sequence += 1
+            self._connection.send((self._sequence, method, args, kwargs))
+            return self._receive(self._sequence, self.timeout)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+        method.__name__ = name
+        return method
+
+    def latest(self):
+        """ Last polled values, read from the shared memory
+
+        Returns
+        -------
+        float: timestamp of the last successful poll (time.time()), 0 if no poll succeeded yet
+        np.ndarray: the values, NaN before the first successful poll
+        """
+        timestamp, _, values = self._shared.read()
+        return timestamp, values
+
+    def fresh_values(self, max_age: float = None) -> np.ndarray:
+        """ Last polled values, if polled successfully less than max_age s ago (10 polling periods by default)
+
+        Raises
+        ------
+        WorkerError: if no poll succeeded within max_age: not polled yet, or the polls are failing
+        """
+        if max_age is None:
+            max_age = 10 * self.period
+        timestamp, n_failed, values = self._shared.read()
+        age = time.time() - timestamp
+        if age > max_age:
+            if timestamp == 0:
+                raise WorkerError(f'No successful poll of the worker {self._process.name} yet '
+                                  f'({n_failed} failed polls)')
+            raise WorkerError(f'The last successful poll of the worker {self._process.name} is {age:.3f} s old '
+                              f'({n_failed} failed polls)')
+        return values
+
+    @property
+    def n_failed_polls(self) -> int:
+        return self._shared.read()[1]
+
+    def close(self, timeout=5.):
+        """ Stop the worker process, the communication of the driver is to be closed before"""
+        with self._lock:
+            if self._process.is_alive():
+                try:
+                    self._connection.send(None)
+                except OSError:
+                    pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._connection.close()
@@ -1,30 +1,41 @@
-import pyvisa
-import numpy as np
 from pymodaq_plugins_newport.hardware.serial_base import SerialBase
+from pymodaq_plugins_newport.hardware.command_scheduler import Priority
+from pymodaq_plugins_newport.hardware.telemetry import telemetry, serial_command_key
+from pymodaq_plugins_newport.hardware.session_recorder import record_traffic
 
 
 class ESP100(SerialBase):
 
-    def init_communication(self, com_port, axis=1):
-        if com_port in self.com_ports:
+    def init_communication(self, com_port, axis=1, motor_on=True):
+        if self.is_valid_port(com_port):
             super().init_communication(com_port, axis)
             self._controller.baud_rate = 19200
 
-            self.turn_motor_on(axis)
+            if motor_on:
+                self.turn_motor_on(axis)
         else:
             raise IOError('{:s} is not a valid port'.format(com_port))
 
+    def _write_read_value(self, command, priority=Priority.POLL):
+        """ Write a query command and read back its numerical reply as a single transaction"""
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__, serial_command_key(command)):
+            record_traffic(self._traffic_name, 'tx', command)
+            self._controller.write(command)
+            values = self._controller.read_ascii_values()
+            record_traffic(self._traffic_name, 'rx', ','.join([str(value) for value in values]))
+            return values[0]
+
     def turn_motor_on(self, axis=1):
-        self._write_command(f'{axis}MO?')
-        status = self._controller.read_ascii_values()[0]
-        if not status:
-            self._write_command(f'{axis}MO')
+        with self._scheduler.slot():
+            status = self._write_read_value(f'{axis}MO?', Priority.COMMAND)
+            if not status:
+                self._write_command(f'{axis}MO')
 
     def turn_motor_off(self, axis=1):
-        self._write_command(f'{axis}MF?')
-        status = self._controller.read_ascii_values()[0]
-        if status:
-            self._write_command(f'{axis}MF')
+        with self._scheduler.slot():
+            status = self._write_read_value(f'{axis}MF?', Priority.COMMAND)
+            if status:
+                self._write_command(f'{axis}MF')
 
     def close_communication(self, axis=1):
         self.turn_motor_off(axis=axis)
@@ -35,18 +46,34 @@ class ESP100(SerialBase):
         
     
     def get_velocity(self, axis=1):
-        self._write_command(f'{axis}VA?')
-        pos = self._controller.read_ascii_values()[0]
+        pos = self._write_read_value(f'{axis}VA?', Priority.COMMAND)
         return pos
     
     def get_velocity_max(self, axis=1):
-        self._write_command(f'{axis}VU?')
-        pos = self._controller.read_ascii_values()[0]
+        pos = self._write_read_value(f'{axis}VU?', Priority.COMMAND)
         return pos
 
+    def get_acceleration_max(self, axis=1):
+        return self._write_read_value(f'{axis}AU?', Priority.COMMAND)
+
+    def get_positions(self, axes=(1,)) -> 'np.ndarray':
+        """ return the positions of the given axes, queried on a single command line
+        """
+        import numpy as np
+        command = ';'.join([f'{axis}TP' for axis in axes])
+        with self._scheduler.slot(Priority.POLL), telemetry.timed(self.__class__.__name__, 'TP batch'):
+            record_traffic(self._traffic_name, 'tx', command)
+            self._controller.write(command)
+            values = self._controller.read_ascii_values()
+            record_traffic(self._traffic_name, 'rx', ','.join([str(value) for value in values]))
+        return np.array(values[:len(axes)])
+
     def get_position(self, axis=1):
         """ return the given axis position always in mm
         """
-        self._write_command(f'{axis}TP')
-        pos = self._controller.read_ascii_values()[0]
+        pos = self._write_read_value(f'{axis}TP')
         return pos
+
+    def is_moving(self, axis=1) -> bool:
+        """ Motion status of the axis (MD? replies 1 once the motion is done)"""
+        return not self._write_read_value(f'{axis}MD?')
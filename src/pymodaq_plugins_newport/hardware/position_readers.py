@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Batched position readout of the Newport controllers, used to log the stage positions as a detector.
+
+Each reader reads all the axes of one controller in a single call and timestamps the reading.
+
+A serial port can only be opened once: a reader opening its own link cannot read a controller already driven by an
+actuator plugin. The reader then shares the controller of the plugin, passed as `controller`, for instance a
+ControllerProxyClient of the controller proxy (see controller_proxy) the plugin is also using. A shared controller is
+neither opened nor closed by the reader.
+"""
+import time
+
+import numpy as np
+
+
+class PositionReader:
+    """ Base class, subclasses implement _open, _read_positions and _close
+
+    Parameters
+    ----------
+    name: str
+    axes: iterable of int
+    controller: object
+        shared driver (or ControllerProxyClient) of the controller, None to open a dedicated link
+
+    Attributes
+    ----------
+    name: str
+        name of the controller, used as the name of the emitted data
+    labels: list of str
+        one label per axis
+    """
+    units = 'mm'
+
+    def __init__(self, name: str, axes, controller=None):
+        self.name = name
+        self.axes = list(axes)
+        self.labels = [f'{name} axis {axis}' for axis in self.axes]
+        self.controller = controller
+        self.shared = controller is not None
+
+    def open(self):
+        if not self.shared:
+            self.controller = self._open()
+
+    def close(self):
+        if not self.shared and self.controller is not None:
+            self._close()
+            self.controller = None
+
+    def _open(self):
+        """ Open a dedicated link, returns the driver"""
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def _read_positions(self) -> np.ndarray:
+        raise NotImplementedError
+
+    def read(self):
+        """ Read all the axes
+
+        Returns
+        -------
+        float: timestamp (time.time()) taken at the middle of the transaction
+        np.ndarray: positions, one per axis
+        """
+        time_start = time.time()
+        positions = np.asarray(self._read_positions(), dtype=float)
+        return (time_start + time.time()) / 2, positions
+
+
+class SMC100Reader(PositionReader):
+    """SMC100 controllers chained on one serial port, axes are the controller addresses"""
+
+    def __init__(self, com_port: str, axes=(1,), controller=None):
+        super().__init__(f'SMC100 {com_port}', axes, controller)
+        self.com_port = com_port
+
+    def _open(self):
+        from pymodaq_plugins_newport.hardware.smc100 import SMC100
+        controller = SMC100()
+        controller.init_communication(self.com_port)
+        return controller
+
+    def _read_positions(self):
+        return self.controller.get_positions(self.axes)
+
+    def _close(self):
+        self.controller.close_communication()
+
+
+class ESP100Reader(PositionReader):
+
+    def __init__(self, com_port: str, axes=(1,), controller=None):
+        super().__init__(f'ESP100 {com_port}', axes, controller)
+        self.com_port = com_port
+
+    def _open(self):
+        from pymodaq_plugins_newport.hardware.esp100 import ESP100
+        controller = ESP100()
+        # a reader does not power the motors
+        controller.init_communication(self.com_port, self.axes[0], motor_on=False)
+        return controller
+
+    def _read_positions(self):
+        return self.controller.get_positions(self.axes)
+
+    def _close(self):
+        # do not use close_communication that turns the motors off
+        self.controller._controller.close()
+
+
+class XPSGroupReader(PositionReader):
+    """All the positioners of a XPS group, on a dedicated socket"""
+
+    def __init__(self, ip_address: str, group: str, n_positioners=1, port=5001):
+        super().__init__(f'XPS {group}', range(1, n_positioners + 1))
+        self.ip_address = ip_address
+        self.port = port
+        self.group = group
+        self._socket_id = None
+
+    def _open(self):
+        from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS
+        controller = XPS()
+        self._socket_id = controller.TCP_ConnectToServer(self.ip_address, self.port, 5)
+        if self._socket_id == -1:
+            raise IOError(f'Could not connect to the XPS at {self.ip_address}:{self.port}')
+        return controller
+
+    def _read_positions(self):
+        from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error
+        return check_xps_error(self.controller.GroupPositionCurrentGet(self._socket_id, self.group, len(self.axes)),
+                               'GroupPositionCurrentGet')
+
+    def _close(self):
+        self.controller.TCP_CloseSocket(self._socket_id)
+
+
+class AgilisReader(PositionReader):
+    """
+    Step counters of the axes of one channel of an Agilis controller. The counters of a shared controller are the
+    ones kept by the driver: reading the controller would require selecting the channel, while the plugin may be
+    moving the axes of another one
+    """
+    units = 'step'
+
+    def __init__(self, com_port: str, channel=1, axes=(1, 2), controller=None):
+        super().__init__(f'Agilis {com_port} CH{channel}', axes, controller)
+        self.com_port = com_port
+        self.channel = channel
+
+    def _open(self):
+        from pymodaq_plugins_newport.hardware.agilis_serial import AgilisSerial
+        controller = AgilisSerial()
+        controller.init_com_remote(self.com_port, reset=False)
+        controller.ensure_channel(self.channel)
+        return controller
+
+    def _read_positions(self):
+        if self.shared:
+            return [self.controller.get_step_counter(axis, read_controller=False, channel=self.channel)
+                    for axis in self.axes]
+        return self.controller.get_step_counters(self.axes)
+
+    def _close(self):
+        self.controller.close()
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive wait for the end of the moves of open loop actuators (Agilis).
+
+Instead of polling the status at a fixed period from the start of a move, the duration of the move is predicted from
+its number of steps with a per axis model (duration = overhead + steps / step rate), the wait sleeps until shortly
+before the predicted end, then polls with an increasing period. The measured durations refine the model, so that
+the serial traffic during moves drops and the end of the short moves is detected sooner::
+
+    waiter = ReadyWaiter()
+    start = time.perf_counter()
+    ... start a move of 500 steps ...
+    waiter.wait(key, 500, start, is_ready, timeout=10.)
+"""
+import time
+from collections import deque
+
+DEFAULT_STEP_RATE = 750.  # steps/s
+DEFAULT_OVERHEAD = 0.02  # s
+
+
+class MoveDurationModel:
+    """ Duration of the moves of one axis: overhead + |steps| / step_rate, fitted on the last moves
+
+    Parameters
+    ----------
+    step_rate: float
+        initial step rate in steps/s
+    overhead: float
+        initial fixed duration of a move in s
+    n_samples: int
+        number of moves used for the fit
+    """
+
+    def __init__(self, step_rate=DEFAULT_STEP_RATE, overhead=DEFAULT_OVERHEAD, n_samples=50):
+        self.step_rate = step_rate
+        self.overhead = overhead
+        self._samples = deque(maxlen=n_samples)
+        self.n_moves = 0
+        self.error = 0.
+        self.scale = 1.  # < 1 after moves ended before their first poll, until the next measured duration
+
+    def __repr__(self):
+        return f'MoveDurationModel(step_rate={self.step_rate:.1f}, overhead={self.overhead:.3f}, ' \
+               f'n_moves={self.n_moves})'
+
+    def predict(self, steps: int) -> float:
+        return self.scale * self._fitted(steps)
+
+    def _fitted(self, steps: int) -> float:
+        return self.overhead + abs(steps) / self.step_rate
+
+    def record_upper_bound(self, steps: int, duration: float):
+        """ A move ended before `duration` without its actual duration being known: it is not used by the fit,
+        only the following predictions are shortened until a duration is measured again"""
+        fitted = self._fitted(steps)
+        if 0 < duration < fitted:
+            self.scale = duration / fitted
+
+    def record(self, steps: int, duration: float):
+        """ Add a measured move duration and fit the model again"""
+        self.scale = 1.
+        # moving average of the absolute prediction error
+        error = abs(duration - self._fitted(steps))
+        self.error = error if self.n_moves == 0 else 0.8 * self.error + 0.2 * error
+        self.n_moves += 1
+        self._samples.append((abs(steps), duration))
+        self._fit()
+
+    def _fit(self):
+        n = len(self._samples)
+        mean_steps = sum(steps for steps, _ in self._samples) / n
+        mean_duration = sum(duration for _, duration in self._samples) / n
+        variance = sum((steps - mean_steps) ** 2 for steps, _ in self._samples)
+        if variance > 0:
+            slope = sum((steps - mean_steps) * (duration - mean_duration)
+                        for steps, duration in self._samples) / variance
+            if slope > 0:
+                self.step_rate = 1 / slope
+                self.overhead = max(0., mean_duration - slope * mean_steps)
+                return
+        # all the moves have the same length (or an inconsistent fit): only the step rate is scaled
+        if mean_steps > 0 and mean_duration > self.overhead:
+            self.step_rate = mean_steps / (mean_duration - self.overhead)
+        else:
+            self.overhead = mean_duration
+
+
+class ReadyWaiter:
+    """ Wait for the end of moves from their predicted duration, with a model per key (for instance (channel, axis))
+
+    Parameters
+    ----------
+    margin: float
+        fraction of the predicted duration slept before the first poll, as long as the model is not trained. Then the
+        first poll is done twice the prediction error before the predicted end
+    min_poll: float
+        first polling period in s, doubled at each poll up to max_poll
+    max_poll: float
+    """
+
+    def __init__(self, margin=0.8, min_poll=0.005, max_poll=0.05):
+        self.margin = margin
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.models = {}
+
+    def model(self, key) -> MoveDurationModel:
+        if key not in self.models:
+            self.models[key] = MoveDurationModel()
+        return self.models[key]
+
+    def predict(self, key, steps: int) -> float:
+        return self.model(key).predict(steps)
+
+    def first_poll_delay(self, key, steps: int) -> float:
+        """ Time from the start of a move to the first status poll"""
+        model = self.model(key)
+        predicted = model.predict(steps)
+        guard = (1 - self.margin) * predicted
+        if model.n_moves >= 3:
+            guard = min(guard, 2 * model.error + self.min_poll)
+        return predicted - guard
+
+    def wait(self, key, steps: int, time_start: float, is_ready, timeout: float) -> float:
+        """
+        Wait until is_ready() returns True
+
+        Parameters
+        ----------
+        key: hashable
+            model of the move
+        steps: int
+            number of steps of the move, None if unknown (the polling starts immediately and nothing is recorded)
+        time_start: float
+            time.perf_counter() at the start of the move
+        is_ready: callable
+            status query of the axis
+        timeout: float
+            in s from the call of wait
+
+        Returns
+        -------
+        float: the measured duration of the move in s
+
+        Raises
+        ------
+        TimeoutError
+        """
+        wait_start = time.perf_counter()
+        slept = False
+        if steps is not None:
+            sleep_time = time_start + self.first_poll_delay(key, steps) - wait_start
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+                slept = True
+        poll_period = self.min_poll
+        n_polls = 0
+        while True:
+            n_polls += 1
+            if is_ready():
+                break
+            if time.perf_counter() - wait_start > timeout:
+                raise TimeoutError(f'the move did not end within {timeout} s')
+            time.sleep(poll_period)
+            poll_period = min(2 * poll_period, self.max_poll)
+        duration = time.perf_counter() - time_start
+        if steps is not None:
+            if n_polls == 1 and slept:
+                # ended before the first poll: the duration is only an upper bound of the move duration
+                self.model(key).record_upper_bound(steps, duration)
+            elif n_polls > 1:
+                self.model(key).record(steps, duration)
+            # else the wait started after the end of the move: its duration is unknown
+        return duration
+
+    def stats(self) -> dict:
+        """ key: dict with the fitted step rate and overhead, the number of moves, the prediction error and the
+        scale of the predictions"""
+        return {key: dict(step_rate=model.step_rate, overhead=model.overhead, n_moves=model.n_moves,
+                          error=model.error, scale=model.scale)
+                for key, model in self.models.items()}
@@ -5,16 +5,32 @@ Created on Mon Jan  9 14:59:52 2023
 @author: weber
 """
 
-import pyvisa
-import numpy as np
+from pymodaq_plugins_newport.hardware.transports import open_transport, list_ports
+from pymodaq_plugins_newport.hardware.command_scheduler import CommandScheduler, Priority
+from pymodaq_plugins_newport.hardware.telemetry import telemetry, serial_command_key
+from pymodaq_plugins_newport.hardware.session_recorder import record_traffic
 
 
 class SerialBase(object):
-
-    def __init__(self):
+    """
+    Attributes
+    ----------
+    drain_timeout: int
+        time in ms without any received line ending the reads of the replies of unknown length
+
+    Parameters
+    ----------
+    backend: str
+        transport of the serial line, see transports.TRANSPORTS
+    """
+
+    def __init__(self, backend='pyvisa'):
         super().__init__()
         self._controller = None
-        self._VISA_rm = pyvisa.ResourceManager()
+        self.drain_timeout = 50
+        self._scheduler = CommandScheduler(self.__class__.__name__)
+        self._traffic_name = self.__class__.__name__
+        self.backend = backend
         self.com_ports = self.get_ressources()
 
     @property
@@ -27,46 +43,86 @@ class SerialBase(object):
         self._controller.timeout = to
 
     def get_ressources(self):
-        infos=self._VISA_rm.list_resources_info()
-        com_ports = [infos[key].alias for key in infos.keys()]
-        return com_ports
-    
-    def init_communication(self, com_port, axis=1):
-        if com_port in self.com_ports:
-            self._controller = self._VISA_rm.open_resource(com_port)
+        return list_ports(self.backend)
+
+    def is_valid_port(self, com_port) -> bool:
+        """ Only the pyvisa ports are listed, pyserial URLs and device servers addresses are not checked"""
+        return self.backend != 'pyvisa' or com_port in self.com_ports
 
-            self._controller.data_bits = 8
-            self._controller.stop_bits = pyvisa.constants.StopBits['one']
-            self._controller.parity = pyvisa.constants.Parity['none']
+    def init_communication(self, com_port, axis=1):
+        if self.is_valid_port(com_port):
+            self._controller = open_transport(com_port, self.backend, data_bits=8, stop_bits=1, parity='none')
+            self._scheduler.name = f'{self.__class__.__name__} on {com_port}'
+            self._traffic_name = f'{self.__class__.__name__}:{com_port}'
             self.timeout = 2000
         
 
+    def init_replay(self, session, com_port):
+        """ Use a recorded session (see session_recorder.ReplaySession) instead of the serial port"""
+        self._controller = session.resource(f'{self.__class__.__name__}:{com_port}')
+        self._traffic_name = self._controller.transport
+        self._timeout = self._controller.timeout
+
     def close_communication(self, axis=1):
         self._controller.close()
-        self._VISA_rm.close() 
         
     def get_controller_infos(self, axis=1):
-        self._write_command(f'{axis}ID?')
-        return self._get_read()
+        return self._write_read(f'{axis}ID?', Priority.COMMAND)
 
-    def _query(self, command):
-        ret = self._controller.query(command)
+    def _query(self, command, priority=Priority.COMMAND):
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__, serial_command_key(command)):
+            record_traffic(self._traffic_name, 'tx', command)
+            ret = self._controller.query(command)
+            record_traffic(self._traffic_name, 'rx', ret)
         return ret
 
-    def _write_command(self, command):
-        self._controller.write(command)
-
-    
-    def _get_read(self):
-        self._controller.timeout = 50
+    def _write_command(self, command, priority=Priority.COMMAND):
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__, serial_command_key(command)):
+            record_traffic(self._traffic_name, 'tx', command)
+            self._controller.write(command)
+
+    def _write_read(self, command, priority=Priority.POLL):
+        """ Write a command and read its reply as a single transaction"""
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__, serial_command_key(command)):
+            record_traffic(self._traffic_name, 'tx', command)
+            self._controller.write(command)
+            return self._read_all()
+
+    def _write_many_read(self, commands, priority=Priority.POLL):
+        """ Write several commands back to back and read all their replies as a single transaction"""
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__,
+                                                             f'{serial_command_key(commands[0])} batch'):
+            for command in commands:
+                record_traffic(self._traffic_name, 'tx', command)
+                self._controller.write(command)
+            return self._read_all()
+
+    def _query_many(self, commands, priority=Priority.POLL) -> list:
+        """ Write several commands back to back and read one reply line per command as a single transaction"""
+        with self._scheduler.slot(priority), telemetry.timed(self.__class__.__name__,
+                                                             f'{serial_command_key(commands[0])} batch'):
+            for command in commands:
+                record_traffic(self._traffic_name, 'tx', command)
+                self._controller.write(command)
+            replies = []
+            for _ in commands:
+                reply = self._controller.read()
+                record_traffic(self._traffic_name, 'rx', reply)
+                replies.append(reply)
+        return replies
+
+    def _read_all(self):
+        """ Read lines until none is received within the drain timeout (50 ms)"""
         info = ''
-        try:
-            while True:
-                info += self._controller.read()+'\n'
-        except pyvisa.errors.VisaIOError as e:
-            pass
-        self._controller.timeout = self._timeout
+        for reply in self._controller.read_lines(self.drain_timeout):
+            record_traffic(self._traffic_name, 'rx', reply)
+            info += reply+'\n'
+        record_traffic(self._traffic_name, 'timeout')
         return info
+
+    def _get_read(self):
+        with self._scheduler.slot(Priority.POLL), telemetry.timed(self.__class__.__name__, 'read'):
+            return self._read_all()
     
     
     def read(self):
@@ -97,4 +153,8 @@ class SerialBase(object):
         raise NotImplementedError
 
     def stop_motion(self, axis=1):
-        self._write_command(f'{axis}ST')
\ No newline at end of file
+        with self._scheduler.stop_slot():
+            self._write_command(f'{axis}ST', Priority.STOP)
+
+    def get_stop_latency_stats(self) -> dict:
+        return self._scheduler.stop_latency_stats()
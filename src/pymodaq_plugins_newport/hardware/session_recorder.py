@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Wire-level recording and replay of the traffic with the controllers.
+
+While a recording is active, every command sent and every reply received by SerialBase (SMC100, ESP100...),
+AgilisSerial and XPS is appended as one JSON line to the session file::
+
+    {"t": 0.012345, "transport": "SMC100:COM5", "dir": "tx", "data": "1TP"}
+
+`dir` is 'tx' for commands, 'rx' for replies and 'timeout' when a read ended on a timeout. `t` is the time in
+seconds since the start of the recording.
+
+A ReplaySession feeds a recording back, at the recorded speed or faster, through objects mimicking a serial
+transport (for the serial wrappers) or a socket (for the XPS), so production timing problems can be reproduced
+offline and parser or scheduler changes benchmarked against real traffic::
+
+    from pymodaq_plugins_newport.hardware import session_recorder
+    session_recorder.start_recording('session.jsonl')
+    ...
+    session_recorder.stop_recording()
+
+    session = session_recorder.ReplaySession('session.jsonl', speed=10)
+    smc = SMC100()
+    smc.init_replay(session, 'COM5')
+"""
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecorder:
+    """ Append the traffic events to a JSONL file
+
+    Parameters
+    ----------
+    path: str or Path
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._time_start = time.perf_counter()
+        self.n_events = 0
+
+    def record(self, transport: str, direction: str, data: str = ''):
+        line = json.dumps(dict(t=round(time.perf_counter() - self._time_start, 6), transport=transport,
+                               dir=direction, data=data))
+        with self._lock:
+            self._file.write(line + '\n')
+            self.n_events += 1
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+_recorder: SessionRecorder = None
+
+
+def start_recording(path) -> SessionRecorder:
+    """Start recording the traffic of all transports into the given file"""
+    global _recorder
+    stop_recording()
+    _recorder = SessionRecorder(path)
+    logger.info(f'Recording the controllers traffic into {path}')
+    return _recorder
+
+
+def stop_recording():
+    global _recorder
+    if _recorder is not None:
+        recorder, _recorder = _recorder, None
+        recorder.close()
+        logger.info(f'{recorder.n_events} traffic events recorded into {recorder.path}')
+
+
+def is_recording() -> bool:
+    return _recorder is not None
+
+
+def record_traffic(transport: str, direction: str, data: str = ''):
+    """Hook called by the transports, does nothing when no recording is active"""
+    if _recorder is not None:
+        _recorder.record(transport, direction, data)
+
+
+class ReplayMismatch(Exception):
+    pass
+
+
+class ReplaySession:
+    """ Recorded session to be fed back to the wrappers
+
+    Parameters
+    ----------
+    path: str or Path
+        JSONL file written by a SessionRecorder
+    speed: float
+        replay speed factor with respect to the recorded timing, 0 to replay without any delay
+    strict: bool
+        if True, a command differing from the recorded one raises ReplayMismatch, otherwise it is logged
+    """
+
+    def __init__(self, path, speed=1., strict=False):
+        self.speed = speed
+        self.strict = strict
+        self._events = defaultdict(deque)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip() != '':
+                    event = json.loads(line)
+                    self._events[event['transport']].append(event)
+
+    @property
+    def transports(self):
+        return list(self._events.keys())
+
+    def remaining(self, transport: str) -> int:
+        return len(self._events[transport])
+
+    def resource(self, transport: str) -> 'ReplayResource':
+        """transport like object replaying the given serial transport"""
+        return ReplayResource(self, transport)
+
+    def socket(self, transport: str) -> 'ReplaySocket':
+        """socket like object replaying the given XPS transport"""
+        return ReplaySocket(self, transport)
+
+    def _wait(self, event, reference):
+        """ Sleep so that the delay between the reference event and this event is the recorded one / speed"""
+        if self.speed and reference is not None:
+            recorded_event_time, replayed_time = reference
+            delay = (event['t'] - recorded_event_time) / self.speed - (time.perf_counter() - replayed_time)
+            if delay > 0:
+                time.sleep(delay)
+
+    def send(self, transport: str, data: str):
+        events = self._events[transport]
+        while len(events) > 0 and events[0]['dir'] != 'tx':
+            events.popleft()  # replies not consumed by the replayed code
+        if len(events) == 0:
+            raise ReplayMismatch(f'No more recorded command on {transport} while sending {data}')
+        event = events.popleft()
+        if event['data'] != data:
+            message = f'Replayed command {data} on {transport} differs from the recorded one: {event["data"]}'
+            if self.strict:
+                raise ReplayMismatch(message)
+            logger.warning(message)
+        return event
+
+    def receive(self, transport: str, reference):
+        """ Next recorded reply of the transport, None if the recorded read ended on a timeout"""
+        events = self._events[transport]
+        if len(events) == 0 or events[0]['dir'] == 'tx':
+            return None
+        event = events.popleft()
+        self._wait(event, reference)
+        if event['dir'] == 'timeout':
+            return None
+        return event['data']
+
+
+class ReplayResource:
+    """ Mimics the transports (see transports.Transport) used by the serial wrappers"""
+    CR = '\r'
+    LF = '\n'
+
+    def __init__(self, session: ReplaySession, transport: str):
+        self._session = session
+        self.transport = transport
+        self._reference = None
+        self.timeout = 2000
+        self.read_termination = None
+        self.write_termination = None
+
+    def _timeout_error(self):
+        from pymodaq_plugins_newport.hardware.transports import TransportTimeout
+        return TransportTimeout(f'Recorded timeout on {self.transport}')
+
+    def write(self, command: str):
+        event = self._session.send(self.transport, command)
+        self._reference = (event['t'], time.perf_counter())
+
+    def read(self) -> str:
+        reply = self._session.receive(self.transport, self._reference)
+        if reply is None:
+            raise self._timeout_error()
+        return reply
+
+    def read_lines(self, timeout) -> list:
+        lines = []
+        while True:
+            reply = self._session.receive(self.transport, self._reference)
+            if reply is None:
+                return lines
+            lines.append(reply)
+
+    def query(self, command: str) -> str:
+        self.write(command)
+        return self.read()
+
+    def read_ascii_values(self, converter='f', separator=','):
+        return [float(value) for value in self.read().split(separator)]
+
+    def close(self):
+        pass
+
+
+class ReplaySocket:
+    """ Mimics the part of a socket used by the XPS driver"""
+
+    def __init__(self, session: ReplaySession, transport: str):
+        self._session = session
+        self.transport = transport
+        self._reference = None
+
+    def send(self, data: bytes):
+        event = self._session.send(self.transport, data.decode())
+        self._reference = (event['t'], time.perf_counter())
+        return len(data)
+
+    def recv(self, size: int) -> bytes:
+        reply = self._session.receive(self.transport, self._reference)
+        if reply is None:
+            import socket
+            raise socket.timeout()
+        return reply.encode()
+
+    def settimeout(self, timeout):
+        pass
+
+    def setblocking(self, flag):
+        pass
+
+    def close(self):
+        pass
@@ -9,38 +9,70 @@ Wrapper around the serial communication with a particular SMC100 controller whos
 
 """
 
-import pyvisa
-import numpy as np
+import re
+
 from pymodaq_plugins_newport.hardware.serial_base import SerialBase
+from pymodaq_plugins_newport.hardware.command_scheduler import Priority
+
+# controller states of the TS reply (4 hexadecimal characters of positioner errors then the state)
+READY_STATES = ['32', '33', '34', '35']
+MOVING_STATES = ['1E', '1F', '28']
 
 
 class SMC100(SerialBase):
    
     def init_communication(self, com_port, axis=1):
-        if com_port in self.com_ports:
+        if self.is_valid_port(com_port):
             super().init_communication(com_port, axis)
             self._controller.baud_rate = 57600
         else:
             raise IOError('{:s} is not a valid port'.format(com_port))
 
     def _str_to_float(self, command:str, string:str) -> float:
-        return float(string.split(f'{command}')[1][:-2])
+        # the transports remove the read termination, the replies only end with the line separator of _read_all
+        return float(string.split(f'{command}')[1].strip())
 
 
     def get_position(self, axis=1):
         """ return the given axis position always in mm
         """
         command = f'{axis}TP'
-        self._write_command(command)
-        pos = self._str_to_float(command, self.read())
+        pos = self._str_to_float(command, self._write_read(command))
         return pos
     
+    def get_positions(self, axes=(1,)) -> 'np.ndarray':
+        """ return the positions (in mm) of several controllers of the chain in a single transaction
+        """
+        import numpy as np
+        replies = self._write_many_read([f'{axis}TP' for axis in axes])
+        positions = {}
+        for match in re.finditer(r'(\d+)TP([-+0-9.eE]+)', replies):
+            positions[int(match.group(1))] = float(match.group(2))
+        return np.array([positions.get(axis, np.nan) for axis in axes])
+
+    def get_state(self, axis=1):
+        """
+        Returns
+        -------
+        int: the positioner errors
+        str: the controller state, see READY_STATES and MOVING_STATES
+        """
+        command = f'{axis}TS'
+        status = self._query(command, Priority.POLL).strip()[len(command):]
+        return int(status[:4], 16), status[4:6]
+
+    def is_moving(self, axis=1) -> bool:
+        return self.get_state(axis)[1] in MOVING_STATES
+
     def get_velocity(self, axis=1):
         command = f'{axis}VA?'
-        self._write_command(command)
-        pos = self._str_to_float(command[:-1],  self.read())
+        pos = self._str_to_float(command[:-1], self._write_read(command, Priority.COMMAND))
         return pos
     
+    def get_acceleration(self, axis=1):
+        command = f'{axis}AC?'
+        return self._str_to_float(command[:-1], self._write_read(command, Priority.COMMAND))
+
     def get_velocity_max(self, axis=1):
         raise NotImplementedError
     
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Synchronized moves of several controllers, for scans moving for instance a SMC100 axis, an ESP100 axis and a XPS
+group at each point.
+
+The moves of a point are sent to all the controllers at once, one thread per controller, and each thread waits for
+the end of its move as reported by the controller: the status register of the serial controllers (TS, MD?), the
+reply of GroupMoveAbsolute for the XPS, sent on its own socket, which is returned at the end of the motion. The
+point ends when the slowest controller is done, so that the step time is the longest move instead of the sum of the
+moves and of their polling periods::
+
+    barrier = SynchronizedMove({'smc': SerialMember(smc, axis=1),
+                                'esp': SerialMember(esp, axis=2),
+                                'xps': XPSGroupMember('192.168.0.254', 'Group2')})
+    for point in scan:  # {'smc': 1.5, 'esp': -0.2, 'xps': [10., 5.]}
+        timestamp = barrier.move(point)
+        grab(timestamp)
+    print(benchmark_barrier(barrier, scan[:20]))
+    barrier.close()
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from pymodaq_plugins_newport.hardware.telemetry import telemetry, LatencyHistogram
+
+
+class SynchronizedMoveError(Exception):
+    pass
+
+
+class SerialMember:
+    """ Axis of a serial controller having move_axis and is_moving (SMC100, ESP100, ConexAGAP)
+
+    Parameters
+    ----------
+    controller: SerialBase
+        driver with an opened communication, it can be shared with a plugin
+    axis: int
+        controller address or axis number
+    axis_name: str
+        'U' or 'V' for the ConexAGAP, None for the other controllers
+    poll_period: float
+        period in s of the status queries during the move
+    """
+
+    def __init__(self, controller, axis=1, axis_name=None, poll_period=0.002):
+        self.controller = controller
+        self.axis = axis
+        self.axis_name = axis_name
+        self.poll_period = poll_period
+
+    def move(self, position: float, timeout: float) -> float:
+        """ Move to the absolute position and return time.perf_counter() at the end of the move"""
+        if self.axis_name is None:
+            self.controller.move_axis('ABS', self.axis, position)
+        else:
+            self.controller.move_axis('ABS', self.axis, position, self.axis_name)
+        time_start = time.perf_counter()
+        while True:
+            if not self.controller.is_moving(self.axis):
+                return time.perf_counter()
+            if time.perf_counter() - time_start > timeout:
+                raise TimeoutError(f'The move of the axis {self.axis} did not end within {timeout} s')
+            time.sleep(self.poll_period)
+
+    def stop(self):
+        self.controller.stop_motion(self.axis)
+
+    def close(self):
+        pass  # the controller is owned by the caller
+
+
+class XPSGroupMember:
+    """ Group, or positioner, of a XPS controller moved on a dedicated socket
+
+    Parameters
+    ----------
+    ip_address: str
+    group: str
+        group name, or positioner name (Group2.Pos) to move a single positioner
+    port: int
+    timeout: float
+        connection timeout in s, the moves are limited by the timeout given to move
+    """
+
+    def __init__(self, ip_address: str, group: str, port=5001, timeout=60.):
+        from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS
+        self.group = group
+        self.ip_address = ip_address
+        self.port = port
+        self._xps = XPS()
+        self._socket_id = self._xps.TCP_ConnectToServer(ip_address, port, timeout)
+        self._socket_timeout = None  # the sockets of TCP_ConnectToServer are blocking
+        self._stop_socket_id = self._xps.TCP_ConnectToServer(ip_address, port, 5.)
+        if self._socket_id == -1 or self._stop_socket_id == -1:
+            raise IOError(f'Could not connect to the XPS at {ip_address}:{port}')
+
+    def move(self, position, timeout: float) -> float:
+        """ Move to the absolute position (one value per positioner of the group) and return time.perf_counter()
+        at the end of the move
+
+        The reply of GroupMoveAbsolute is only sent at the end of the motion: the timeout is the one of the socket.
+        """
+        from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error
+        positions = list(position) if hasattr(position, '__iter__') else [position]
+        if timeout != self._socket_timeout:
+            self._xps.TCP_SetTimeout(self._socket_id, timeout)
+            self._socket_timeout = timeout
+        ret = self._xps.GroupMoveAbsolute(self._socket_id, self.group, positions)
+        if ret[0] == -2:
+            # the late reply would be read as the reply of the next move: use a new socket
+            self._xps.TCP_CloseSocket(self._socket_id)
+            self._socket_id = self._xps.TCP_ConnectToServer(self.ip_address, self.port, timeout)
+            self._socket_timeout = None
+            raise TimeoutError(f'No end of the move of {self.group} within {timeout} s')
+        check_xps_error(ret, 'GroupMoveAbsolute')
+        return time.perf_counter()
+
+    def stop(self):
+        self._xps.GroupMoveAbort(self._stop_socket_id, self.group.split('.')[0])
+
+    def close(self):
+        self._xps.TCP_CloseSocket(self._socket_id)
+        self._xps.TCP_CloseSocket(self._stop_socket_id)
+
+
+class SynchronizedMove:
+    """ Move several controllers together and wait for all of them
+
+    Parameters
+    ----------
+    members: dict
+        name: member (SerialMember, XPSGroupMember or any object with move(position, timeout) and stop())
+    timeout: float
+        timeout of the moves in s
+    """
+
+    def __init__(self, members: dict, timeout=60.):
+        self.members = dict(members)
+        self.timeout = timeout
+        self.last_durations = {}  # name: duration in s of the last move of the member, from the start of the point
+        self._executor = ThreadPoolExecutor(max_workers=len(self.members), thread_name_prefix='synchronized_move')
+
+    def move(self, targets: dict) -> float:
+        """ Move the members to their target positions, all at once
+
+        Parameters
+        ----------
+        targets: dict
+            name: absolute position, the members without target do not move
+
+        Returns
+        -------
+        float: timestamp (time.time()) of the end of the slowest move
+
+        Raises
+        ------
+        SynchronizedMoveError: if a move failed or timed out, the other members are then stopped
+        """
+        if len(targets) == 0:
+            self.last_durations = {}
+            return time.time()
+        time_start = time.perf_counter()
+        futures = {self._executor.submit(self.members[name].move, position, self.timeout): name
+                   for name, position in targets.items()}
+        done, not_done = wait(futures, self.timeout + 1.)
+        errors = {futures[future]: future.exception() for future in done if future.exception() is not None}
+        errors.update({futures[future]: TimeoutError('no end of move') for future in not_done})
+        if len(errors) > 0:
+            for name in targets:
+                try:
+                    self.members[name].stop()
+                except Exception:
+                    pass
+            raise SynchronizedMoveError(', '.join([f'{name}: {error}' for name, error in errors.items()]))
+        ends = {futures[future]: future.result() for future in done}
+        self.last_durations = {name: end - time_start for name, end in ends.items()}
+        time_end = max(ends.values())
+        telemetry.record('synchronized move', ', '.join(targets), time.perf_counter() - time_start)
+        return time.time() - (time.perf_counter() - time_end)
+
+    def run(self, points, callback=None) -> list:
+        """ Move through a list of points
+
+        Parameters
+        ----------
+        points: list of dict
+            targets of each point, see move
+        callback: callable
+            called with the index of the point and its timestamp once all the members are at the point
+
+        Returns
+        -------
+        list of float: the completion timestamp of each point
+        """
+        timestamps = []
+        for index, targets in enumerate(points):
+            timestamps.append(self.move(targets))
+            if callback is not None:
+                callback(index, timestamps[-1])
+        return timestamps
+
+    def stop(self):
+        for member in self.members.values():
+            member.stop()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for member in self.members.values():
+            member.close()
+
+
+def benchmark_barrier(barrier: SynchronizedMove, points, n_repeats=1) -> dict:
+    """ Per point dead time of the synchronized moves compared to moves sent and awaited one controller after the
+    other (the behavior of independent plugins)
+
+    The dead time of a point is its step time beyond its longest move, the duration of a move being measured from its
+    own start to its detected end.
+
+    Returns
+    -------
+    dict: 'synchronized' and 'sequential': dict with the step and dead times (count, mean, p50, p99 and max in s)
+    """
+    results = {}
+    for mode in ['synchronized', 'sequential']:
+        step_times = LatencyHistogram()
+        dead_times = LatencyHistogram()
+        for _ in range(n_repeats):
+            for targets in points:
+                time_start = time.perf_counter()
+                if mode == 'synchronized':
+                    barrier.move(targets)
+                    longest = max(barrier.last_durations.values(), default=0.)
+                else:
+                    longest = 0.
+                    for name, position in targets.items():
+                        move_start = time.perf_counter()
+                        longest = max(longest,
+                                      barrier.members[name].move(position, barrier.timeout) - move_start)
+                step_time = time.perf_counter() - time_start
+                step_times.record(step_time)
+                dead_times.record(max(0., step_time - longest))
+        results[mode] = {name: dict(count=histogram.count, mean=histogram.mean, p50=histogram.percentile(50),
+                                    p99=histogram.percentile(99), max=histogram.max)
+                         for name, histogram in [('step_time', step_times), ('dead_time', dead_times)]}
+    return results
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Per-command telemetry of the communication with the controllers: counts, latency histograms, timeouts and
+retries, recorded by every transport (serial controllers, Agilis, Conex, XPS sockets).
+
+The histograms are HDR-like: latencies are stored in integer microseconds into log-linear buckets (16
+sub-buckets per power of two, i.e. about 6% relative precision) kept in a sparse dict, so that recording is
+a few integer operations whatever the dynamic range.
+
+Usage::
+
+    from pymodaq_plugins_newport.hardware.telemetry import telemetry
+    print(telemetry.report())
+    telemetry.stats('SMC100', 'TP').percentile(99)
+"""
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < SUB_BUCKET_COUNT:
+        return value_us
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKET_COUNT * (shift + 1) + (value_us >> shift) - SUB_BUCKET_COUNT
+
+
+def _bucket_value(index: int) -> int:
+    """Lower bound in microseconds of the given bucket"""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_COUNT - 1
+    return (SUB_BUCKET_COUNT + index % SUB_BUCKET_COUNT) << shift
+
+
+class LatencyHistogram:
+    """ Log-linear histogram of latencies, values are recorded in seconds"""
+
+    def __init__(self):
+        self._buckets = {}
+        self.count = 0
+        self.total = 0.
+        self.min = None
+        self.max = None
+
+    def record(self, latency: float):
+        index = _bucket_index(int(latency * 1e6))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += latency
+        if self.min is None or latency < self.min:
+            self.min = latency
+        if self.max is None or latency > self.max:
+            self.max = latency
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count > 0 else None
+
+    def percentile(self, percent: float):
+        """ Latency in seconds below which `percent` % of the recorded values are (bucket precision)"""
+        if self.count == 0:
+            return None
+        threshold = self.count * percent / 100
+        cumulated = 0
+        for index in sorted(self._buckets):
+            cumulated += self._buckets[index]
+            if cumulated >= threshold:
+                return min(_bucket_value(index) * 1e-6, self.max)
+        return self.max
+
+    def buckets(self):
+        """ List of (lower bound in seconds, count) for the non empty buckets"""
+        return [(_bucket_value(index) * 1e-6, self._buckets[index]) for index in sorted(self._buckets)]
+
+
+class CommandStats:
+    """ Statistics of one command on one transport"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.timeouts = 0
+        self.retries = 0
+        self.errors = 0
+
+    @property
+    def count(self) -> int:
+        return self.histogram.count
+
+    def percentile(self, percent: float):
+        return self.histogram.percentile(percent)
+
+    def as_dict(self) -> dict:
+        return dict(count=self.count, timeouts=self.timeouts, retries=self.retries, errors=self.errors,
+                    total=self.histogram.total, mean=self.histogram.mean, min=self.histogram.min,
+                    p50=self.percentile(50), p99=self.percentile(99), max=self.histogram.max)
+
+
+_serial_mnemonic = re.compile(r'^\d*([A-Za-z]{2})')
+
+
+def serial_command_key(command: str) -> str:
+    """ Two letters mnemonic of a Newport ASCII command: '1PA0.5' -> 'PA', '2TS' -> 'TS'"""
+    match = _serial_mnemonic.match(command)
+    return match.group(1).upper() if match is not None else command
+
+
+def xps_command_key(command: str) -> str:
+    """ API name of an XPS command: 'GroupPositionCurrentGet(Group1,double *)' -> 'GroupPositionCurrentGet'"""
+    return command.split('(', 1)[0]
+
+
+class Telemetry:
+    """ Registry of the command statistics of all transports"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._log_thread = None
+        self._log_stop = threading.Event()
+        self.enabled = True
+
+    def _get(self, transport: str, command: str) -> CommandStats:
+        key = (transport, command)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats.setdefault(key, CommandStats())
+        return stats
+
+    def record(self, transport: str, command: str, latency: float, timeout=False, error=False):
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._get(transport, command)
+            stats.histogram.record(latency)
+            if timeout:
+                stats.timeouts += 1
+            if error:
+                stats.errors += 1
+
+    def record_retry(self, transport: str, command: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._get(transport, command).retries += 1
+
+    @contextmanager
+    def timed(self, transport: str, command: str):
+        """ Context manager recording the duration of its block, TimeoutError are counted as timeouts and any
+        other exception as an error"""
+        time_start = time.perf_counter()
+        timeout = False
+        error = False
+        try:
+            yield
+        except TimeoutError:
+            timeout = True
+            raise
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(transport, command, time.perf_counter() - time_start, timeout=timeout, error=error)
+
+    def stats(self, transport: str, command: str) -> CommandStats:
+        with self._lock:
+            return self._get(transport, command)
+
+    def transports(self):
+        with self._lock:
+            return sorted({transport for transport, _ in self._stats})
+
+    def summary(self, transport: str = None) -> dict:
+        """ Statistics as nested dicts: {transport: {command: {count, timeouts, retries, mean, p99...}}}"""
+        with self._lock:
+            items = list(self._stats.items())
+        summary = {}
+        for (stats_transport, command), stats in sorted(items):
+            if transport is None or stats_transport == transport:
+                summary.setdefault(stats_transport, {})[command] = stats.as_dict()
+        return summary
+
+    def report(self, transport: str = None) -> str:
+        """ Human readable table of the statistics, latencies in ms"""
+        lines = [f'{"transport":<24}{"command":<40}{"count":>8}{"total(s)":>10}{"mean":>9}{"p50":>9}{"p99":>9}'
+                 f'{"max":>9}{"timeouts":>10}{"retries":>9}']
+        for stats_transport, commands in self.summary(transport).items():
+            for command, stats in commands.items():
+                latencies = ''.join([f'{stats[key] * 1000:>9.2f}' if stats[key] is not None else f'{"-":>9}'
+                                     for key in ('mean', 'p50', 'p99', 'max')])
+                lines.append(f'{stats_transport:<24}{command:<40}{stats["count"]:>8}{stats["total"]:>10.3f}'
+                             f'{latencies}{stats["timeouts"]:>10}{stats["retries"]:>9}')
+        return '\n'.join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def start_periodic_logging(self, interval=60., level=logging.INFO):
+        """ Log the report every `interval` seconds from a daemon thread"""
+        self.stop_periodic_logging()
+        self._log_stop.clear()
+
+        def log_loop():
+            while not self._log_stop.wait(interval):
+                logger.log(level, 'Communication telemetry:\n' + self.report())
+
+        self._log_thread = threading.Thread(target=log_loop, name='newport_telemetry', daemon=True)
+        self._log_thread.start()
+
+    def stop_periodic_logging(self):
+        if self._log_thread is not None:
+            self._log_stop.set()
+            self._log_thread.join()
+            self._log_thread = None
+
+
+telemetry = Telemetry()
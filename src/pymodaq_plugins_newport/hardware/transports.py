@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+Transports of the ASCII serial controllers (SerialBase subclasses, AgilisSerial): the wrappers talk to an object
+with the part of the pyvisa resource interface they use (write, read, query, read_ascii_values, timeout in ms,
+terminations and serial line settings), provided by one of the backends:
+
+* 'pyvisa': a pyvisa resource, the resource manager being shared by all the transports
+* 'pyserial': a pyserial port, also opening pyserial URLs such as 'socket://host:port' or 'loop://'
+* 'tcp': a raw TCP socket to an Ethernet serial device server, the address being 'host:port'. The serial line
+  settings are the ones configured on the device server
+
+The reads ending on a timeout raise TransportTimeout whatever the backend::
+
+    transport = open_transport('192.168.0.50:4001', 'tcp', baud_rate=57600)
+    print(transport.query('1TP'))
+    print(benchmark_transport(transport, '1TP'))
+"""
+import socket
+import time
+
+TRANSPORTS = ['pyvisa', 'pyserial', 'tcp']
+
+STOP_BITS = {1: 'one', 1.5: 'one_and_a_half', 2: 'two'}
+
+
+class TransportError(IOError):
+    pass
+
+
+class TransportTimeout(TransportError, TimeoutError):
+    """ Read ending on a timeout, also a TimeoutError for the callers (and telemetry.timed) catching those"""
+
+
+_resource_manager = None
+
+
+def get_resource_manager():
+    """ pyvisa ResourceManager shared by all the pyvisa transports, created at the first use"""
+    global _resource_manager
+    if _resource_manager is None:
+        import pyvisa
+        _resource_manager = pyvisa.ResourceManager()
+    return _resource_manager
+
+
+def list_ports(backend='pyvisa') -> list:
+    """ Serial ports available to the backend (aliases, or resource names without alias, for pyvisa)"""
+    if backend == 'pyvisa':
+        infos = get_resource_manager().list_resources_info()
+        return [infos[key].alias if infos[key].alias is not None else key for key in infos.keys()]
+    elif backend == 'pyserial':
+        from serial.tools import list_ports as serial_list_ports
+        return [port.device for port in serial_list_ports.comports()]
+    return []
+
+
+def transport_params(backend='pyvisa') -> list:
+    """ Plugin parameters selecting the transport of a serial controller"""
+    return [{'title': 'Transport:', 'name': 'transport', 'type': 'list', 'limits': TRANSPORTS, 'value': backend},
+            {'title': 'Address:', 'name': 'address', 'type': 'str', 'value': '',
+             'tip': 'pyserial port or URL, or host:port of a serial device server for tcp. The COM port is used'
+                    ' if empty'}]
+
+
+class Transport:
+    """ Base class of the transports
+
+    The line settings are applied to the backend at their first setting, then only when they change. The timeout is
+    applied at the next read if it changed, the drains (read_lines) using their own timeout: alternating reads and
+    drains sets the backend timeout at each change of kind, consecutive drains or reads do not set it at all.
+    """
+    CR = '\r'
+    LF = '\n'
+
+    def __init__(self, address: str):
+        self.address = address
+        self._read_termination = self.CR + self.LF
+        self._write_termination = self.CR + self.LF
+        self._timeout = None  # read timeout of read and query
+        self._applied_timeout = None  # timeout currently set on the backend
+        self._line = dict(baud_rate=None, data_bits=None, stop_bits=None, parity=None)  # None: not set yet
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.address})'
+
+    @property
+    def timeout(self):
+        """ Read timeout in ms"""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        self._timeout = timeout
+
+    def _use_timeout(self, timeout):
+        if timeout != self._applied_timeout:
+            self._apply_timeout(timeout)
+            self._applied_timeout = timeout
+
+    def _apply_timeout(self, timeout):
+        raise NotImplementedError
+
+    @property
+    def read_termination(self):
+        return self._read_termination
+
+    @read_termination.setter
+    def read_termination(self, termination):
+        self._read_termination = termination
+        self._apply_termination()
+
+    @property
+    def write_termination(self):
+        return self._write_termination
+
+    @write_termination.setter
+    def write_termination(self, termination):
+        self._write_termination = termination
+        self._apply_termination()
+
+    def _apply_termination(self):
+        pass
+
+    def _set_line(self, name, value):
+        if self._line[name] != value:
+            self._line[name] = value
+            self._apply_line(name, value)
+
+    def _apply_line(self, name, value):
+        pass  # no serial line for the network transports
+
+    baud_rate = property(lambda self: self._line['baud_rate'],
+                         lambda self, value: self._set_line('baud_rate', value))
+    data_bits = property(lambda self: self._line['data_bits'],
+                         lambda self, value: self._set_line('data_bits', value))
+    stop_bits = property(lambda self: self._line['stop_bits'],
+                         lambda self, value: self._set_line('stop_bits', value))
+    parity = property(lambda self: self._line['parity'],
+                      lambda self, value: self._set_line('parity', value))
+
+    def configure(self, baud_rate=None, data_bits=None, stop_bits=None, parity=None, timeout=None):
+        for name, value in dict(baud_rate=baud_rate, data_bits=data_bits, stop_bits=stop_bits,
+                                parity=parity).items():
+            if value is not None:
+                self._set_line(name, value)
+        if timeout is not None:
+            self.timeout = timeout
+
+    def write(self, command: str):
+        raise NotImplementedError
+
+    def read(self) -> str:
+        self._use_timeout(self._timeout)
+        return self._read()
+
+    def _read(self) -> str:
+        """ Read a line with the timeout set on the backend"""
+        raise NotImplementedError
+
+    def read_lines(self, timeout) -> list:
+        """ Read the lines received until none arrives within timeout (ms), for the replies of unknown length"""
+        self._use_timeout(timeout)
+        lines = []
+        while True:
+            try:
+                lines.append(self._read())
+            except TransportTimeout:
+                return lines
+
+    def query(self, command: str) -> str:
+        self.write(command)
+        return self.read()
+
+    def read_ascii_values(self, converter='f', separator=','):
+        return [float(value) for value in self.read().split(separator)]
+
+    def close(self):
+        raise NotImplementedError
+
+
+class PyvisaTransport(Transport):
+
+    def __init__(self, address: str):
+        super().__init__(address)
+        self._resource = get_resource_manager().open_resource(address)
+        self._apply_termination()
+
+    def _apply_timeout(self, timeout):
+        self._resource.timeout = timeout
+
+    def _apply_line(self, name, value):
+        import pyvisa
+        if name == 'stop_bits':
+            value = pyvisa.constants.StopBits[STOP_BITS[value]]
+        elif name == 'parity':
+            value = pyvisa.constants.Parity[value]
+        setattr(self._resource, name, value)
+
+    def _apply_termination(self):
+        self._resource.read_termination = self.read_termination
+        self._resource.write_termination = self.write_termination
+
+    def write(self, command: str):
+        import pyvisa
+        try:
+            self._resource.write(command)
+        except pyvisa.errors.VisaIOError as e:
+            raise TransportError(str(e)) from e
+
+    def _read(self) -> str:
+        import pyvisa
+        try:
+            return self._resource.read()
+        except pyvisa.errors.VisaIOError as e:
+            if e.error_code == pyvisa.constants.StatusCode.error_timeout:
+                raise TransportTimeout(str(e)) from e
+            raise TransportError(str(e)) from e
+
+    def close(self):
+        self._resource.close()
+
+
+class _StreamTransport(Transport):
+    """ Transports reading bytes up to the read termination"""
+
+    def __init__(self, address: str):
+        super().__init__(address)
+        self._buffer = b''
+
+    def _receive(self) -> bytes:
+        """ Available bytes, b'' on timeout"""
+        raise NotImplementedError
+
+    def _send(self, data: bytes):
+        raise NotImplementedError
+
+    def write(self, command: str):
+        self._send((command + self.write_termination).encode())
+
+    def _read(self) -> str:
+        termination = self.read_termination.encode()
+        deadline = time.perf_counter() + self._applied_timeout / 1000
+        while termination not in self._buffer:
+            if time.perf_counter() > deadline:
+                raise TransportTimeout(f'No reply from {self.address} within {self._applied_timeout} ms')
+            self._buffer += self._receive()
+        line, self._buffer = self._buffer.split(termination, 1)
+        return line.decode(errors='replace')
+
+
+class PyserialTransport(_StreamTransport):
+
+    def __init__(self, address: str):
+        super().__init__(address)
+        import serial
+        self._serial = serial.serial_for_url(address, do_not_open=True)
+        self._serial.open()
+
+    def _apply_timeout(self, timeout):
+        self._serial.timeout = timeout / 1000
+
+    def _apply_line(self, name, value):
+        if name == 'baud_rate':
+            self._serial.baudrate = value
+        elif name == 'data_bits':
+            self._serial.bytesize = value
+        elif name == 'stop_bits':
+            self._serial.stopbits = value
+        elif name == 'parity':
+            self._serial.parity = value[0].upper()
+
+    def _send(self, data: bytes):
+        try:
+            self._serial.write(data)
+        except Exception as e:  # serial.SerialException
+            raise TransportError(str(e)) from e
+
+    def _receive(self) -> bytes:
+        # one byte blocks up to the timeout, then the rest of the input buffer
+        data = self._serial.read(1)
+        if data and self._serial.in_waiting:
+            data += self._serial.read(self._serial.in_waiting)
+        return data
+
+    def close(self):
+        self._serial.close()
+
+
+class TcpTransport(_StreamTransport):
+
+    def __init__(self, address: str):
+        super().__init__(address)
+        host, port = address.rsplit(':', 1)
+        try:
+            self._socket = socket.create_connection((host, int(port)), timeout=2.)
+        except OSError as e:
+            raise TransportError(f'Cannot connect to the serial device server {address}: {e}') from e
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _apply_timeout(self, timeout):
+        self._socket.settimeout(timeout / 1000)
+
+    def _send(self, data: bytes):
+        try:
+            self._socket.sendall(data)
+        except OSError as e:
+            raise TransportError(str(e)) from e
+
+    def _receive(self) -> bytes:
+        try:
+            data = self._socket.recv(4096)
+        except socket.timeout:
+            return b''
+        except OSError as e:
+            raise TransportError(str(e)) from e
+        if not data:
+            raise TransportError(f'Connection to {self.address} closed')
+        return data
+
+    def close(self):
+        self._socket.close()
+
+
+def open_transport(address: str, backend='pyvisa', timeout=2000, **line_settings) -> Transport:
+    """ Open a transport
+
+    Parameters
+    ----------
+    address: str
+        pyvisa resource or alias ('COM5'), pyserial port or URL, or 'host:port' for tcp
+    backend: str
+        one of TRANSPORTS
+    timeout: int
+        read timeout in ms
+    line_settings:
+        baud_rate, data_bits, stop_bits (1, 1.5 or 2) and parity ('none', 'odd', 'even'...)
+    """
+    if backend == 'pyvisa':
+        transport = PyvisaTransport(address)
+    elif backend == 'pyserial':
+        transport = PyserialTransport(address)
+    elif backend == 'tcp':
+        transport = TcpTransport(address)
+    else:
+        raise ValueError(f'Unknown transport {backend}, use one of {TRANSPORTS}')
+    transport.configure(timeout=timeout, **line_settings)
+    return transport
+
+
+def benchmark_transport(transport: Transport, command: str, n_transactions=200) -> dict:
+    """ Latency of query transactions on an opened transport
+
+    Returns
+    -------
+    dict: count, mean, p50, p99 and max latencies in s, as in the telemetry reports
+    """
+    from pymodaq_plugins_newport.hardware.telemetry import LatencyHistogram
+    histogram = LatencyHistogram()
+    for _ in range(n_transactions):
+        time_start = time.perf_counter()
+        transport.query(command)
+        histogram.record(time.perf_counter() - time_start)
+    return dict(count=histogram.count, mean=histogram.mean, p50=histogram.percentile(50),
+                p99=histogram.percentile(99), max=histogram.max)
+
+
+if __name__ == '__main__':
+    import sys
+    # python -m pymodaq_plugins_newport.hardware.transports COM5 1TP 57600 [host:port of a device server]
+    port, command, baud_rate = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    addresses = dict(pyvisa=port, pyserial=port)
+    if len(sys.argv) > 4:
+        addresses['tcp'] = sys.argv[4]
+    for backend, address in addresses.items():
+        transport = open_transport(address, backend, baud_rate=baud_rate)
+        try:
+            print(backend, benchmark_transport(transport, command))
+        finally:
+            transport.close()
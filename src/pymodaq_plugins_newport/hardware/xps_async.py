@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio client of the XPS controllers.
+
+The XPS executes the requests of one socket one after the other, but serves its sockets concurrently. AsyncXPS
+keeps a pool of sockets and sends each request on a free one, so that independent requests issued together with
+asyncio.gather cost about one network round trip instead of one per request::
+
+    async with AsyncXPS('192.168.0.254', nb_sockets=8) as xps:
+        positions = await asyncio.gather(*[xps.GroupPositionCurrentGet(positioner, 1)
+                                           for positioner in positioners])
+
+The API methods have the names and arguments of the XPS_Q8_drivers.XPS ones, without the socketId, and return
+the same lists. XPSAsyncAdapter runs a client in a background event loop for the synchronous code
+(XPSPythonWrapper, plugins).
+"""
+import asyncio
+import threading
+import time
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import API_SIGNATURES, getAPISpec
+from pymodaq_plugins_newport.hardware.telemetry import telemetry
+from pymodaq_plugins_newport.hardware.session_recorder import record_traffic
+
+END_OF_API = b',EndOfAPI'
+
+# quantities read by AsyncXPS.read_positioners_state: name: (API, number of values per positioner)
+STATE_APIS = {
+    'position': ('GroupPositionCurrentGet', 1),
+    'setpoint': ('GroupPositionSetpointGet', 1),
+    'following_error': ('GroupCurrentFollowingErrorGet', 1),
+    'velocity': ('GroupVelocityCurrentGet', 1),
+    'motion_status': ('GroupMotionStatusGet', 1),
+}
+
+
+class _Connection:
+    def __init__(self, index: int, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.index = index
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing()
+
+
+class AsyncXPS:
+    """ Pool of sockets to one XPS controller, requests being sent concurrently on the free sockets
+
+    Parameters
+    ----------
+    ip_address: str
+    port: int
+    nb_sockets: int
+        maximum number of requests in flight
+    timeout: float
+        timeout of each request in s, the socket of a request timing out is reopened
+
+    Attributes
+    ----------
+    read_limit: int
+        maximum size of a reply in bytes (gathered data can be several MB), the socket of a longer reply is reopened
+    """
+    read_limit = 2 ** 24
+
+    def __init__(self, ip_address='192.168.0.254', port=5001, nb_sockets=4, timeout=20.):
+        self.ip_address = ip_address
+        self.port = port
+        self.nb_sockets = nb_sockets
+        self.timeout = timeout
+        self._free: asyncio.Queue = None
+        self._connections = []
+
+    async def _open(self, index: int) -> _Connection:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.ip_address, self.port,
+                                                                        limit=self.read_limit),
+                                                self.timeout)
+        return _Connection(index, reader, writer)
+
+    async def connect(self):
+        self._free = asyncio.Queue()
+        self._connections = await asyncio.gather(*[self._open(index) for index in range(self.nb_sockets)])
+        for connection in self._connections:
+            self._free.put_nowait(connection)
+
+    async def close(self):
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def send_and_receive(self, command: str):
+        """ Send a command on a free socket
+
+        Returns
+        -------
+        list: [error code, returned string], error code being -2 on timeout or socket error, as with the
+            XPS_Q8_drivers
+        """
+        connection = await self._free.get()
+        transport = f'XPS async:{self.ip_address}:{connection.index}'
+        api_name = command.split('(', 1)[0]
+        time_start = time.perf_counter()
+        try:
+            if connection.closed:
+                # its reopening failed after an error of a previous request
+                connection = await self._reopen(connection)
+                if connection.closed:
+                    telemetry.record('XPS async', api_name, time.perf_counter() - time_start, error=True)
+                    return [-2, '']
+            record_traffic(transport, 'tx', command)
+            connection.writer.write(command.encode())
+            reply = (await asyncio.wait_for(connection.reader.readuntil(END_OF_API), self.timeout)).decode()
+            record_traffic(transport, 'rx', reply)
+        except asyncio.TimeoutError:
+            record_traffic(transport, 'timeout')
+            telemetry.record('XPS async', api_name, time.perf_counter() - time_start, timeout=True)
+            # a late reply would be read as the reply of the next request: use a new socket
+            connection = await self._reopen(connection)
+            return [-2, '']
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            # LimitOverrunError, ValueError: reply longer than read_limit, its unread part would be read as the
+            # reply of the next request
+            telemetry.record('XPS async', api_name, time.perf_counter() - time_start, error=True)
+            connection = await self._reopen(connection)
+            return [-2, '']
+        finally:
+            self._free.put_nowait(connection)
+        telemetry.record('XPS async', api_name, time.perf_counter() - time_start)
+        error, _, returned_string = reply[:-len(END_OF_API)].partition(',')
+        return [int(error), returned_string]
+
+    async def _reopen(self, connection: _Connection) -> _Connection:
+        connection.close()
+        try:
+            new_connection = await self._open(connection.index)
+        except (OSError, asyncio.TimeoutError):
+            return connection  # closed, the next request on it opens it again before sending
+        self._connections[connection.index] = new_connection
+        return new_connection
+
+    async def call(self, api_name: str, *args, **kwargs) -> list:
+        """ Execute an API of XPS_Q8_drivers.API_SIGNATURES (arguments without the socketId)"""
+        spec = getAPISpec(api_name)
+        values = spec.bind(args, kwargs)
+        error, returned_string = await self.send_and_receive(spec.command(values))
+        return spec.parse(error, returned_string, spec.nbOutputs(values))
+
+    def __getattr__(self, name):
+        if name not in API_SIGNATURES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def api_method(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+        api_method.__name__ = name
+        return api_method
+
+    async def gather(self, requests) -> list:
+        """ Execute requests concurrently
+
+        Parameters
+        ----------
+        requests: iterable of tuple
+            (api_name, arg1, arg2...)
+
+        Returns
+        -------
+        list: the replies, in the order of the requests
+        """
+        return list(await asyncio.gather(*[self.call(*request) for request in requests]))
+
+    async def read_positioners_state(self, positioners, quantities=None) -> dict:
+        """ Read the STATE_APIS quantities of several positioners in one batch of concurrent requests
+
+        Parameters
+        ----------
+        positioners: list of str
+            full positioner names, for instance ['Group1.Pos', 'Group2.Pos']
+        quantities: list of str
+            keys of STATE_APIS, all by default
+
+        Returns
+        -------
+        dict: quantity: list of values (one per positioner, None if the request failed)
+        """
+        if quantities is None:
+            quantities = list(STATE_APIS.keys())
+        requests = [(STATE_APIS[quantity][0], positioner, STATE_APIS[quantity][1])
+                    for quantity in quantities for positioner in positioners]
+        replies = await self.gather(requests)
+        state = {}
+        for ind, quantity in enumerate(quantities):
+            quantity_replies = replies[ind * len(positioners):(ind + 1) * len(positioners)]
+            state[quantity] = [reply[1] if reply[0] == 0 else None for reply in quantity_replies]
+        return state
+
+
+class XPSAsyncAdapter:
+    """ Synchronous facade of an AsyncXPS, whose event loop runs in a background thread
+
+    The API methods of the XPS_Q8_drivers are available without the socketId and block until the reply.
+
+    Parameters
+    ----------
+    ip_address: str
+    port: int
+    nb_sockets: int
+    timeout: float
+    """
+
+    def __init__(self, ip_address='192.168.0.254', port=5001, nb_sockets=4, timeout=20.):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=f'xps_async_{ip_address}',
+                                        daemon=True)
+        self._thread.start()
+        self.client = AsyncXPS(ip_address, port, nb_sockets, timeout)
+        try:
+            self.run(self.client.connect())
+        except Exception:
+            self._stop_loop()
+            raise
+
+    def run(self, coroutine):
+        """ Execute a coroutine in the event loop of the adapter and return its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def call(self, api_name: str, *args, **kwargs) -> list:
+        return self.run(self.client.call(api_name, *args, **kwargs))
+
+    def __getattr__(self, name):
+        if name not in API_SIGNATURES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        def api_method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+        api_method.__name__ = name
+        return api_method
+
+    def gather(self, requests) -> list:
+        """See AsyncXPS.gather"""
+        return self.run(self.client.gather(requests))
+
+    def read_positioners_state(self, positioners, quantities=None) -> dict:
+        """See AsyncXPS.read_positioners_state"""
+        return self.run(self.client.read_positioners_state(positioners, quantities))
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def close(self):
+        try:
+            self.run(self.client.close())
+        finally:
+            self._stop_loop()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Following error and setpoint diagnostics of the positioners of a XPS group.
+
+Each sample gathers, on a dedicated socket, the current following errors, the position setpoints, the current
+velocities and the acceleration setpoints of all the positioners of a group, and is returned as a NumPy record::
+
+    diagnostics = XPSDiagnostics('192.168.0.254', 'Group1', n_positioners=2)
+    diagnostics.start(period=0.02)
+    ...
+    samples = diagnostics.read_new()  # record array, one record per sample
+    samples['following_error'][:, 0]  # following errors of the first positioner
+
+A sample only costs four short queries, the sampling can then run during scans to check that the stages have
+settled before the detectors are triggered.
+"""
+import collections
+import logging
+import threading
+import time
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS
+from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error
+
+logger = logging.getLogger(__name__)
+
+DIAGNOSTIC_APIS = {
+    'following_error': 'GroupCurrentFollowingErrorGet',
+    'setpoint': 'GroupPositionSetpointGet',
+    'velocity': 'GroupVelocityCurrentGet',
+    'acceleration': 'GroupAccelerationSetpointGet',
+}
+
+
+def diagnostics_dtype(n_positioners: int) -> np.dtype:
+    """Record of one sample: timestamp and one sub array of n_positioners values per DIAGNOSTIC_APIS field"""
+    return np.dtype([('timestamp', float)] + [(name, float, (n_positioners,)) for name in DIAGNOSTIC_APIS])
+
+
+class XPSDiagnostics:
+    """ Sample the following errors and setpoints of a group, on demand or at a fixed rate in a thread
+
+    Parameters
+    ----------
+    ip_address: str
+    group: str
+    n_positioners: int
+        number of positioners in the group
+    port: int
+    timeout: float
+        socket timeout in s
+    buffer_size: int
+        maximum number of samples kept between two read_new calls, the oldest ones being dropped
+    """
+
+    def __init__(self, ip_address='192.168.0.254', group='Group1', n_positioners=1, port=5001, timeout=5.,
+                 buffer_size=100000):
+        self.group = group
+        self.n_positioners = n_positioners
+        self.dtype = diagnostics_dtype(n_positioners)
+        self._xps = XPS()
+        self._socket_id = self._xps.TCP_ConnectToServer(ip_address, port, timeout)
+        if self._socket_id == -1:
+            raise IOError(f'Could not open the diagnostics socket on {ip_address}:{port}')
+        self._buffer = collections.deque(maxlen=buffer_size)
+        self._buffer_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread = None
+        self.period = None
+
+    def sample(self) -> np.record:
+        """ Read all the diagnostic quantities of the group
+
+        Returns
+        -------
+        np.record: of dtype diagnostics_dtype, timestamped at the middle of the queries
+        """
+        record = np.zeros((), dtype=self.dtype)
+        time_start = time.time()
+        for name, api_name in DIAGNOSTIC_APIS.items():
+            record[name] = check_xps_error(getattr(self._xps, api_name)(self._socket_id, self.group,
+                                                                        self.n_positioners), api_name)
+        record['timestamp'] = (time_start + time.time()) / 2
+        return record[()]
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, period=0.02):
+        """ Sample in a thread every period (in s), the samples are buffered until read_new is called"""
+        self.stop()
+        self.period = period
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sampling_loop, name=f'xps_diagnostics_{self.group}',
+                                        daemon=True)
+        self._thread.start()
+
+    def _sampling_loop(self):
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                record = self.sample()
+            except Exception as e:
+                logger.warning(f'XPS diagnostics sampling of {self.group} stopped: {e}')
+                break
+            with self._buffer_lock:
+                self._buffer.append(record)
+            next_time += self.period
+            delay = next_time - time.perf_counter()
+            if delay < 0:  # sampling slower than the period, do not try to catch up
+                next_time = time.perf_counter()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def read_new(self) -> np.recarray:
+        """ Samples acquired since the last call
+
+        Returns
+        -------
+        np.recarray: shape (n_samples,)
+        """
+        with self._buffer_lock:
+            records = list(self._buffer)
+            self._buffer.clear()
+        return np.array(records, dtype=self.dtype).view(np.recarray)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        self._xps.TCP_CloseSocket(self._socket_id)
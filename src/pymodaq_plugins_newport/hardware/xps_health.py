@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Health and load monitoring of a XPS controller on its own socket, so that it can be sampled during scans without
+delaying the motion commands.
+"""
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import XPS
+from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error
+
+HEALTH_APIS = {
+    'kernel_load': ('ControllerMotionKernelTimeLoadGet',
+                    ['total_load', 'corrector_load', 'profiler_load', 'servitudes_load']),
+    'kernel_periods': ('ControllerMotionKernelPeriodMinMaxGet',
+                       ['corrector_period_min', 'corrector_period_max', 'profiler_period_min',
+                        'profiler_period_max', 'servitudes_period_min', 'servitudes_period_max']),
+    'cpu': ('CPUTemperatureAndFanSpeedGet', ['cpu_temperature', 'fan_speed']),
+    'voltages': ('CPUCoreAndBoardSupplyVoltagesGet',
+                 ['cpu_core_voltage'] + [f'supply_voltage_{ind}' for ind in range(1, 8)]),
+}
+
+
+class XPSHealthMonitor:
+    """ Sample the controller temperature, fan speed, supply voltages and motion kernel load and periods
+
+    Parameters
+    ----------
+    ip_address: str
+    port: int
+    timeout: float
+        socket timeout in s
+    """
+
+    def __init__(self, ip_address='192.168.0.254', port=5001, timeout=5.):
+        self._xps = XPS()
+        self._socket_id = self._xps.TCP_ConnectToServer(ip_address, port, timeout)
+        if self._socket_id == -1:
+            raise IOError(f'Could not open the monitoring socket on {ip_address}:{port}')
+
+    def read_group(self, group: str) -> dict:
+        """ Read one of the HEALTH_APIS groups
+
+        Returns
+        -------
+        dict: quantity name: value
+        """
+        api_name, names = HEALTH_APIS[group]
+        values = check_xps_error(getattr(self._xps, api_name)(self._socket_id), api_name)
+        return dict(zip(names, [float(value) for value in values]))
+
+    def read(self, groups=None) -> dict:
+        """ Read the given groups (all by default)
+
+        Returns
+        -------
+        dict: group: dict of quantity name: value
+        """
+        if groups is None:
+            groups = HEALTH_APIS.keys()
+        return {group: self.read_group(group) for group in groups}
+
+    def reset_kernel_period_min_max(self):
+        check_xps_error(self._xps.ControllerMotionKernelPeriodMinMaxReset(self._socket_id),
+                        'ControllerMotionKernelPeriodMinMaxReset')
+
+    def close(self):
+        self._xps.TCP_CloseSocket(self._socket_id)
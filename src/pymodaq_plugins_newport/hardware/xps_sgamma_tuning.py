@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Auto-tuning of the SGamma motion profile of a XPS positioner for step and settle scans.
+
+For each candidate set of profile parameters (velocity, acceleration, minimum and maximum jerk times), a batch
+of relative step moves of the typical scan step size is executed back and forth. After each move,
+PositionerSGammaPreviousMotionTimesGet gives the setting time (trajectory duration) and the settling time
+(duration until the position is inside the motion done window). The following error is gathered by the
+controller during the whole batch. A coordinate search keeps the candidate with the shortest mean settling time
+whose peak following error stays within the tolerance.
+"""
+import logging
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error, GatheringStream
+
+logger = logging.getLogger(__name__)
+
+PARAMETER_NAMES = ['velocity', 'acceleration', 'min_jerk_time', 'max_jerk_time']
+
+
+class SGammaTuner:
+    """
+    Parameters
+    ----------
+    xps: XPS_Q8_drivers.XPS
+    socket_id: int
+    positioner: str
+        full positioner name, for instance 'Group2.Pos'
+    following_error_tolerance: float
+        maximum acceptable absolute following error during the moves, in positioner units
+    """
+    search_factors = (0.5, 0.75, 1.25, 1.5, 2.)
+    jerk_time_bounds = (0.001, 0.5)
+
+    def __init__(self, xps, socket_id: int, positioner: str, following_error_tolerance: float):
+        self._xps = xps
+        self._socket_id = socket_id
+        self.positioner = positioner
+        self.group = positioner.split('.')[0]
+        self.following_error_tolerance = following_error_tolerance
+        self.history = []
+
+    def get_parameters(self) -> dict:
+        values = check_xps_error(self._xps.PositionerSGammaParametersGet(self._socket_id, self.positioner),
+                                 'PositionerSGammaParametersGet')
+        return dict(zip(PARAMETER_NAMES, [float(value) for value in values]))
+
+    def set_parameters(self, parameters: dict):
+        check_xps_error(self._xps.PositionerSGammaParametersSet(self._socket_id, self.positioner,
+                                                                *[parameters[name] for name in PARAMETER_NAMES]),
+                        'PositionerSGammaParametersSet')
+
+    def get_limits(self) -> dict:
+        """Maximum velocity and acceleration of the positioner"""
+        velocity, acceleration = check_xps_error(
+            self._xps.PositionerMaximumVelocityAndAccelerationGet(self._socket_id, self.positioner),
+            'PositionerMaximumVelocityAndAccelerationGet')
+        return dict(velocity=float(velocity), acceleration=float(acceleration))
+
+    def measure(self, parameters: dict, step: float, n_moves=10, gathering_divisor=10) -> dict:
+        """ Execute n_moves back and forth steps with the given parameters
+
+        n_moves is rounded up to an even number, so that the positioner ends at its start position
+
+        Returns
+        -------
+        dict: mean and max of the setting and settling times, peak following error and a valid flag
+        """
+        n_moves += n_moves % 2
+        self.set_parameters(parameters)
+        gathering = GatheringStream(self._xps, self._socket_id)
+        gathering.start([f'{self.positioner}.FollowingError'], 100000, gathering_divisor)
+        setting_times = []
+        settling_times = []
+        try:
+            for ind in range(n_moves):
+                displacement = step if ind % 2 == 0 else -step
+                check_xps_error(self._xps.GroupMoveRelative(self._socket_id, self.positioner, [displacement]),
+                                'GroupMoveRelative')
+                setting_time, settling_time = check_xps_error(
+                    self._xps.PositionerSGammaPreviousMotionTimesGet(self._socket_id, self.positioner),
+                    'PositionerSGammaPreviousMotionTimesGet')
+                setting_times.append(float(setting_time))
+                settling_times.append(float(settling_time))
+            following_errors = gathering.read_new()
+        finally:
+            gathering.stop()
+        peak_following_error = float(np.max(np.abs(following_errors))) if following_errors.size > 0 else 0.
+        result = dict(parameters=dict(parameters),
+                      setting_time=float(np.mean(setting_times)), settling_time=float(np.mean(settling_times)),
+                      max_settling_time=float(np.max(settling_times)),
+                      peak_following_error=peak_following_error,
+                      valid=peak_following_error <= self.following_error_tolerance)
+        self.history.append(result)
+        logger.debug(f'SGamma tuning of {self.positioner}: {result}')
+        return result
+
+    def _candidates(self, parameters: dict, name: str, limits: dict):
+        for factor in self.search_factors:
+            candidate = dict(parameters)
+            candidate[name] = parameters[name] * factor
+            if name in limits:
+                candidate[name] = min(candidate[name], limits[name])
+            else:
+                candidate[name] = float(np.clip(candidate[name], *self.jerk_time_bounds))
+            if candidate['min_jerk_time'] > candidate['max_jerk_time']:
+                continue
+            if candidate[name] != parameters[name]:
+                yield candidate
+
+    def tune(self, step: float, n_moves=10, max_evaluations=40, max_passes=3) -> dict:
+        """ Coordinate search of the fastest settling parameters within the following error tolerance
+
+        The best parameters are applied to the positioner before returning.
+
+        Returns
+        -------
+        dict: the best measurement (see measure), with the initial one under the 'initial' key
+        """
+        initial_parameters = self.get_parameters()
+        limits = self.get_limits()
+        best = self.measure(initial_parameters, step, n_moves)
+        initial = best
+        evaluations = 1
+        for _ in range(max_passes):
+            improved = False
+            for name in PARAMETER_NAMES:
+                for candidate in self._candidates(best['parameters'], name, limits):
+                    if evaluations >= max_evaluations:
+                        break
+                    result = self.measure(candidate, step, n_moves)
+                    evaluations += 1
+                    if result['valid'] and (not best['valid'] or result['settling_time'] < best['settling_time']):
+                        best = result
+                        improved = True
+            if not improved or evaluations >= max_evaluations:
+                break
+        if not best['valid']:
+            logger.warning(f'No SGamma parameters of {self.positioner} satisfy the following error tolerance of '
+                           f'{self.following_error_tolerance}, restoring the initial ones')
+            best = initial
+        self.set_parameters(best['parameters'])
+        best = dict(best)
+        best['initial'] = initial
+        best['evaluations'] = evaluations
+        return best
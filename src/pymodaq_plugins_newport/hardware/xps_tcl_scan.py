@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Step scans executed on the XPS controller itself.
+
+A parameterized TCL script is uploaded (ftp) into the controller script folder and executed with
+TCLScriptExecuteAndWait: moves, settling, GPIO trigger and gathering are all done by the controller real time
+kernel, one network round trip per point is removed and the timing is deterministic. Python only
+collects the gathered data in bulk at the end (or while the scan is running).
+
+The script is executed on its own socket, whose reply is received when the script ends: a script stopping before
+its last point, on an error or killed, is reported at once instead of at the scan timeout.
+"""
+import ftplib
+import io
+import threading
+import time
+
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error, read_gathering
+
+STEP_SCAN_SCRIPT = """# Step scan of one positioner executed on the XPS controller (generated by pymodaq_plugins_newport)
+# arguments: positioner start step n_points settle_ms gpio_name gpio_mask
+set positioner [lindex $tcl_argv 0]
+set start [lindex $tcl_argv 1]
+set step [lindex $tcl_argv 2]
+set n_points [lindex $tcl_argv 3]
+set settle_ms [lindex $tcl_argv 4]
+set gpio_name [lindex $tcl_argv 5]
+set gpio_mask [lindex $tcl_argv 6]
+
+set TimeOut 20
+set code [catch "OpenConnection $TimeOut socketID"]
+if {$code != 0} {
+    error "OpenConnection failed => $code"
+}
+set failure ""
+for {set i 0} {$i < $n_points} {incr i} {
+    set target [expr {$start + $i * $step}]
+    set code [catch "GroupMoveAbsolute $socketID $positioner $target"]
+    if {$code != 0} {
+        set failure "GroupMoveAbsolute failed at point $i => $code"
+        break
+    }
+    if {$settle_ms > 0} {
+        after $settle_ms
+    }
+    if {$gpio_mask != 0} {
+        set code [catch "GPIODigitalSet $socketID $gpio_name $gpio_mask $gpio_mask"]
+        set code [catch "GPIODigitalSet $socketID $gpio_name $gpio_mask 0"]
+    }
+    set code [catch "GatheringDataAcquire $socketID"]
+    if {$code != 0} {
+        set failure "GatheringDataAcquire failed at point $i => $code"
+        break
+    }
+}
+TCP_CloseSocket $socketID
+if {$failure != ""} {
+    error $failure
+}
+"""
+
+
+class TCLScanError(Exception):
+    """The scan script ended before gathering all its points"""
+    pass
+
+
+class XPSTCLStepScan:
+    """ Step scan of one positioner offloaded into a TCL script running on the controller
+
+    Parameters
+    ----------
+    xps: XPS_Q8_drivers.XPS
+    socket_id: int
+        socket used to control the script and collect the data (not used by the script itself)
+    ip_address: str
+        controller address used for the ftp upload of the script and the connection of the script socket
+    positioner: str
+        full positioner name, for instance 'Group2.Pos'
+    port: int
+        controller port of the script socket
+    """
+    script_folder = '/Admin/Public/Scripts'
+    script_name = 'pymodaq_step_scan.tcl'
+    task_name = 'pymodaq_step_scan'
+
+    def __init__(self, xps, socket_id: int, ip_address: str, positioner: str,
+                 ftp_user='Administrator', ftp_password='Administrator', port=5001):
+        self._xps = xps
+        self._socket_id = socket_id
+        self._ip_address = ip_address
+        self._port = port
+        self.positioner = positioner
+        self._ftp_user = ftp_user
+        self._ftp_password = ftp_password
+        self._n_points = 0
+        self._task = None  # thread waiting for the reply of TCLScriptExecuteAndWait
+        self._task_reply = None  # that reply: [error, output]
+
+    def upload(self, script: str = STEP_SCAN_SCRIPT):
+        """Copy the scan script into the controller script folder"""
+        with ftplib.FTP(self._ip_address, self._ftp_user, self._ftp_password, timeout=10) as ftp:
+            ftp.cwd(self.script_folder)
+            ftp.storbinary(f'STOR {self.script_name}', io.BytesIO(script.encode()))
+
+    def configure_gathering(self, gathering_types=None):
+        """ Set the quantities gathered at each point (defaults to the positioner current position)"""
+        if gathering_types is None or len(gathering_types) == 0:
+            gathering_types = [f'{self.positioner}.CurrentPosition']
+        check_xps_error(self._xps.GatheringReset(self._socket_id), 'GatheringReset')
+        check_xps_error(self._xps.GatheringConfigurationSet(self._socket_id, list(gathering_types)),
+                        'GatheringConfigurationSet')
+        return gathering_types
+
+    def start(self, start: float, step: float, n_points: int, settle_ms=0, gpio_name='GPIO3.DO', gpio_mask=0,
+              gathering_types=None):
+        """Configure the gathering and launch the scan script without waiting for its end"""
+        self.configure_gathering(gathering_types)
+        self._n_points = int(n_points)
+        parameters = ','.join([self.positioner, str(start), str(step), str(self._n_points), str(int(settle_ms)),
+                               gpio_name, str(int(gpio_mask))])
+        task_socket_id = self._xps.TCP_ConnectToServer(self._ip_address, self._port, 20)
+        if task_socket_id == -1:
+            raise IOError(f'Could not open the script socket on {self._ip_address}:{self._port}')
+        self._task_reply = None
+        self._task = threading.Thread(target=self._execute, args=(task_socket_id, parameters),
+                                      name=self.task_name, daemon=True)
+        self._task.start()
+
+    def _execute(self, task_socket_id: int, parameters: str):
+        """Run the script and keep the reply received at its end"""
+        try:
+            reply = self._xps.TCLScriptExecuteAndWait(task_socket_id, self.script_name, self.task_name, parameters)
+            self._task_reply = [-1, ''] if reply is None else reply
+        finally:
+            self._xps.TCP_CloseSocket(task_socket_id)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and self._task.is_alive()
+
+    def current_number(self) -> int:
+        """Number of points already gathered by the controller"""
+        current_number, _ = check_xps_error(self._xps.GatheringCurrentNumberGet(self._socket_id),
+                                            'GatheringCurrentNumberGet')
+        return int(current_number)
+
+    def wait_done(self, timeout: float, poll_interval=0.2) -> int:
+        """ Wait until all points have been gathered, or the script ended
+
+        Returns
+        -------
+        int: the number of gathered points
+
+        Raises
+        ------
+        TCLScanError: if the script ended, on an error or killed, before gathering all the points
+        TimeoutError: if the points are not gathered within timeout, the script is then killed
+        """
+        time_start = time.perf_counter()
+        current_number = self.current_number()
+        while current_number < self._n_points:
+            if not self.is_running:
+                current_number = self.current_number()  # points gathered just before the end of the script
+                if current_number < self._n_points:
+                    raise TCLScanError(f'The TCL step scan ended after {current_number}/{self._n_points} points: '
+                                       f'{self._describe_end()}')
+                break
+            if time.perf_counter() - time_start > timeout:
+                self.abort()
+                raise TimeoutError(f'The TCL step scan gathered only {current_number}/{self._n_points} points '
+                                   f'after {timeout} s')
+            self._task.join(poll_interval)  # returns at once when the script ends
+            current_number = self.current_number()
+        return current_number
+
+    def _describe_end(self) -> str:
+        if self._task is None:
+            return 'the script was not started'
+        if self._task_reply is None:
+            return 'no reply from the controller'
+        error, output = self._task_reply[0], self._task_reply[-1]
+        if error == 0:
+            return f'the script returned without error {output}'.strip()
+        error_string = self._xps.ErrorStringGet(self._socket_id, error)
+        if error_string is not None and error_string[0] == 0:
+            return f'{self.task_name} returned the error {error} ({error_string[1]}) {output}'.strip()
+        return f'{self.task_name} returned the error {error} {output}'.strip()
+
+    def abort(self):
+        self._xps.TCLScriptKill(self._socket_id, self.task_name)
+        if self._task is not None:
+            self._task.join(5.)
+
+    def collect(self) -> np.ndarray:
+        """ Read all the gathered points in bulk
+
+        Returns
+        -------
+        np.ndarray: shape (n_points, n_gathered_types)
+        """
+        return read_gathering(self._xps, self._socket_id, 0, self.current_number())
+
+    def run(self, start: float, step: float, n_points: int, settle_ms=0, gpio_name='GPIO3.DO', gpio_mask=0,
+            gathering_types=None, timeout=600.) -> np.ndarray:
+        """Launch the scan, wait for its end and return the gathered data"""
+        self.start(start, step, n_points, settle_ms, gpio_name, gpio_mask, gathering_types)
+        self.wait_done(timeout)
+        return self.collect()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by the tools built on top of the XPS_Q8_drivers API: error checking and gathering buffer
+parsing.
+"""
+
+
+class XPSError(Exception):
+    """Error code returned by an XPS API"""
+    def __init__(self, api_name: str, error_code: int):
+        super().__init__(f'{api_name} returned the error code {error_code}')
+        self.api_name = api_name
+        self.error_code = error_code
+
+
+def check_xps_error(ret, api_name: str):
+    """ Raise an XPSError if the list returned by an XPS API has a non zero error code
+
+    Returns
+    -------
+    list: the returned values following the error code
+    """
+    if ret is None:
+        raise XPSError(api_name, -1)
+    if ret[0] != 0:
+        raise XPSError(api_name, ret[0])
+    return ret[1:]
+
+
+def parse_gathering_lines(lines: str) -> 'np.ndarray':
+    """ Convert the string returned by GatheringDataMultipleLinesGet into a 2D array
+
+    Returns
+    -------
+    np.ndarray: shape (n_lines, n_gathered_types)
+    """
+    import numpy as np
+    rows = [[float(value) for value in line.split(';') if value != '']
+            for line in lines.splitlines() if line.strip() != '']
+    return np.array(rows, dtype=float)
+
+
+def read_gathering(xps, socket_id, start_index: int, n_lines: int, chunk=500) -> 'np.ndarray':
+    """ Read gathered lines from the controller buffer in bulk (chunks of at most `chunk` lines)"""
+    import numpy as np
+    blocks = []
+    index = start_index
+    while index < start_index + n_lines:
+        n_chunk = min(chunk, start_index + n_lines - index)
+        lines, = check_xps_error(xps.GatheringDataMultipleLinesGet(socket_id, index, n_chunk),
+                                 'GatheringDataMultipleLinesGet')
+        blocks.append(parse_gathering_lines(lines))
+        index += n_chunk
+    if len(blocks) == 0:
+        return np.zeros((0, 0))
+    return np.concatenate(blocks, axis=0)
+
+
+class GatheringStream:
+    """ Continuous reading of the XPS internal gathering buffer
+
+    The gathering runs on the controller at the servo rate divided by `divisor`, each call to `read_new`
+    returns in bulk the lines gathered since the previous call.
+
+    Parameters
+    ----------
+    xps: XPS_Q8_drivers.XPS
+    socket_id: int
+    """
+
+    def __init__(self, xps, socket_id: int):
+        self._xps = xps
+        self._socket_id = socket_id
+        self._read_index = 0
+        self.gathering_types = []
+        self.n_points = 0
+        self.divisor = 1
+
+    def start(self, gathering_types, n_points: int, divisor=1):
+        """ Configure and start a gathering of `n_points` lines of the given types"""
+        self.gathering_types = list(gathering_types)
+        self.n_points = int(n_points)
+        self.divisor = int(divisor)
+        self._read_index = 0
+        check_xps_error(self._xps.GatheringReset(self._socket_id), 'GatheringReset')
+        check_xps_error(self._xps.GatheringConfigurationSet(self._socket_id, self.gathering_types),
+                        'GatheringConfigurationSet')
+        check_xps_error(self._xps.GatheringRun(self._socket_id, self.n_points, self.divisor), 'GatheringRun')
+
+    def current_number(self) -> int:
+        current_number, _ = check_xps_error(self._xps.GatheringCurrentNumberGet(self._socket_id),
+                                            'GatheringCurrentNumberGet')
+        return int(current_number)
+
+    def read_new(self) -> 'np.ndarray':
+        """ Read the lines gathered since the last call
+
+        Returns
+        -------
+        np.ndarray: shape (n_new_lines, n_gathered_types)
+        """
+        import numpy as np
+        current_number = self.current_number()
+        if current_number <= self._read_index:
+            return np.zeros((0, len(self.gathering_types)))
+        data = read_gathering(self._xps, self._socket_id, self._read_index, current_number - self._read_index)
+        self._read_index = current_number
+        return data
+
+    @property
+    def is_full(self) -> bool:
+        return self._read_index >= self.n_points
+
+    def stop(self):
+        self._xps.GatheringStop(self._socket_id)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Wrapper of a positioner of a XPS group, used by the DAQ_Move_Newport_XPS_Q8 plugin and usable from scripts without
+PyMoDAQ::
+
+    stage = XPSPythonWrapper('192.168.0.254', 5001, 'Group2', 'Pos', warmStart=True)
+    stage.moveAbsolute(10.)
+    print(stage.getPosition())
+    stage.closeTCPIP()
+
+The tools built on the wrapper (step scans, SGamma tuning, analog tracking, asyncio client) are imported at their
+first use.
+"""
+import logging
+
+from pymodaq_plugins_newport.hardware import XPS_Q8_drivers
+from pymodaq_plugins_newport.hardware.xps_utils import check_xps_error, XPSError
+
+logger = logging.getLogger(__name__)
+
+# GroupStatusGet codes of the ready states, the group is initialized and homed
+READY_STATUS = range(10, 19)
+
+
+class XPSPythonWrapper():
+    """ Group of a XPS controller, its positioner being driven by the plugin or a script
+
+    The group is killed, initialized and homed at the connection, unless warmStart is set and the group is already
+    ready. The errors returned by the controller raise a XPSError.
+
+    Parameters
+    ----------
+    ip_address: str
+    port: int
+    group: str
+        name of the group, for instance 'Group2'
+    positioner: str
+        name of the positioner within the group
+    warmStart: bool
+        keep the group as it is if it is already initialized and homed
+    """
+
+    def __init__(self, ip_address='192.168.0.254', port=5001, group='Group2', positioner='Pos', warmStart=False):
+        self.myxps = XPS_Q8_drivers.XPS()
+        self.ip_address = ip_address
+        self.port = port
+        self.group = group
+        self.positioner = self.group + '.' + positioner
+        self.socketId = None
+        self.jogSocketId = None
+        self.trackingStream = None
+        self.asyncClient = None
+        self.warmStart = warmStart
+        self.warmStarted = False
+        self._initCommands()
+            
+    def _initCommands(self):
+        self.socketId = self.myxps.TCP_ConnectToServer(self.ip_address, self.port, 20)
+        # Check connection passed
+        if (self.socketId == -1):
+            logger.error(f'Connection to XPS {self.ip_address}:{self.port} failed, check IP & Port')
+            return
+        if self.warmStart and self.checkConnected() and self.isReady():
+            # already initialized and homed, by a previous session: skip the kill, initialization and home search
+            self.warmStarted = True
+            return
+        #Group kill to be sure
+        self._checkError(self.myxps.GroupKill(self.socketId, self.group), 'GroupKill')
+        #Initialize
+        self._checkError(self.myxps.GroupInitialize(self.socketId, self.group), 'GroupInitialize')
+        #Définition du trigger sur MotionDone
+        # [errorCode, returnString] = self.myxps.EventExtendedConfigurationTriggerSet(self.socketId, 'MotionDone',0,0,0,0)
+        # if (errorCode != 0):
+        #     self.displayErrorAndClose(errorCode, 'EventExtendedConfigurationTriggerSet')
+        #     sys.exit()
+        # [errorCode, returnString] = self.myxps.EventExtendedConfigurationActionSet(self.socketId, , 0, 0, 0, 0)
+        # if (errorCode != 0):
+        #     self.displayErrorAndClose(errorCode, 'EventExtendedConfigurationActionSet')
+        #     sys.exit()
+        # Home search
+        self.moveHome()
+            
+    def isReady(self):
+        [errorCode, status] = self.myxps.GroupStatusGet(self.socketId, self.group)
+        return errorCode == 0 and status in READY_STATUS
+
+    def getFirmwareVersion(self):
+        return check_xps_error(self.myxps.FirmwareVersionGet(self.socketId), 'FirmwareVersionGet')[0]
+
+    def checkConnected(self):
+        return (self.socketId != -1) and (self.socketId is not None)
+    
+    def displayErrorAndClose(self, errorCode, APIName):
+        if (errorCode != -2) and (errorCode != -108):
+            [errorCode2, errorString] = self.myxps.ErrorStringGet(self.socketId, errorCode)
+            if (errorCode2 != 0):
+                logger.error(APIName + ': ERROR ' + str(errorCode))
+            else:
+                logger.error(APIName + ': ' + errorString)
+        else:
+            if (errorCode == -2):
+                logger.error(APIName + ': TCP timeout')
+            if (errorCode == -108):
+                logger.error(APIName + ': The TCP/IP connection was closed by an administrator')
+        self.closeTCPIP()
+
+    def _checkError(self, ret, APIName):
+        """ Values returned by an API, the error is logged and the connection closed before raising a XPSError"""
+        if ret[0] != 0:
+            self.displayErrorAndClose(ret[0], APIName)
+            raise XPSError(APIName, ret[0])
+        return ret[1:]
+
+    def closeTCPIP(self):
+        if self.jogSocketId is not None:
+            self.disableJog()
+        if self.trackingStream is not None:
+            self.disableAnalogTracking()
+        if self.asyncClient is not None:
+            self.asyncClient.close()
+            self.asyncClient = None
+        self.myxps.TCP_CloseSocket(self.socketId)
+        
+    def getPosition(self):
+        currentPosition, = self._checkError(self.myxps.GroupPositionCurrentGet(self.socketId, self.positioner, 1),
+                                            'GroupPositionCurrentGet')
+        return float(currentPosition)
+
+    def moveAbsolute(self, value):
+        self._checkError(self.myxps.GroupMoveAbsolute(self.socketId, self.positioner, [value]), 'GroupMoveAbsolute')
+
+    def moveHome(self):
+        self._checkError(self.myxps.GroupHomeSearch(self.socketId, self.group), 'GroupHomeSearch')
+
+    def abortMove(self):
+        check_xps_error(self.myxps.GroupMoveAbort(self.socketId, self.group), 'GroupMoveAbort')
+
+    def enableJog(self):
+        """ Enable the jog mode, velocity updates are then sent on their own socket so that they never wait
+        behind another request"""
+        if self.jogSocketId is None:
+            self.jogSocketId = self.myxps.TCP_ConnectToServer(self.ip_address, self.port, 20)
+            if self.jogSocketId == -1:
+                self.jogSocketId = None
+                raise IOError(f'Could not open the jog socket on {self.ip_address}:{self.port}')
+        check_xps_error(self.myxps.GroupJogModeEnable(self.jogSocketId, self.group), 'GroupJogModeEnable')
+
+    def setJogVelocity(self, velocity, acceleration):
+        """Update the jog velocity (in units/s) of the positioner, the group is moving continuously"""
+        check_xps_error(self.myxps.GroupJogParametersSet(self.jogSocketId, self.group, [velocity], [acceleration]),
+                        'GroupJogParametersSet')
+
+    def getJogVelocity(self):
+        """ Current jog velocity of the positioner"""
+        velocity, acceleration = check_xps_error(self.myxps.GroupJogCurrentGet(self.jogSocketId, self.group, 1),
+                                                 'GroupJogCurrentGet')
+        return float(velocity)
+
+    def disableJog(self):
+        """ Stop the continuous motion, leave the jog mode and close the jog socket, if the jog mode is enabled"""
+        if self.jogSocketId is None:
+            return
+        try:
+            self.setJogVelocity(0., 0.)
+            check_xps_error(self.myxps.GroupJogModeDisable(self.jogSocketId, self.group), 'GroupJogModeDisable')
+        finally:
+            self.myxps.TCP_CloseSocket(self.jogSocketId)
+            self.jogSocketId = None
+
+    def configureAnalogTracking(self, trackingType, GPIOName, offset, scale, velocity, acceleration,
+                                deadBandThreshold=0., order=1):
+        """ Set the analog tracking parameters of the positioner
+
+        Parameters
+        ----------
+        trackingType: str
+            'Position' (the position follows the analog input) or 'Velocity' (the velocity follows it)
+        GPIOName: str
+            analog input, for instance 'GPIO2.ADC1'
+        """
+        if trackingType == 'Position':
+            check_xps_error(self.myxps.PositionerAnalogTrackingPositionParametersSet(
+                self.socketId, self.positioner, GPIOName, offset, scale, velocity, acceleration),
+                'PositionerAnalogTrackingPositionParametersSet')
+        else:
+            check_xps_error(self.myxps.PositionerAnalogTrackingVelocityParametersSet(
+                self.socketId, self.positioner, GPIOName, offset, scale, deadBandThreshold, order, velocity,
+                acceleration),
+                'PositionerAnalogTrackingVelocityParametersSet')
+
+    def enableAnalogTracking(self, trackingType, GPIOName, nbPoints=100000, divisor=1):
+        """ Let the controller follow the analog input at the servo rate and stream the positioner position and
+        the analog input through the gathering"""
+        from pymodaq_plugins_newport.hardware.xps_utils import GatheringStream
+        check_xps_error(self.myxps.GroupAnalogTrackingModeEnable(self.socketId, self.group, trackingType),
+                        'GroupAnalogTrackingModeEnable')
+        self.trackingStream = GatheringStream(self.myxps, self.socketId)
+        self.trackingStream.start([self.positioner + '.CurrentPosition', GPIOName], nbPoints, divisor)
+
+    def readAnalogTracking(self):
+        """ Positions and analog input values gathered since the last call
+
+        Returns
+        -------
+        np.ndarray: shape (n_new_samples, 2), columns are the position and the analog input
+        """
+        data = self.trackingStream.read_new()
+        if self.trackingStream.is_full:  # keep on streaming
+            # the gathering stopped when the buffer got full, nothing is gathered until the restart
+            logger.warning(f'Analog tracking gathering buffer of {self.positioner} full '
+                           f'({self.trackingStream.n_points} lines): samples missing until its restart')
+            self.trackingStream.start(self.trackingStream.gathering_types, self.trackingStream.n_points,
+                                      self.trackingStream.divisor)
+        return data
+
+    def disableAnalogTracking(self):
+        try:
+            self.trackingStream.stop()
+            check_xps_error(self.myxps.GroupAnalogTrackingModeDisable(self.socketId, self.group),
+                            'GroupAnalogTrackingModeDisable')
+        finally:
+            self.trackingStream = None
+
+    def getSGammaTuner(self, followingErrorTolerance):
+        from pymodaq_plugins_newport.hardware.xps_sgamma_tuning import SGammaTuner
+        return SGammaTuner(self.myxps, self.socketId, self.positioner, followingErrorTolerance)
+
+    def getStepScan(self):
+        """Step scan of the positioner executed by a TCL script on the controller"""
+        from pymodaq_plugins_newport.hardware.xps_tcl_scan import XPSTCLStepScan
+        return XPSTCLStepScan(self.myxps, self.socketId, self.ip_address, self.positioner, port=self.port)
+
+    def openAsyncClient(self, nbSockets=8):
+        """ Open a pool of sockets on which independent requests are sent concurrently (see xps_async)"""
+        if self.asyncClient is None:
+            from pymodaq_plugins_newport.hardware.xps_async import XPSAsyncAdapter
+            self.asyncClient = XPSAsyncAdapter(self.ip_address, self.port, nbSockets)
+        return self.asyncClient
+
+    def getPositionersState(self, positioners=None, quantities=None):
+        """ Positions, setpoints, following errors, velocities and motion status of several positioners (this one
+        by default), read in about one network round trip
+
+        Returns
+        -------
+        dict: quantity: list of values, one per positioner
+        """
+        if positioners is None:
+            positioners = [self.positioner]
+        return self.openAsyncClient().read_positioners_state(positioners, quantities)
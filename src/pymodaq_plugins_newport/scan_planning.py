@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Travel minimizing ordering of the points of a multi-axes scan.
+
+Each axis is described by its kinematic limits (AxisLimits, to be read from the controllers with the helper
+functions below). The time to go from one point to the next is estimated with trapezoidal velocity profiles,
+the axes moving concurrently (the slowest axis gives the move time). The points are then reordered with a
+serpentine, a nearest neighbour or a nearest neighbour + 2-opt heuristic::
+
+    limits = [xps_axis_limits(xps, socket_id, 'Group1.Pos'), esp100_axis_limits(esp100)]
+    plan = plan_scan(points, limits, method='two_opt')
+    plan.points, plan.order, plan.total_time
+"""
+import numpy as np
+
+METHODS = ['none', 'serpentine', 'nearest_neighbour', 'two_opt']
+
+
+class AxisLimits:
+    """ Kinematic limits of one axis
+
+    Parameters
+    ----------
+    velocity: float
+        maximum velocity in units/s
+    acceleration: float
+        maximum acceleration in units/s², if 0 or None constant velocity moves are assumed
+    overhead: float
+        constant time in s added to each move of this axis (command, settling...)
+    """
+
+    def __init__(self, velocity: float, acceleration: float = None, overhead=0.):
+        self.velocity = float(velocity)
+        self.acceleration = float(acceleration) if acceleration else None
+        self.overhead = float(overhead)
+
+    def __repr__(self):
+        return f'AxisLimits(velocity={self.velocity}, acceleration={self.acceleration}, overhead={self.overhead})'
+
+    def move_time(self, distance) -> np.ndarray:
+        """ Duration of moves of the given distances (array like) with a trapezoidal velocity profile"""
+        distance = np.abs(np.asarray(distance, dtype=float))
+        if self.acceleration is None:
+            times = distance / self.velocity
+        else:
+            ramp_distance = self.velocity ** 2 / self.acceleration
+            times = np.where(distance <= ramp_distance,
+                             2 * np.sqrt(distance / self.acceleration),
+                             distance / self.velocity + self.velocity / self.acceleration)
+        return np.where(distance > 0, times + self.overhead, 0.)
+
+
+def esp100_axis_limits(controller, axis=1, overhead=0.) -> AxisLimits:
+    """Limits read from an ESP100 (hardware.esp100.ESP100)"""
+    return AxisLimits(controller.get_velocity_max(axis), controller.get_acceleration_max(axis), overhead)
+
+
+def smc100_axis_limits(controller, axis=1, overhead=0.) -> AxisLimits:
+    """Limits read from a SMC100 (hardware.smc100.SMC100), using the current velocity and acceleration"""
+    return AxisLimits(controller.get_velocity(axis), controller.get_acceleration(axis), overhead)
+
+
+def xps_axis_limits(xps, socket_id: int, positioner: str, overhead=0.) -> AxisLimits:
+    """Limits read from a XPS positioner with PositionerMaximumVelocityAndAccelerationGet"""
+    ret = xps.PositionerMaximumVelocityAndAccelerationGet(socket_id, positioner)
+    if ret is None or ret[0] != 0:
+        raise IOError(f'Could not get the maximum velocity and acceleration of {positioner}: {ret}')
+    return AxisLimits(ret[1], ret[2], overhead)
+
+
+def agilis_axis_limits(step_rate: float, overhead=0.) -> AxisLimits:
+    """Limits of an Agilis axis whose unit is the step, given its step rate in steps/s"""
+    return AxisLimits(step_rate, None, overhead)
+
+
+def _check_points(points: np.ndarray, limits) -> np.ndarray:
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1:
+        points = points[:, None]
+    if points.shape[1] != len(limits):
+        raise ValueError(f'The points have {points.shape[1]} coordinates but {len(limits)} axis limits are given')
+    return points
+
+
+def transition_times(origin: np.ndarray, targets: np.ndarray, limits) -> np.ndarray:
+    """ Times to move from the origin point to each of the target points, all axes moving together"""
+    targets = np.atleast_2d(targets)
+    times = np.zeros(len(targets))
+    for ind, axis_limits in enumerate(limits):
+        times = np.maximum(times, axis_limits.move_time(targets[:, ind] - origin[ind]))
+    return times
+
+
+def path_time(points: np.ndarray, limits, start=None) -> float:
+    """ Total move time along the points in the given order, starting from `start` if given"""
+    points = _check_points(points, limits)
+    if start is not None:
+        points = np.concatenate((np.asarray(start, dtype=float)[None, :], points))
+    if len(points) < 2:
+        return 0.
+    times = np.zeros(len(points) - 1)
+    for ind, axis_limits in enumerate(limits):
+        times = np.maximum(times, axis_limits.move_time(np.diff(points[:, ind])))
+    return float(np.sum(times))
+
+
+def serpentine_order(points: np.ndarray, decimals=9) -> np.ndarray:
+    """ Boustrophedon order: lines along the last axis, sorted by the other coordinates, every other line
+    being reversed
+
+    Returns
+    -------
+    np.ndarray: indexes of the points in the scan order
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1:
+        return np.argsort(points, kind='stable')
+    rounded = np.round(points, decimals)
+    order = np.lexsort(rounded.T[::-1])
+    if points.shape[1] == 1:
+        return order
+    lines = rounded[order, :-1]
+    new_line = np.concatenate(([True], np.any(lines[1:] != lines[:-1], axis=1)))
+    line_index = np.cumsum(new_line) - 1
+    starts = np.flatnonzero(new_line)
+    ends = np.concatenate((starts[1:], [len(order)]))
+    ordered = [order[start:end] if line % 2 == 0 else order[start:end][::-1]
+               for line, (start, end) in enumerate(zip(starts, ends))]
+    return np.concatenate(ordered) if len(ordered) > 0 else order
+
+
+def nearest_neighbour_order(points: np.ndarray, limits, start=None) -> np.ndarray:
+    """ Greedy order: always go to the not yet visited point the fastest to reach
+
+    Parameters
+    ----------
+    points: np.ndarray
+        shape (n_points, n_axes)
+    limits: list of AxisLimits
+    start: array like or None
+        current position of the axes, if None the scan starts at the first point
+    """
+    points = _check_points(points, limits)
+    n_points = len(points)
+    if n_points == 0:
+        return np.zeros((0,), dtype=int)
+    remaining = np.ones(n_points, dtype=bool)
+    order = np.zeros(n_points, dtype=int)
+    if start is None:
+        current = 0
+    else:
+        current = int(np.argmin(transition_times(np.asarray(start, dtype=float), points, limits)))
+    for ind in range(n_points):
+        order[ind] = current
+        remaining[current] = False
+        if ind == n_points - 1:
+            break
+        candidates = np.flatnonzero(remaining)
+        times = transition_times(points[current], points[candidates], limits)
+        current = int(candidates[np.argmin(times)])
+    return order
+
+
+def two_opt(points: np.ndarray, limits, order: np.ndarray, max_passes=20, start=None) -> np.ndarray:
+    """ Improve an open path by reversing segments as long as it shortens the total move time
+
+    The move times being symmetric, reversing a segment only changes its two boundary transitions. The cost
+    matrix is computed once: n_points² floats, keep it for scans of a few thousands points at most.
+    """
+    points = _check_points(points, limits)
+    order = np.array(order, dtype=int)
+    n_points = len(order)
+    if n_points < 3:
+        return order
+    path = points[order]
+    if start is not None:  # the start point is kept first
+        path = np.concatenate((np.asarray(start, dtype=float)[None, :], path))
+    n_nodes = len(path)
+    cost = np.zeros((n_nodes, n_nodes))
+    for ind in range(n_nodes):
+        cost[ind] = transition_times(path[ind], path, limits)
+    route = np.arange(n_nodes)
+    first = 1 if start is not None else 0
+    for _ in range(max_passes):
+        improved = False
+        for i in range(max(first, 1), n_nodes - 1):
+            # reverse route[i:j+1] for all j > i at once
+            j = np.arange(i + 1, n_nodes)
+            previous = route[i - 1]
+            following = np.append(route[j[:-1] + 1], -1)
+            old = cost[previous, route[i]] + np.where(following >= 0, cost[route[j], following], 0.)
+            new = cost[previous, route[j]] + np.where(following >= 0, cost[route[i], following], 0.)
+            delta = new - old
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-12:
+                route[i:j[best] + 1] = route[i:j[best] + 1][::-1]
+                improved = True
+        if first == 0:  # the first point of an open path without start can also change
+            j = np.arange(1, n_nodes - 1)
+            delta = cost[route[0], route[j + 1]] - cost[route[j], route[j + 1]]
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-12:
+                route[:j[best] + 1] = route[:j[best] + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    route = route[first:] - first
+    return order[route]
+
+
+class ScanPlan:
+    """ Result of plan_scan
+
+    Attributes
+    ----------
+    order: np.ndarray
+        indexes of the input points in the scan order
+    points: np.ndarray
+        the reordered points
+    total_time: float
+        estimated total move time in s
+    initial_time: float
+        estimated total move time in s of the input order
+    """
+
+    def __init__(self, order, points, total_time, initial_time, method):
+        self.order = order
+        self.points = points
+        self.total_time = total_time
+        self.initial_time = initial_time
+        self.method = method
+
+    def __repr__(self):
+        return (f'ScanPlan({len(self.order)} points, method={self.method}, total_time={self.total_time:.3f} s, '
+                f'initial_time={self.initial_time:.3f} s)')
+
+
+def plan_scan(points: np.ndarray, limits, method='two_opt', start=None) -> ScanPlan:
+    """ Reorder the scan points to minimize the total move time
+
+    Parameters
+    ----------
+    points: np.ndarray
+        shape (n_points, n_axes)
+    limits: list of AxisLimits
+        one per axis
+    method: str
+        one of METHODS
+    start: array like or None
+        current position of the axes
+    """
+    points = _check_points(points, limits)
+    if method == 'none':
+        order = np.arange(len(points))
+    elif method == 'serpentine':
+        order = serpentine_order(points)
+    elif method == 'nearest_neighbour':
+        order = nearest_neighbour_order(points, limits, start)
+    elif method == 'two_opt':
+        order = two_opt(points, limits, nearest_neighbour_order(points, limits, start), start=start)
+    else:
+        raise ValueError(f'{method} is not a valid method: {METHODS}')
+    return ScanPlan(order, points[order], path_time(points[order], limits, start),
+                    path_time(points, limits, start), method)
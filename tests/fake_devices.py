@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Fake serial devices used by the tests: transports (see hardware.transports) answering the commands written to them
+as the controllers would, with the CR+LF termination of the Newport controllers.
+"""
+import threading
+import time
+
+from pymodaq_plugins_newport.hardware.transports import _StreamTransport
+
+
+class FakeSerialDevice(_StreamTransport):
+    """ Transport whose replies are given by the `replies` method, to be overridden
+
+    Attributes
+    ----------
+    commands: list of str
+        commands written, in order
+    timeouts: list
+        timeouts applied to the backend, in order
+    line_settings: list of tuple
+        (name, value) of the line settings applied to the backend, in order
+    """
+
+    def __init__(self, address='fake'):
+        super().__init__(address)
+        self.commands = []
+        self.timeouts = []
+        self.line_settings = []
+        self._pending = b''
+        self._lock = threading.Lock()
+
+    def replies(self, command: str) -> list:
+        """ Reply lines of the device to a command"""
+        return []
+
+    def _apply_timeout(self, timeout):
+        self.timeouts.append(timeout)
+
+    def _apply_line(self, name, value):
+        self.line_settings.append((name, value))
+
+    def _send(self, data: bytes):
+        for command in data.decode().split(self.write_termination):
+            if command != '':
+                self.commands.append(command)
+                replies = self.replies(command)
+                with self._lock:
+                    self._pending += b''.join([(reply + self.read_termination).encode() for reply in replies])
+
+    def _receive(self) -> bytes:
+        with self._lock:
+            data, self._pending = self._pending, b''
+        if data == b'':
+            time.sleep(0.001)
+        return data
+
+    def close(self):
+        pass
+
+
+class FakeSMC100(FakeSerialDevice):
+    """ Chain of SMC100 controllers: positions, velocities, accelerations and states per address"""
+
+    def __init__(self, address='fake'):
+        super().__init__(address)
+        self.positions = {1: 12.345678, 2: -0.5}
+        self.velocities = {1: 0.5, 2: 2.}
+        self.accelerations = {1: 1.25, 2: 10.}
+        self.states = {1: '33', 2: '28'}
+
+    def replies(self, command: str) -> list:
+        address, mnemonic = int(command[0]), command[1:3]
+        if mnemonic == 'TP':
+            return [f'{address}TP{self.positions[address]}']
+        elif command[1:] == 'VA?':
+            return [f'{address}VA{self.velocities[address]}']
+        elif command[1:] == 'AC?':
+            return [f'{address}AC{self.accelerations[address]}']
+        elif mnemonic == 'TS':
+            return [f'{address}TS0000{self.states[address]}']
+        elif mnemonic == 'PA':
+            self.positions[address] = float(command[3:])
+        return []
+
+
+class FakeDriver:
+    """ Driver run in the worker processes of the driver worker tests"""
+
+    def __init__(self, n_axes=2):
+        self.positions = [float(axis) for axis in range(n_axes)]
+
+    def get_positions(self):
+        return self.positions
+
+    def move_axis(self, axis, position):
+        self.positions[axis] = position
+
+    def slow(self, duration):
+        time.sleep(duration)
+        return 'slow'
+
+    def fast(self):
+        return 'fast'
+
+    def fail(self):
+        raise ValueError('driver error')
+
+
+class FakeAgilis(FakeSerialDevice):
+    """ AG-UC8 controller: channels of two axes with their step counters, step amplitudes and moves lasting
+    1 ms per step. The reply of an absolute measurement (MA) comes after measure_duration s.
+
+    Attributes
+    ----------
+    changes_while_moving: int
+        number of channel changes while an axis was moving
+    absolute_positions: dict
+        (channel, axis): position replied to MA, within 0 and 1000
+    """
+
+    def __init__(self, address='fake', step_time=0.001, measure_duration=0.2):
+        super().__init__(address)
+        self.step_time = step_time
+        self.measure_duration = measure_duration
+        self.absolute_positions = {}
+        self._measurement = None
+        self.channel = 1
+        self.steps = {}
+        self.amplitudes = {}
+        self.move_ends = {}
+        self.changes_while_moving = 0
+
+    def is_moving(self, axis: int, channel: int = None) -> bool:
+        return self.move_ends.get((self.channel if channel is None else channel, axis), 0) > time.perf_counter()
+
+    def replies(self, command: str) -> list:
+        if command == 'VE':
+            return ['AG-UC8 v2.2.1']
+        elif command == 'TE':
+            return ['TE0']
+        elif command == 'PH':
+            return ['PH0']
+        elif command == 'CC?':
+            return [f'CC{self.channel}']
+        elif command.startswith('CC'):
+            if any(self.is_moving(axis) for axis in (1, 2)):
+                self.changes_while_moving += 1
+            self.channel = int(command[2:])
+            return []
+        elif command in ('MR', 'ML', 'RS'):
+            return []
+        axis, mnemonic, argument = int(command[0]), command[1:3], command[3:]
+        key = (self.channel, axis)
+        if mnemonic == 'PR':
+            self.steps[key] = self.steps.get(key, 0) + int(argument)
+            self.move_ends[key] = time.perf_counter() + abs(int(argument)) * self.step_time
+        elif mnemonic == 'ST':
+            self.move_ends.pop(key, None)
+        elif mnemonic == 'TS':
+            return [f'{axis}TS{1 if self.is_moving(axis) else 0}']
+        elif mnemonic == 'TP':
+            return [f'{axis}TP{self.steps.get(key, 0)}']
+        elif mnemonic == 'ZP':
+            self.steps[key] = 0
+        elif mnemonic == 'MA':
+            self._measurement = (time.perf_counter() + self.measure_duration,
+                                 f'{axis}MA{self.absolute_positions.get(key, 500)}')
+        elif mnemonic == 'SU':
+            sign = argument[0]
+            if argument[1:] == '?':
+                return [f'{axis}SU{sign}{self.amplitudes.get(key + (sign,), 16)}']
+            self.amplitudes[key + (sign,)] = int(argument[1:])
+        return []
+
+    def _receive(self) -> bytes:
+        if self._measurement is not None and time.perf_counter() >= self._measurement[0]:
+            with self._lock:
+                self._pending += (self._measurement[1] + self.read_termination).encode()
+            self._measurement = None
+        return super()._receive()
+
+
+class FakeConexAGAP(FakeSerialDevice):
+    """ CONEX-AGAP controller at address 1, with its U and V axes"""
+
+    def __init__(self, address='fake'):
+        super().__init__(address)
+        self.positions = {'U': 0.0125, 'V': -0.00212}
+        self.state = '33'
+
+    def replies(self, command: str) -> list:
+        if command == '1VE':
+            return ['1VE CONEX-AGAP 1.0.2']
+        elif command == '1ID?':
+            return ['1IDCONEX-AGAP_AG-M100N']
+        elif command == '1TS':
+            return [f'1TS0000{self.state}']
+        elif command == '1TE':
+            return ['1TE@']
+        elif command[1:3] == 'TP':
+            return [f'1TP{command[3]}{self.positions[command[3]]}']
+        elif command[1:3] in ('SL', 'SR'):
+            return [f'{command[:4]}{-0.75 if command[1:3] == "SL" else 0.75}']
+        elif command[1:3] == 'PA':
+            self.positions[command[3]] = float(command[4:])
+        elif command[1:3] == 'PR':
+            self.positions[command[3]] += float(command[4:])
+        return []
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.agilis_serial import AgilisSerial
+from fake_devices import FakeAgilis
+
+
+@pytest.fixture
+def agilis():
+    agilis = AgilisSerial()
+    agilis._controller = FakeAgilis()
+    agilis._controller.timeout = 10
+    agilis.get_infos()
+    return agilis
+
+
+def channel_changes(agilis):
+    return [command for command in agilis._controller.commands if command.startswith('CC') and command != 'CC?']
+
+
+def test_channel_selected_once(agilis):
+    agilis.move_rel(1, 10, channel=2)
+    agilis.move_rel(2, 10, channel=2)
+    agilis.get_step_counter(1, channel=2)
+    assert channel_changes(agilis) == ['CC2']
+    assert agilis._controller.commands.count('CC?') == 1
+
+
+def test_move_many_groups_the_channels(agilis):
+    n_changes = agilis.move_many([(2, 1, 10), (1, 1, 10), (2, 2, 5), (1, 2, -10), (3, 1, 0)])
+    agilis.wait_moves_done()
+    assert n_changes == 1
+    assert channel_changes(agilis) == ['CC2']
+    assert agilis._controller.steps == {(1, 1): 10, (1, 2): -10, (2, 1): 10, (2, 2): 5}
+
+
+def test_channel_change_after_the_moves(agilis):
+    agilis.move_rel(1, 100, channel=1)
+    agilis.move_rel(1, 10, channel=2)
+    assert agilis._controller.changes_while_moving == 0
+    assert agilis.get_step_counter(1, channel=2) == 10
+
+
+def test_stop_during_a_step_sequence_on_another_channel(agilis):
+    agilis.move_rel(1, 500, channel=1)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(agilis.run_step_sequence([[10, 10]], channel=2)))
+    thread.start()
+    time.sleep(0.05)  # the sequence waits for the end of the move on channel 1
+    time_start = time.perf_counter()
+    agilis.stop(1, channel=1)
+    assert time.perf_counter() - time_start < 0.2
+    thread.join(2.)
+    assert results == [1]
+    assert agilis._controller.changes_while_moving == 0
+    assert agilis.get_step_counters() == [10, 10]
+
+
+def test_absolute_measurement(agilis):
+    agilis._controller.absolute_positions[(2, 1)] = 420
+    agilis.move_rel(1, 30, channel=2)
+    measurement = agilis.measure_absolute_position(1, channel=2)
+    assert (measurement.value, measurement.steps) == (420, 30)
+    assert agilis.get_absolute_measurement(1, channel=2) is measurement
+    agilis.move_rel(1, -10, channel=2)
+    agilis.wait_moves_done()
+    assert agilis.get_fused_position(1, steps_per_unit=2., channel=2) == 840 - 10
+    assert agilis.get_fused_position(2, steps_per_unit=2., channel=2) is None
+
+
+def test_stop_during_an_absolute_measurement(agilis):
+    future = agilis.start_absolute_measurement(1, channel=1)
+    time.sleep(0.05)
+    time_start = time.perf_counter()
+    agilis.stop(1)
+    assert time.perf_counter() - time_start < 0.1
+    assert future.result(2.).value == 500
+    agilis.close()
+
+
+def test_commands_wait_for_the_end_of_a_measurement(agilis):
+    time_start = time.perf_counter()
+    future = agilis.start_absolute_measurement(1, channel=1)
+    time.sleep(0.05)
+    agilis.move_rel(2, 10)
+    assert time.perf_counter() - time_start >= agilis._controller.measure_duration
+    assert future.result(2.).value == 500
+    agilis.close()
+
+
+def test_move_coarse_fine(agilis):
+    n_coarse, n_fine = agilis.move_coarse_fine(1, 1000, coarse_amplitude=50, fine_amplitude=5, step_ratio=10.,
+                                               channel=2)
+    agilis.wait_moves_done()
+    assert (n_coarse, n_fine) == (90, 100)
+    commands = [command for command in agilis._controller.commands if command[1:3] in ('SU', 'PR')]
+    assert commands == ['1SU+50', '1SU-50', '1PR90', '1SU+5', '1SU-5', '1PR100']
+    assert agilis.get_step_counter(1, channel=2) == 190
+    assert agilis.get_step_displacement(1, channel=2) == 1000
+    assert agilis.move_coarse_fine(1, -50, 50, 5, 10., channel=2) == (0, -50)  # within the fine approach
+    assert agilis._controller.commands[-1] == '1PR-50'
+    agilis.counter_to_zero(1, channel=2)
+    assert agilis.get_step_displacement(1, channel=2) == 0
+
+
+def test_step_amplitudes(agilis):
+    assert agilis.get_step_amplitude(1, positive=False, channel=1) == 16
+    agilis.set_step_amplitude(1, 20, channel=1)
+    agilis.set_step_amplitude(1, 20, channel=1)  # unchanged, not sent again
+    assert [command for command in agilis._controller.commands if command.startswith('1SU')] == \
+           ['1SU-?', '1SU+20', '1SU-20']
+    assert agilis.get_step_amplitude(1, channel=1) == 20
+    with pytest.raises(ValueError):
+        agilis.set_step_amplitude(1, 60)
+
+
+def test_step_sequence(agilis):
+    counters = []
+    raster = [[20, 0], [0, 10], [-20, 0], [0, 10]]
+    n_points = agilis.run_step_sequence(raster, channel=2,
+                                        callback=lambda index, steps: counters.append((index, steps)))
+    assert n_points == 4
+    assert counters == [(0, [20, 0]), (1, [20, 10]), (2, [0, 10]), (3, [0, 20])]
+    # the counters are not read between the points
+    assert not any(command.endswith('TP') for command in agilis._controller.commands)
+    assert agilis.get_step_counters() == [0, 20]
+
+
+def test_step_sequence_moves_started_together(agilis):
+    agilis.run_step_sequence([[30, -10]])
+    commands = [command for command in agilis._controller.commands if command[1:3] in ('PR', 'TS')]
+    assert commands[:2] == ['1PR30', '2PR-10']
+
+
+def test_step_sequence_interrupted(agilis):
+    n_points = agilis.run_step_sequence([[5, 5]] * 10, callback=lambda index, steps: index < 2)
+    assert n_points == 3
+    assert agilis.get_step_counters() == [15, 15]
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+from pymodaq_plugins_newport.hardware.command_scheduler import CommandScheduler, Priority, get_scheduler
+
+
+def wait_pending(scheduler, n_pending, timeout=2.):
+    time_start = time.perf_counter()
+    while scheduler.pending < n_pending:
+        assert time.perf_counter() - time_start < timeout
+        time.sleep(0.001)
+
+
+def test_priority_order():
+    scheduler = CommandScheduler('test')
+    order = []
+
+    def transaction(name, priority):
+        with scheduler.slot(priority):
+            order.append(name)
+
+    threads = []
+    with scheduler.slot(Priority.COMMAND):
+        for index, (name, priority) in enumerate([('poll1', Priority.POLL), ('command', Priority.COMMAND),
+                                                  ('poll2', Priority.POLL), ('stop', Priority.STOP)]):
+            thread = threading.Thread(target=transaction, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            wait_pending(scheduler, index + 1)
+    for thread in threads:
+        thread.join(2.)
+    assert order == ['stop', 'command', 'poll1', 'poll2']
+    assert scheduler.pending == 0
+
+
+def test_reentrant_slot():
+    scheduler = CommandScheduler('test')
+    with scheduler.slot(Priority.COMMAND):
+        with scheduler.slot(Priority.POLL):
+            with scheduler.slot(Priority.STOP):
+                pass
+        acquired = threading.Event()
+
+        def other():
+            with scheduler.slot(Priority.STOP):
+                acquired.set()
+        thread = threading.Thread(target=other)
+        thread.start()
+        wait_pending(scheduler, 1)
+        assert not acquired.is_set()  # still owned by this thread after the nested slots
+    thread.join(2.)
+    assert acquired.is_set()
+
+
+def test_slot_released_on_exception():
+    scheduler = CommandScheduler('test')
+    try:
+        with scheduler.slot():
+            raise ValueError
+    except ValueError:
+        pass
+    acquired = threading.Event()
+
+    def other():
+        with scheduler.slot():
+            acquired.set()
+    thread = threading.Thread(target=other)
+    thread.start()
+    thread.join(2.)
+    assert acquired.is_set()
+
+
+def test_stop_latency():
+    scheduler = CommandScheduler('test')
+    assert scheduler.stop_latency_stats()['count'] == 0
+
+    def stop():
+        with scheduler.stop_slot():
+            pass
+
+    with scheduler.slot(Priority.POLL):
+        thread = threading.Thread(target=stop)
+        thread.start()
+        wait_pending(scheduler, 1)
+        time.sleep(0.02)
+    thread.join(2.)
+    stats = scheduler.stop_latency_stats()
+    assert stats['count'] == 1
+    assert 0.02 <= stats['last'] < 1.
+    assert stats['max'] == stats['last']
+
+
+def test_get_scheduler_shared():
+    assert get_scheduler('COM_test') is get_scheduler('COM_test')
+    assert get_scheduler('COM_test') is not get_scheduler('COM_other')
+
+
+def test_interrupted_wait_removes_the_ticket():
+    scheduler = CommandScheduler('test')
+    release = threading.Event()
+
+    def owner():
+        with scheduler.slot():
+            release.wait(2.)
+    thread = threading.Thread(target=owner)
+    thread.start()
+    while scheduler._owner is None:
+        time.sleep(0.001)
+
+    def interrupted_wait(timeout=None):
+        raise KeyboardInterrupt
+    scheduler._condition.wait = interrupted_wait
+    try:
+        with scheduler.slot(Priority.STOP):
+            pass
+    except KeyboardInterrupt:
+        pass
+    del scheduler._condition.wait
+    assert scheduler.pending == 0
+    release.set()
+    thread.join(2.)
+    acquired = threading.Event()
+
+    def other():
+        with scheduler.slot(Priority.POLL):
+            acquired.set()
+    thread = threading.Thread(target=other)
+    thread.start()
+    thread.join(2.)
+    assert acquired.is_set()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.conex_agap import ConexAGAP, ConexError
+from fake_devices import FakeConexAGAP
+
+
+@pytest.fixture
+def conex():
+    conex = ConexAGAP('tcp')
+    conex._controller = FakeConexAGAP()
+    conex.timeout = 200
+    return conex
+
+
+def test_infos(conex):
+    assert conex.get_controller_infos() == 'CONEX-AGAP 1.0.2'
+    assert conex.get_motor_id() == 'CONEX-AGAP_AG-M100N'
+    assert conex.get_error() == '@'
+
+
+def test_state(conex):
+    assert conex.get_state() == (0, '33')
+    assert not conex.is_moving()
+    conex._controller.state = '28'
+    assert conex.is_moving()
+
+
+def test_positions(conex):
+    assert conex.get_position('V') == -0.00212
+    assert np.all(conex.get_positions() == [0.0125, -0.00212])
+    assert conex._controller.commands[-2:] == ['1TPU', '1TPV']
+    assert conex.get_position_limits('U') == (-0.75, 0.75)
+
+
+def test_position_read_with_the_other_axis(conex):
+    conex.get_positions()
+    n_commands = len(conex._controller.commands)
+    assert conex.get_position('U', max_age=1.) == 0.0125
+    assert len(conex._controller.commands) == n_commands
+    conex.move_axis('REL', 1, 0.01, 'U')  # invalidates the positions read
+    assert conex._controller.commands[-1] == '1PRU0.01'
+    assert conex.get_position('U', max_age=1.) == pytest.approx(0.0225)
+
+
+def test_unexpected_reply(conex):
+    with pytest.raises(ConexError):
+        conex._reply_value('1TPU', '1TPV0.1')
+    with pytest.raises(Exception):
+        conex.move_axis('UNKNOWN', 1, 0.)
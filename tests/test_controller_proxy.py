@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from multiprocessing import AuthenticationError
+
+import pytest
+
+from pymodaq_plugins_newport.hardware import controller_proxy
+from pymodaq_plugins_newport.hardware.controller_proxy import (ControllerProxyServer, ControllerProxyClient,
+                                                              ProxyError, _ProxiedController)
+
+AUTHKEY = b'test authkey'
+
+
+class FakeDriver:
+
+    def __init__(self, read_duration=0.):
+        self.read_duration = read_duration
+        self.position = 0.
+        self.n_reads = 0
+        self.stopped = threading.Event()
+
+    def get_position(self, axis=1):
+        self.n_reads += 1
+        time.sleep(self.read_duration)
+        return self.position
+
+    def move_axis(self, move_type='ABS', axis=1, pos=0.):
+        self.position = pos
+
+    def long_move(self, duration):
+        self.stopped.wait(duration)
+        return self.stopped.is_set()
+
+    def stop_motion(self, axis=1):
+        self.stopped.set()
+
+    def fail(self):
+        raise ValueError('driver error')
+
+
+def test_cached_reads():
+    driver = FakeDriver()
+    controller = _ProxiedController(driver, ['get_position'])
+    assert controller.call('get_position', (1,), {}, 1.) == 0.
+    assert controller.call('get_position', (1,), {}, 1.) == 0.
+    assert driver.n_reads == 1 and controller.n_cached == 1
+    controller.call('get_position', (2,), {}, 1.)  # other arguments
+    assert driver.n_reads == 2
+    controller.call('get_position', (1,), {}, 0.)  # too old
+    assert driver.n_reads == 3
+
+
+def test_commands_invalidate_the_cache():
+    driver = FakeDriver()
+    controller = _ProxiedController(driver, ['get_position'])
+    controller.call('get_position', (1,), {}, 1.)
+    controller.call('move_axis', ('ABS', 1, 2.), {}, 1.)
+    assert controller.call('get_position', (1,), {}, 1.) == 2.
+    assert driver.n_reads == 2
+
+
+def test_coalesced_reads():
+    driver = FakeDriver(read_duration=0.1)
+    controller = _ProxiedController(driver, ['get_position'])
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(controller.call('get_position', (1,), {}, 0.)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(2.)
+    assert results == [0.] * 5
+    assert driver.n_reads == 1 and controller.n_coalesced == 4
+
+
+def test_read_started_before_a_command_is_not_cached():
+    driver = FakeDriver(read_duration=0.1)
+    controller = _ProxiedController(driver, ['get_position'])
+    thread = threading.Thread(target=controller.call, args=('get_position', (1,), {}, 1.))
+    thread.start()
+    time.sleep(0.02)
+    controller.call('stop_motion', (1,), {}, 1.)  # while the read is in progress
+    thread.join(2.)
+    controller.call('get_position', (1,), {}, 1.)
+    assert driver.n_reads == 2
+
+
+def test_stop_bypasses_the_call_in_progress():
+    driver = FakeDriver()
+    controller = _ProxiedController(driver, [])
+    results = []
+    thread = threading.Thread(target=lambda: results.append(controller.call('long_move', (2.,), {}, 0.)))
+    thread.start()
+    time.sleep(0.05)
+    time_start = time.perf_counter()
+    controller.call('stop_motion', (1,), {}, 0.)
+    assert time.perf_counter() - time_start < 0.1
+    thread.join(2.)
+    assert results == [True]
+
+
+def test_private_methods_refused():
+    controller = _ProxiedController(FakeDriver(), [])
+    with pytest.raises(ProxyError):
+        controller.call('__class__', (), {}, 0.)
+
+
+@pytest.fixture
+def server():
+    server = ControllerProxyServer(('127.0.0.1', 0), authkey=AUTHKEY)
+    server.add_controller('COM_test', FakeDriver(), ['get_position'])
+    server.start()
+    yield server
+    server.close()
+
+
+def test_client(server):
+    client = ControllerProxyClient('COM_test', server._listener.address, authkey=AUTHKEY)
+    try:
+        client.move_axis('ABS', 1, 3.)
+        assert client.get_position(1) == 3.
+        assert client.get_position(1) == 3.
+        with pytest.raises(ValueError):
+            client.fail()
+        assert server.stats()['COM_test']['cached'] == 1
+    finally:
+        client.close()
+
+
+def test_unknown_controller(server):
+    client = ControllerProxyClient('COM_unknown', server._listener.address, authkey=AUTHKEY)
+    try:
+        with pytest.raises(ProxyError):
+            client.get_position(1)
+    finally:
+        client.close()
+
+
+def test_wrong_authkey(server):
+    with pytest.raises(AuthenticationError):
+        ControllerProxyClient('COM_test', server._listener.address, authkey=controller_proxy.PUBLIC_AUTHKEY)
+
+
+def test_authkey_from_environment(monkeypatch):
+    monkeypatch.setenv(controller_proxy.PROXY_AUTHKEY_ENV, 'secret')
+    assert controller_proxy.get_authkey() == b'secret'
+
+
+def test_authkey_file(monkeypatch, tmp_path):
+    monkeypatch.delenv(controller_proxy.PROXY_AUTHKEY_ENV, raising=False)
+    authkey_file = tmp_path.joinpath('.pymodaq', 'newport_proxy_authkey')
+    monkeypatch.setattr(controller_proxy, 'PROXY_AUTHKEY_FILE', authkey_file)
+    authkey = controller_proxy.get_authkey()
+    assert len(authkey) == 64 and authkey != controller_proxy.PUBLIC_AUTHKEY
+    assert controller_proxy.get_authkey() == authkey
+    if os.name == 'posix':
+        assert authkey_file.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.driver_worker import DriverWorker, WorkerError, _SharedValues, _HEADER
+from fake_devices import FakeDriver
+
+
+def make_shared(n_values):
+    raw_array = multiprocessing.get_context('spawn').RawArray('d', _HEADER + n_values)
+    return _SharedValues(raw_array)
+
+
+def test_write_read():
+    shared = make_shared(3)
+    assert shared.read()[0] == 0.
+    shared.write(12.5, [1., 2., 3.])
+    timestamp, n_failed, values = shared.read()
+    assert timestamp == 12.5 and n_failed == 0
+    assert np.all(values == [1., 2., 3.])
+    shared.write(13., failed=True)
+    timestamp, n_failed, values = shared.read()
+    assert timestamp == 12.5 and n_failed == 1  # time and values of the last successful poll
+    assert np.all(values == [1., 2., 3.])
+    assert shared.array[0] % 2 == 0
+
+
+def test_consistent_reads_during_writes():
+    n_values = 64
+    shared = make_shared(n_values)
+    done = threading.Event()
+
+    def writer():
+        index = 0
+        while not done.is_set():
+            index += 1
+            shared.write(float(index), np.full(n_values, float(index)))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            timestamp, _, values = shared.read()
+            if timestamp > 0:
+                assert np.all(values == timestamp)  # never a mix of two writes
+    finally:
+        done.set()
+        thread.join(2.)
+
+
+@pytest.fixture
+def worker():
+    worker = DriverWorker(FakeDriver, poll=('get_positions', ()), n_values=2, period=0.01)
+    yield worker
+    worker.close()
+
+
+def test_calls(worker):
+    assert worker.fast() == 'fast'
+    worker.move_axis(1, 5.)
+    assert worker.get_positions() == [0., 5.]
+    with pytest.raises(ValueError):
+        worker.fail()
+
+
+def test_late_reply_dropped(worker):
+    worker.timeout = 0.2
+    with pytest.raises(TimeoutError):
+        worker.slow(0.5)
+    worker.timeout = 5.
+    assert worker.fast() == 'fast'  # not the late reply of slow
+    assert worker.fast() == 'fast'
+
+
+def test_latest(worker):
+    time.sleep(0.2)
+    timestamp, values = worker.latest()
+    assert time.time() - timestamp < 1.
+    assert np.all(values == [0., 1.])
+
+
+def test_fresh_values(worker):
+    time.sleep(0.2)
+    assert np.all(worker.fresh_values() == [0., 1.])
+
+
+def test_stale_values():
+    worker = DriverWorker(FakeDriver, poll=('fail', ()), n_values=2, period=0.01)
+    try:
+        time.sleep(0.2)
+        assert worker.n_failed_polls > 0
+        assert np.all(np.isnan(worker.latest()[1]))
+        with pytest.raises(WorkerError):
+            worker.fresh_values()
+    finally:
+        worker.close()
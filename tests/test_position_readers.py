@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from pymodaq_plugins_newport.hardware.agilis_serial import AgilisSerial
+from pymodaq_plugins_newport.hardware.position_readers import SMC100Reader, AgilisReader
+from pymodaq_plugins_newport.hardware.smc100 import SMC100
+from fake_devices import FakeSMC100, FakeAgilis
+
+
+def test_shared_controller():
+    smc = SMC100('tcp')
+    smc._controller = FakeSMC100()
+    smc.timeout = 200
+    reader = SMC100Reader('COM_test', (1, 2), controller=smc)
+    reader.open()
+    timestamp, positions = reader.read()
+    assert timestamp > 0
+    assert np.all(positions == [12.345678, -0.5])
+    assert reader.labels == ['SMC100 COM_test axis 1', 'SMC100 COM_test axis 2']
+    reader.close()
+    assert reader.controller is smc  # not closed by the reader
+    assert smc.get_position(1) == 12.345678
+
+
+def test_shared_agilis_reads_the_local_counters():
+    agilis = AgilisSerial()
+    agilis._controller = FakeAgilis()
+    agilis._controller.timeout = 10
+    agilis.get_infos()
+    agilis.move_rel(1, 10, channel=2)
+    agilis.move_rel(2, -5, channel=1)
+    agilis.wait_moves_done()
+    n_commands = len(agilis._controller.commands)
+    reader = AgilisReader('COM_test', channel=2, controller=agilis)
+    reader.open()
+    assert np.all(reader.read()[1] == [10, 0])
+    assert len(agilis._controller.commands) == n_commands  # the channel is not changed
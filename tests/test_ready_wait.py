@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.ready_wait import MoveDurationModel, ReadyWaiter
+
+
+def test_fit():
+    model = MoveDurationModel()
+    for steps in [100, 200, 300, 400, 500]:
+        model.record(steps, 0.01 + steps / 1000)
+    assert model.step_rate == pytest.approx(1000.)
+    assert model.overhead == pytest.approx(0.01)
+    assert model.predict(-1000) == pytest.approx(1.01)
+    assert model.n_moves == 5 and model.error > 0
+
+
+def test_fit_of_moves_of_equal_length():
+    model = MoveDurationModel(step_rate=1000., overhead=0.02)
+    for _ in range(3):
+        model.record(100, 0.07)
+    assert model.step_rate == pytest.approx(2000.)
+    assert model.overhead == 0.02
+
+
+def test_upper_bound():
+    model = MoveDurationModel(step_rate=1000., overhead=0.)
+    model.record_upper_bound(100, 0.05)
+    assert model.predict(100) == pytest.approx(0.05)
+    assert model.n_moves == 0  # not a fit sample
+    model.record_upper_bound(100, 0.5)  # longer than the prediction: no information
+    assert model.predict(100) == pytest.approx(0.05)
+    model.record(100, 0.1)
+    assert model.scale == 1.
+
+
+class SimulatedMove:
+
+    def __init__(self, duration):
+        self.time_start = time.perf_counter()
+        self.duration = duration
+        self.n_polls = 0
+
+    def is_ready(self):
+        self.n_polls += 1
+        return time.perf_counter() - self.time_start >= self.duration
+
+
+def test_wait_polls_near_the_predicted_end():
+    waiter = ReadyWaiter()
+    for _ in range(4):
+        move = SimulatedMove(0.02 + 50 / 750)
+        duration = waiter.wait('axis', 50, move.time_start, move.is_ready, timeout=1.)
+        assert duration >= move.duration
+        assert move.n_polls <= 5
+    assert waiter.stats()['axis']['n_moves'] >= 1
+
+
+def test_unknown_steps():
+    waiter = ReadyWaiter()
+    move = SimulatedMove(0.)
+    waiter.wait('axis', None, move.time_start, move.is_ready, timeout=1.)
+    assert move.n_polls == 1
+    assert waiter.stats() == {}
+
+
+def test_timeout():
+    waiter = ReadyWaiter(max_poll=0.01)
+    move = SimulatedMove(10.)
+    with pytest.raises(TimeoutError):
+        waiter.wait('axis', 10, move.time_start, move.is_ready, timeout=0.1)
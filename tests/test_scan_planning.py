@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.scan_planning import (AxisLimits, METHODS, path_time, serpentine_order,
+                                                   nearest_neighbour_order, two_opt, plan_scan, transition_times,
+                                                   xps_axis_limits)
+
+
+def test_move_time():
+    limits = AxisLimits(velocity=2., acceleration=4.)  # the velocity is reached after 1 unit of travel
+    assert np.allclose(limits.move_time([0., 0.25, -0.25, 1., 3.]), [0., 0.5, 0.5, 1., 2.])
+    assert np.allclose(AxisLimits(2., overhead=0.1).move_time([0., 1.]), [0., 0.6])
+
+
+def test_axes_move_concurrently():
+    limits = [AxisLimits(1.), AxisLimits(10.)]
+    assert np.allclose(transition_times(np.array([0., 0.]), np.array([[1., 20.], [2., 0.]]), limits), [2., 2.])
+    assert path_time([[1., 20.], [2., 0.]], limits, start=[0., 0.]) == pytest.approx(4.)
+    assert path_time([[1., 20.]], limits) == 0.
+
+
+def test_serpentine_order():
+    x, y = np.meshgrid(np.arange(3), np.arange(3), indexing='ij')
+    grid = np.stack((x.ravel(), y.ravel()), axis=1).astype(float)
+    shuffled = grid[np.random.default_rng(0).permutation(len(grid))]
+    points = shuffled[serpentine_order(shuffled)]
+    assert np.all(points[:, 0] == [0, 0, 0, 1, 1, 1, 2, 2, 2])
+    assert np.all(points[:, 1] == [0, 1, 2, 2, 1, 0, 0, 1, 2])
+
+
+def test_nearest_neighbour_order():
+    points = np.array([[0.], [10.], [1.], [11.], [2.]])
+    limits = [AxisLimits(1.)]
+    assert list(nearest_neighbour_order(points, limits)) == [0, 2, 4, 1, 3]
+    assert nearest_neighbour_order(points, limits, start=[12.])[0] == 3
+    assert len(nearest_neighbour_order(np.zeros((0, 1)), limits)) == 0
+
+
+def test_two_opt_improves_the_path():
+    points = np.array([[0.], [3.], [2.], [1.], [4.]])
+    limits = [AxisLimits(1.)]
+    order = two_opt(points, limits, np.arange(len(points)))
+    assert sorted(order) == list(range(len(points)))
+    assert path_time(points[order], limits) == pytest.approx(4.)
+
+
+def test_plan_scan():
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0, 10, (60, 2))
+    limits = [AxisLimits(5., 20., overhead=0.01), AxisLimits(2., 5.)]
+    plans = {method: plan_scan(points, limits, method, start=[0., 0.]) for method in METHODS}
+    assert plans['none'].total_time == pytest.approx(plans['none'].initial_time)
+    assert plans['two_opt'].total_time <= plans['nearest_neighbour'].total_time < plans['none'].total_time
+    for plan in plans.values():
+        assert sorted(plan.order) == list(range(len(points)))
+        assert np.all(plan.points == points[plan.order])
+
+
+def test_plan_scan_errors():
+    with pytest.raises(ValueError):
+        plan_scan(np.zeros((3, 2)), [AxisLimits(1.)])
+    with pytest.raises(ValueError):
+        plan_scan(np.zeros((3, 1)), [AxisLimits(1.)], method='unknown')
+
+
+def test_xps_axis_limits():
+    class FakeXPS:
+        def __init__(self, ret):
+            self.ret = ret
+
+        def PositionerMaximumVelocityAndAccelerationGet(self, socket_id, positioner):
+            return self.ret
+
+    limits = xps_axis_limits(FakeXPS([0, 20., 80.]), 1, 'Group1.Pos', overhead=0.05)
+    assert (limits.velocity, limits.acceleration, limits.overhead) == (20., 80., 0.05)
+    with pytest.raises(IOError):
+        xps_axis_limits(FakeXPS([-8, '']), 1, 'Group1.Pos')
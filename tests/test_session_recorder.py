@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from pymodaq_plugins_newport.hardware import session_recorder
+from pymodaq_plugins_newport.hardware.session_recorder import ReplaySession, ReplayMismatch
+from pymodaq_plugins_newport.hardware.smc100 import SMC100
+from pymodaq_plugins_newport.hardware.transports import TransportTimeout
+from fake_devices import FakeSMC100
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = tmp_path.joinpath('session.jsonl')
+    smc = SMC100('tcp')
+    smc._controller = FakeSMC100()
+    smc._traffic_name = 'SMC100:COM_test'
+    smc.timeout = 200
+    session_recorder.start_recording(path)
+    try:
+        smc.get_position(1)
+        smc.move_axis('ABS', 2, 1.5)
+        smc.get_positions((1, 2))
+    finally:
+        session_recorder.stop_recording()
+    return path
+
+
+def test_recording(recording):
+    assert not session_recorder.is_recording()
+    events = [json.loads(line) for line in recording.read_text().splitlines()]
+    assert all(event['transport'] == 'SMC100:COM_test' for event in events)
+    assert [event['data'] for event in events if event['dir'] == 'tx'][:2] == ['1TP', '2PA1.5']
+    assert events[1]['dir'] == 'rx' and events[1]['data'].startswith('1TP12.345678')
+    assert all(later['t'] >= earlier['t'] for earlier, later in zip(events[:-1], events[1:]))
+
+
+def test_replay(recording):
+    session = ReplaySession(recording, speed=0)
+    assert session.transports == ['SMC100:COM_test']
+    smc = SMC100('tcp')
+    smc.init_replay(session, 'COM_test')
+    assert smc.get_position(1) == 12.345678
+    smc.move_axis('ABS', 2, 1.5)
+    assert list(smc.get_positions((1, 2))) == [12.345678, 1.5]
+    assert session.remaining('SMC100:COM_test') == 0
+
+
+def test_strict_replay(recording):
+    smc = SMC100('tcp')
+    smc.init_replay(ReplaySession(recording, speed=0, strict=True), 'COM_test')
+    with pytest.raises(ReplayMismatch):
+        smc.get_position(2)
+
+
+def test_replayed_timeouts(tmp_path):
+    path = tmp_path.joinpath('session.jsonl')
+    path.write_text('\n'.join([json.dumps(event) for event in [
+        dict(t=0., transport='Agilis', dir='tx', data='1TS'),
+        dict(t=0.01, transport='Agilis', dir='timeout', data=''),
+        dict(t=0.02, transport='XPS:0', dir='tx', data='GroupPositionCurrentGet(Group1.Pos,double *)'),
+        dict(t=0.03, transport='XPS:0', dir='rx', data='0,1.25,EndOfAPI')]]))
+    session = ReplaySession(path, speed=0)
+    resource = session.resource('Agilis')
+    resource.write('1TS')
+    with pytest.raises(TransportTimeout):
+        resource.read()
+    socket = session.socket('XPS:0')
+    socket.send(b'GroupPositionCurrentGet(Group1.Pos,double *)')
+    assert socket.recv(1024) == b'0,1.25,EndOfAPI'
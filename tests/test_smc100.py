@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.smc100 import SMC100
+from fake_devices import FakeSMC100
+
+
+@pytest.fixture
+def smc():
+    smc = SMC100('tcp')
+    smc._controller = FakeSMC100()
+    smc.timeout = 200
+    return smc
+
+
+def test_get_position(smc):
+    assert smc.get_position(1) == 12.345678
+    assert smc.get_position(2) == -0.5
+
+
+def test_get_velocity_and_acceleration(smc):
+    assert smc.get_velocity(1) == 0.5
+    assert smc.get_velocity(2) == 2.
+    assert smc.get_acceleration(1) == 1.25
+
+
+def test_get_positions(smc):
+    assert np.all(smc.get_positions((1, 2)) == [12.345678, -0.5])
+    assert smc._controller.commands[-2:] == ['1TP', '2TP']
+
+
+def test_state(smc):
+    assert smc.get_state(1) == (0, '33')
+    assert not smc.is_moving(1)
+    assert smc.is_moving(2)
+
+
+def test_move(smc):
+    smc.move_axis('ABS', 1, 3.5)
+    assert smc._controller.commands[-1] == '1PA3.5'
+    assert smc.get_position(1) == 3.5
+    with pytest.raises(Exception):
+        smc.move_axis('UNKNOWN', 1, 0.)
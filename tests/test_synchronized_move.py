@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.synchronized_move import (SynchronizedMove, SynchronizedMoveError,
+                                                                XPSGroupMember)
+
+
+class FakeMember:
+
+    def __init__(self, duration=0., error=None):
+        self.duration = duration
+        self.error = error
+        self.positions = []
+        self.n_stops = 0
+
+    def move(self, position, timeout):
+        time.sleep(self.duration)
+        if self.error is not None:
+            raise self.error
+        self.positions.append(position)
+        return time.perf_counter()
+
+    def stop(self):
+        self.n_stops += 1
+
+    def close(self):
+        pass
+
+
+def test_move_waits_for_the_slowest_member():
+    members = {'fast': FakeMember(0.01), 'slow': FakeMember(0.1)}
+    barrier = SynchronizedMove(members, timeout=2.)
+    time_start = time.perf_counter()
+    timestamp = barrier.move({'fast': 1., 'slow': 2.})
+    assert 0.1 <= time.perf_counter() - time_start < 0.15  # not the sum of the moves
+    assert abs(timestamp - time.time()) < 0.05
+    assert barrier.last_durations['slow'] > barrier.last_durations['fast']
+    assert members['fast'].positions == [1.] and members['slow'].positions == [2.]
+    barrier.close()
+
+
+def test_empty_targets():
+    barrier = SynchronizedMove({'member': FakeMember()})
+    assert abs(barrier.move({}) - time.time()) < 0.05
+    assert barrier.run([{}, {'member': 1.}]) and barrier.members['member'].positions == [1.]
+    barrier.close()
+
+
+def test_failed_move_stops_the_others():
+    members = {'ok': FakeMember(), 'failing': FakeMember(error=ValueError('limit switch'))}
+    barrier = SynchronizedMove(members)
+    with pytest.raises(SynchronizedMoveError, match='limit switch'):
+        barrier.move({'ok': 1., 'failing': 2.})
+    assert members['ok'].n_stops == 1
+    barrier.close()
+
+
+class FakeXPSMoveServer:
+    """ Replies to GroupMoveAbsolute after move_duration s, as the XPS at the end of the motion"""
+
+    def __init__(self, move_duration):
+        self.move_duration = move_duration
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.bind(('127.0.0.1', 0))
+        self._socket.listen()
+        self.port = self._socket.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection):
+        with connection:
+            while True:
+                try:
+                    command = connection.recv(1024).decode()
+                except OSError:
+                    return
+                if command == '':
+                    return
+                if command.startswith('GroupMoveAbsolute'):
+                    time.sleep(self.move_duration)
+                try:
+                    connection.sendall(f'0,{command},EndOfAPI'.encode())
+                except OSError:
+                    return
+
+    def close(self):
+        self._socket.close()
+
+
+def test_xps_member_timeout():
+    server = FakeXPSMoveServer(move_duration=0.3)
+    member = XPSGroupMember('127.0.0.1', 'Group1', server.port, timeout=2.)
+    try:
+        with pytest.raises(TimeoutError):
+            member.move(1., 0.1)
+        server.move_duration = 0.
+        time.sleep(0.3)  # the late reply is sent on the closed socket
+        time_start = time.perf_counter()
+        member.move(2., 1.)
+        assert time.perf_counter() - time_start < 0.1
+    finally:
+        member.close()
+        server.close()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from pymodaq_plugins_newport.hardware.telemetry import (LatencyHistogram, Telemetry, serial_command_key,
+                                                        xps_command_key, SUB_BUCKET_COUNT)
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert histogram.percentile(50) is None
+
+
+@pytest.mark.parametrize('percent', [10, 50, 90, 99])
+def test_percentiles(percent):
+    histogram = LatencyHistogram()
+    latencies = [index * 1e-5 for index in range(1, 10001)]  # 10 µs to 100 ms
+    for latency in latencies:
+        histogram.record(latency)
+    expected = latencies[int(len(latencies) * percent / 100) - 1]
+    # lower bound of the bucket: relative precision of 1 / SUB_BUCKET_COUNT
+    assert expected * (1 - 1 / SUB_BUCKET_COUNT) - 1e-6 <= histogram.percentile(percent) <= expected
+    assert histogram.percentile(100) <= histogram.max == latencies[-1]
+    assert histogram.mean == pytest.approx(sum(latencies) / len(latencies))
+
+
+def test_small_latencies_exact():
+    histogram = LatencyHistogram()
+    for latency_us in range(SUB_BUCKET_COUNT):
+        histogram.record((latency_us + 0.5) * 1e-6)
+    assert histogram.buckets() == [(pytest.approx(latency_us * 1e-6), 1)
+                                   for latency_us in range(SUB_BUCKET_COUNT)]
+    assert histogram.percentile(50) == pytest.approx((SUB_BUCKET_COUNT // 2 - 1) * 1e-6)
+
+
+def test_command_keys():
+    assert serial_command_key('1PA0.5') == 'PA'
+    assert serial_command_key('2ts') == 'TS'
+    assert serial_command_key('?') == '?'
+    assert xps_command_key('GroupPositionCurrentGet(Group1,double *)') == 'GroupPositionCurrentGet'
+
+
+def test_timed():
+    telemetry = Telemetry()
+    with telemetry.timed('COM1', 'TP'):
+        pass
+    with pytest.raises(TimeoutError):
+        with telemetry.timed('COM1', 'TP'):
+            raise TimeoutError
+    with pytest.raises(ValueError):
+        with telemetry.timed('COM1', 'TP'):
+            raise ValueError
+    telemetry.record_retry('COM1', 'TP')
+    stats = telemetry.summary()['COM1']['TP']
+    assert (stats['count'], stats['timeouts'], stats['retries']) == (3, 1, 1)
+    assert telemetry.stats('COM1', 'TP').errors == 1
+    assert 'COM1' in telemetry.report()
+
+
+def test_disabled():
+    telemetry = Telemetry()
+    telemetry.enabled = False
+    telemetry.record('COM1', 'TP', 0.1)
+    assert telemetry.summary() == {}
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from pymodaq_plugins_newport.hardware.telemetry import Telemetry
+from pymodaq_plugins_newport.hardware.transports import TransportTimeout, open_transport
+from fake_devices import FakeSerialDevice
+
+
+class EchoDevice(FakeSerialDevice):
+
+    def replies(self, command: str) -> list:
+        if command == 'silent':
+            return []
+        if command == 'many':
+            return ['line1', 'line2', 'line3']
+        return [command.upper()]
+
+
+@pytest.fixture
+def device():
+    device = EchoDevice()
+    device.configure(data_bits=8, stop_bits=1, parity='none', timeout=200)
+    return device
+
+
+def test_replies_without_termination(device):
+    assert device.query('1tp') == '1TP'
+    device.write('a')
+    device.write('b')
+    assert device.read() == 'A'
+    assert device.read() == 'B'
+
+
+def test_read_ascii_values():
+    class ValuesDevice(FakeSerialDevice):
+        def replies(self, command):
+            return ['1.5,-2,3e-3']
+    device = ValuesDevice()
+    device.timeout = 200
+    device.write('1TP;2TP;3TP')
+    assert device.read_ascii_values() == [1.5, -2., 3e-3]
+
+
+def test_read_timeout(device):
+    device.timeout = 20
+    device.write('silent')
+    with pytest.raises(TransportTimeout):
+        device.read()
+    with pytest.raises(TimeoutError):
+        device.read()
+
+
+def test_read_lines(device):
+    device.write('many')
+    assert device.read_lines(20) == ['line1', 'line2', 'line3']
+    assert device.read_lines(20) == []
+
+
+def test_timeout_applied_on_change_only(device):
+    for _ in range(3):
+        device.write('many')
+        device.read_lines(20)
+    assert device.timeouts == [20]
+    device.query('a')
+    device.query('b')
+    assert device.timeouts == [20, 200]
+
+
+def test_initial_line_settings_applied():
+    device = EchoDevice()
+    device.configure(baud_rate=9600, data_bits=8, stop_bits=1, parity='none')
+    assert device.line_settings == [('baud_rate', 9600), ('data_bits', 8), ('stop_bits', 1), ('parity', 'none')]
+    device.configure(baud_rate=9600, data_bits=7)
+    assert device.line_settings[4:] == [('data_bits', 7)]
+    device.baud_rate = 57600
+    assert device.baud_rate == 57600 and device.line_settings[-1] == ('baud_rate', 57600)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        open_transport('COM1', 'unknown')
+
+
+def test_timeouts_counted_by_telemetry(device):
+    telemetry = Telemetry()
+    device.timeout = 20
+    device.write('silent')
+    with pytest.raises(TransportTimeout):
+        with telemetry.timed('fake', 'silent'):
+            device.read()
+    assert telemetry.stats('fake', 'silent').timeouts == 1
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import logging
+import socket
+
+import pytest
+
+from pymodaq_plugins_newport.hardware.XPS_Q8_drivers import API_SIGNATURES, XPS, APISpec, getAPISpec, parseValue
+
+
+def test_all_signatures_compile():
+    for name in API_SIGNATURES:
+        spec = getAPISpec(name)
+        assert spec.name == name
+        assert getAPISpec(name) is spec
+
+
+def test_command_fixed_outputs():
+    spec = getAPISpec('GroupPositionCurrentGet')
+    values = spec.bind(('Group1.Pos', 1), {})
+    assert spec.command(values) == 'GroupPositionCurrentGet(Group1.Pos,double *)'
+    assert spec.nbOutputs(values) == 1
+
+
+def test_command_list_block():
+    spec = getAPISpec('GroupMoveAbsolute')
+    values = spec.bind(('Group1', [1.5, -2]), {})
+    assert spec.command(values) == 'GroupMoveAbsolute(Group1,1.5,-2)'
+    assert spec.nbOutputs(values) == 0
+
+
+def test_command_counted_block():
+    spec = getAPISpec('GroupPositionCurrentGet')
+    values = spec.bind(('Group1',), dict(nbElement=3))
+    assert spec.command(values) == 'GroupPositionCurrentGet(Group1,double *,double *,double *)'
+    assert spec.nbOutputs(values) == 3
+
+
+def test_bind_errors():
+    spec = getAPISpec('GroupMoveAbsolute')
+    with pytest.raises(TypeError):
+        spec.bind(('Group1', [1.], 'extra'), {})
+    with pytest.raises(TypeError):
+        spec.bind(('Group1',), {})
+    with pytest.raises(TypeError):
+        spec.bind(('Group1', [1.]), dict(unknown=1))
+
+
+def test_parse_values():
+    spec = getAPISpec('GroupPositionCurrentGet')
+    assert spec.parse(0, '1.5,-2', 2) == [0, 1.5, -2]
+    assert spec.parse(-17, '', 2) == [-17, '']
+
+
+def test_parse_wrong_number_of_values():
+    spec = getAPISpec('GroupPositionCurrentGet')
+    assert spec.parse(0, '1.5', 2) == [-1, '1.5']
+    assert spec.parse(0, '1.5,2,3', 2) == [-1, '1.5,2,3']
+
+
+def test_parse_strings():
+    spec = getAPISpec('ErrorStringGet')
+    assert not spec.parsed
+    assert spec.parse(0, 'Error, with a comma', 1) == [0, 'Error, with a comma']
+    spec = APISpec('Test', 'PositionerName,double *,char *')
+    assert spec.parse(0, '0.1,Enable', 2) == [0, 0.1, 'Enable']
+
+
+def test_parse_value():
+    assert parseValue('3') == 3 and isinstance(parseValue('3'), int)
+    assert parseValue('1e-3') == 1e-3
+    assert parseValue('GPIO2.ADC1') == 'GPIO2.ADC1'
+
+
+def test_api_methods():
+    xps = XPS()
+    assert 'GroupMoveAbsolute' in dir(xps)
+    method = xps.GroupMoveAbsolute
+    assert method.__name__ == 'GroupMoveAbsolute'
+    assert 'GroupMoveAbsolute(socketId, GroupName, TargetPosition)' in method.__doc__
+    with pytest.raises(AttributeError):
+        xps.NotAnAPI
+
+
+def test_socket_error_logged(caplog):
+    xps = XPS()
+    connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    connection.close()
+    xps._XPS__sockets[99] = connection
+    xps._XPS__usedSockets[99] = 1
+    try:
+        with caplog.at_level(logging.WARNING):
+            assert xps.GroupMoveAbort(99, 'Group1') == [-2, '']
+        assert 'Socket error on the XPS socket 99' in caplog.text
+    finally:
+        del xps._XPS__sockets[99]
+        del xps._XPS__usedSockets[99]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from pymodaq_plugins_newport.hardware.xps_async import AsyncXPS, END_OF_API
+
+
+class FakeXPSServer:
+    """ Replies '0,<command>' to each command, 'Big()' gets a reply of 4 kB"""
+
+    def __init__(self):
+        self.server = None
+        self.port = 0
+        self.writers = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+    async def handle(self, reader, writer):
+        self.writers.append(writer)
+        while True:
+            data = await reader.read(1024)
+            if data == b'':
+                break
+            command = data.decode()
+            reply = 'x' * 4096 if command == 'Big()' else command
+            writer.write(f'0,{reply}'.encode() + END_OF_API)
+            await writer.drain()
+
+
+def test_reply_beyond_the_read_limit():
+    async def run():
+        server = FakeXPSServer()
+        await server.start()
+        xps = AsyncXPS('127.0.0.1', server.port, nb_sockets=1, timeout=2.)
+        xps.read_limit = 1024
+        async with xps:
+            assert await xps.send_and_receive('Big()') == [-2, '']
+            # the socket was reopened, the rest of the long reply is not read as the next reply
+            assert await xps.send_and_receive('Small()') == [0, 'Small()']
+        await server.stop()
+    asyncio.run(run())
+
+
+def test_reconnection_after_a_failed_reopening():
+    async def run():
+        server = FakeXPSServer()
+        await server.start()
+        xps = AsyncXPS('127.0.0.1', server.port, nb_sockets=1, timeout=2.)
+        async with xps:
+            assert await xps.send_and_receive('A()') == [0, 'A()']
+            await server.stop()
+            assert await xps.send_and_receive('B()') == [-2, '']
+            assert await xps.send_and_receive('C()') == [-2, '']  # closed connection, not written to
+            await server.start()
+            assert await xps.send_and_receive('D()') == [0, 'D()']
+        await server.stop()
+    asyncio.run(run())
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from pymodaq_plugins_newport.hardware.xps_sgamma_tuning import SGammaTuner
+
+
+class FakeSGammaXPS:
+    """ Positioner whose settling time decreases with the velocity, and the following error increases with it"""
+
+    def __init__(self):
+        self.parameters = [10., 40., 0.02, 0.05]
+        self.position = 0.
+        self.n_moves = 0
+
+    def PositionerSGammaParametersGet(self, socket_id, positioner):
+        return [0] + self.parameters
+
+    def PositionerSGammaParametersSet(self, socket_id, positioner, *parameters):
+        self.parameters = list(parameters)
+        return [0, '']
+
+    def PositionerMaximumVelocityAndAccelerationGet(self, socket_id, positioner):
+        return [0, 40., 160.]
+
+    def GroupMoveRelative(self, socket_id, positioner, displacements):
+        self.position += displacements[0]
+        self.n_moves += 1
+        return [0, '']
+
+    def PositionerSGammaPreviousMotionTimesGet(self, socket_id, positioner):
+        return [0, 0.1, 1 / self.parameters[0]]
+
+    def GatheringReset(self, socket_id):
+        return [0, '']
+
+    def GatheringConfigurationSet(self, socket_id, types):
+        return [0, '']
+
+    def GatheringRun(self, socket_id, n_points, divisor):
+        return [0, '']
+
+    def GatheringCurrentNumberGet(self, socket_id):
+        return [0, 1, 100000]
+
+    def GatheringDataMultipleLinesGet(self, socket_id, start, n_lines):
+        return [0, f'{self.parameters[0] * 1e-4}\n']
+
+    def GatheringStop(self, socket_id):
+        return [0, '']
+
+
+def test_measure_ends_at_the_start_position():
+    xps = FakeSGammaXPS()
+    tuner = SGammaTuner(xps, 1, 'Group1.Pos', following_error_tolerance=0.003)
+    result = tuner.measure(tuner.get_parameters(), 0.1, n_moves=5)
+    assert xps.n_moves == 6
+    assert abs(xps.position) < 1e-12
+    assert abs(result['settling_time'] - 0.1) < 1e-12 and result['valid']
+
+
+def test_tune_within_the_tolerance():
+    xps = FakeSGammaXPS()
+    tuner = SGammaTuner(xps, 1, 'Group1.Pos', following_error_tolerance=0.003)
+    best = tuner.tune(0.1, n_moves=3)
+    assert best['parameters']['velocity'] == 30.  # faster ones exceed the tolerance
+    assert best['peak_following_error'] <= 0.003
+    assert xps.parameters[0] == 30.
+    assert abs(xps.position) < 1e-12
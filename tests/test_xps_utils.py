@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pymodaq_plugins_newport.hardware.xps_utils import (XPSError, check_xps_error, parse_gathering_lines,
+                                                        GatheringStream)
+
+
+class FakeGatheringXPS:
+    """ Gathering of the XPS API, the lines being gathered by calling gather"""
+
+    def __init__(self):
+        self.types = []
+        self.n_points = 0
+        self.divisor = None
+        self.lines = []
+        self.n_runs = 0
+
+    def gather(self, n_lines):
+        for _ in range(n_lines):
+            if len(self.lines) < self.n_points:
+                index = len(self.lines)
+                self.lines.append([index + 0.5 * column for column in range(len(self.types))])
+
+    def GatheringReset(self, socket_id):
+        self.lines = []
+        return [0, '']
+
+    def GatheringConfigurationSet(self, socket_id, types):
+        self.types = types
+        return [0, '']
+
+    def GatheringRun(self, socket_id, n_points, divisor):
+        self.n_points = n_points
+        self.divisor = divisor
+        self.n_runs += 1
+        return [0, '']
+
+    def GatheringCurrentNumberGet(self, socket_id):
+        return [0, len(self.lines), 100000]
+
+    def GatheringDataMultipleLinesGet(self, socket_id, start, n_lines):
+        lines = self.lines[start:start + n_lines]
+        return [0, '\n'.join([';'.join([str(value) for value in line]) for line in lines])]
+
+    def GatheringStop(self, socket_id):
+        return [0, '']
+
+
+def test_check_xps_error():
+    assert check_xps_error([0, 1.5, 2], 'Test') == [1.5, 2]
+    with pytest.raises(XPSError) as error:
+        check_xps_error([-17, ''], 'Test')
+    assert error.value.error_code == -17 and error.value.api_name == 'Test'
+    with pytest.raises(XPSError):
+        check_xps_error(None, 'Test')
+
+
+def test_parse_gathering_lines():
+    data = parse_gathering_lines('1;2;\n3;4;\n\n')
+    assert data.shape == (2, 2)
+    assert np.all(data == [[1, 2], [3, 4]])
+
+
+def test_gathering_stream():
+    xps = FakeGatheringXPS()
+    stream = GatheringStream(xps, 1)
+    stream.start(['Group1.Pos.CurrentPosition', 'GPIO2.ADC1'], 1200, divisor=4)
+    assert xps.divisor == 4
+    assert stream.read_new().shape == (0, 2)
+    xps.gather(700)  # more than a chunk of GatheringDataMultipleLinesGet
+    data = stream.read_new()
+    assert data.shape == (700, 2)
+    assert np.all(data[:, 0] == np.arange(700))
+    xps.gather(600)
+    data = stream.read_new()
+    assert data.shape == (500, 2)
+    assert data[0, 0] == 700
+    assert stream.is_full
+
+
+def test_gathering_restart_keeps_the_divisor():
+    xps = FakeGatheringXPS()
+    stream = GatheringStream(xps, 1)
+    stream.start(['Group1.Pos.CurrentPosition'], 10, divisor=8)
+    stream.start(stream.gathering_types, stream.n_points, stream.divisor)
+    assert xps.n_runs == 2 and xps.divisor == 8